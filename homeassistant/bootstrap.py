@@ -70,6 +70,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .core_config import async_process_ha_core_config
 from .exceptions import HomeAssistantError
@@ -92,7 +93,7 @@ from .helpers import (
     trigger,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .loader import Integration
@@ -145,6 +146,11 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# The import and setup times of each integration are stored after startup
+# so they can be compared between versions.
+STARTUP_TIMINGS_STORAGE_KEY = "core.startup_timings"
+STARTUP_TIMINGS_STORAGE_VERSION = 1
+
 # Core integrations are unconditionally loaded
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
 
@@ -451,6 +457,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -831,6 +838,16 @@ async def _async_resolve_domains_and_preload(
         eager_start=True,
     )
 
+    # Import the components of all integrations we are going to set up
+    # in parallel so they are ready when we need them. Setting up an
+    # integration waits for the import in progress instead of starting
+    # another one.
+    hass.async_create_background_task(
+        loader.async_prefetch_components(hass, all_integrations_to_setup.values()),
+        "prefetch components",
+        eager_start=True,
+    )
+
     # Preload storage for all integrations we are going to set up
     # so we do not have to wait for it to be loaded when we need it
     # in the setup process.
@@ -951,12 +968,58 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_time = async_get_setup_timings(hass)
+    import_time = loader.async_get_import_timings(hass)
     if _LOGGER.isEnabledFor(logging.DEBUG):
-        setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
+    hass.async_create_background_task(
+        _async_save_startup_timings(hass, import_time, setup_time),
+        "save startup timings",
+        eager_start=True,
+    )
+
+
+async def _async_save_startup_timings(
+    hass: core.HomeAssistant,
+    import_time: dict[str, float],
+    setup_time: dict[str, float],
+) -> None:
+    """Store the import and setup time of each integration.
+
+    The integrations that took the longest are stored first.
+    """
+    timings = {
+        domain: {
+            "import": round(import_time.get(domain, 0), 3),
+            "setup": round(setup_time.get(domain, 0), 3),
+        }
+        for domain in import_time.keys() | setup_time.keys()
+    }
+    store = Store[dict[str, Any]](
+        hass,
+        STARTUP_TIMINGS_STORAGE_VERSION,
+        STARTUP_TIMINGS_STORAGE_KEY,
+        private=True,
+    )
+    await store.async_save(
+        {
+            "version": __version__,
+            "integrations": dict(
+                sorted(
+                    timings.items(),
+                    key=lambda item: item[1]["import"] + item[1]["setup"],
+                    reverse=True,
+                )
+            ),
+        }
+    )
 
 
 class _WatchPendingSetups:
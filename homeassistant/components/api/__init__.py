@@ -2,8 +2,10 @@
 
 import asyncio
 from asyncio import shield, timeout
+from collections.abc import Iterable
 from functools import lru_cache
 from http import HTTPStatus
+from itertools import batched
 import logging
 from typing import Any
 
@@ -67,6 +69,8 @@ DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
 SERVICE_WAIT_TIMEOUT = 10
+# Number of states written at a time when streaming the states
+NDJSON_STATES_PER_CHUNK = 500
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
@@ -210,20 +214,33 @@ class APIStatesView(HomeAssistantView):
     url = URL_API_STATES
     name = "api:states"
 
-    @ha.callback
-    def get(self, request: web.Request) -> web.Response:
+    async def get(self, request: web.Request) -> web.StreamResponse:
         """Get current states."""
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
+        if ndjson := self.ndjson_requested(request):
+            # Use a snapshot so states changing while the response
+            # is written do not affect it
+            all_states: Iterable[ha.State] = hass.states.async_snapshot().values()
+        else:
+            all_states = hass.states.async_all()
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states = (state.as_dict_json for state in all_states)
         else:
             entity_perm = user.permissions.check_entity
             states = (
                 state.as_dict_json
-                for state in hass.states.async_all()
+                for state in all_states
                 if entity_perm(state.entity_id, "read")
             )
+        if ndjson:
+            return await self.ndjson(
+                request,
+                (
+                    b"\n".join(chunk) + b"\n"
+                    for chunk in batched(states, NDJSON_STATES_PER_CHUNK)
+                ),
+            )
         response = web.Response(
             body=b"".join((b"[", b",".join(states), b"]")),
             content_type=CONTENT_TYPE_JSON,
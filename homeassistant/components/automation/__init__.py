@@ -99,6 +99,9 @@ from .helpers import async_get_blueprints
 from .trace import trace_automation
 
 DATA_COMPONENT: HassKey[EntityComponent[BaseAutomationEntity]] = HassKey(DOMAIN)
+DATA_REFERENCE_INDEX: HassKey[dict[str, dict[str, list[str]]]] = HassKey(
+    f"{DOMAIN}_reference_index"
+)
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 
@@ -140,11 +143,24 @@ def _automations_with_x(
     if DATA_COMPONENT not in hass.data:
         return []
 
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return list(_async_reference_index(hass, property_name).get(referenced_id, ()))
+
+
+def _async_reference_index(
+    hass: HomeAssistant, property_name: str
+) -> dict[str, list[str]]:
+    """Return the automations referencing each x.
+
+    The index is built on first use and dropped when an automation is added
+    or removed.
+    """
+    indexes = hass.data.setdefault(DATA_REFERENCE_INDEX, {})
+    if (index := indexes.get(property_name)) is None:
+        index = indexes[property_name] = {}
+        for automation_entity in hass.data[DATA_COMPONENT].entities:
+            for referenced_id in getattr(automation_entity, property_name):
+                index.setdefault(referenced_id, []).append(automation_entity.entity_id)
+    return index
 
 
 def _x_in_automation(
@@ -337,6 +353,16 @@ class BaseAutomationEntity(ToggleEntity, ABC):
             return {CONF_ID: self.unique_id}
         return None
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Drop the reference index when an automation is added."""
+        await super().async_internal_added_to_hass()
+        self.hass.data.pop(DATA_REFERENCE_INDEX, None)
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Drop the reference index when an automation is removed."""
+        await super().async_internal_will_remove_from_hass()
+        self.hass.data.pop(DATA_REFERENCE_INDEX, None)
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
@@ -6,7 +6,7 @@ import asyncio
 import collections
 from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import suppress
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import partial
@@ -140,6 +140,10 @@ _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
 
+# Images queued for each viewer of an MJPEG stream made from still images,
+# older images are dropped for viewers that cannot keep up
+STILL_STREAM_VIEWER_QUEUE_SIZE: Final = 2
+
 CAMERA_SERVICE_SNAPSHOT: VolDictType = {vol.Required(ATTR_FILENAME): cv.template}
 
 CAMERA_SERVICE_PLAY_STREAM: VolDictType = {
@@ -222,6 +226,83 @@ async def _async_get_image(
     raise HomeAssistantError("Unable to get image")
 
 
+@dataclass(slots=True)
+class _CachedCameraImage:
+    """Image fetched from a camera with the images scaled from it."""
+
+    image: Image
+    fetched: float
+    scaled: dict[tuple[int, int], Image] = field(default_factory=dict)
+
+
+class _CameraImageCache:
+    """Share the images of a camera between requests.
+
+    Concurrent requests for the same size wait for a single fetch from the
+    camera. Requests with a size are also answered from an image fetched
+    less than max_age seconds ago, either fetched at that size or scaled
+    from a full size JPEG image. Requests without a size always get a new
+    image, since they are not made by dashboards polling the camera.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._images: dict[tuple[int | None, int | None], _CachedCameraImage] = {}
+        self._fetches: dict[tuple[int | None, int | None], asyncio.Task[Image]] = {}
+
+    async def async_get_image(
+        self,
+        camera: Camera,
+        width: int | None,
+        height: int | None,
+        max_age: float,
+    ) -> Image:
+        """Return a recent image of the camera."""
+        key = (width, height)
+        if width is not None and height is not None:
+            now = time.monotonic()
+            if (cached := self._images.get(key)) and now - cached.fetched < max_age:
+                return cached.image
+            if (
+                (cached := self._images.get((None, None)))
+                and now - cached.fetched < max_age
+                and (
+                    "jpeg" in cached.image.content_type
+                    or "jpg" in cached.image.content_type
+                )
+            ):
+                if (image := cached.scaled.get((width, height))) is None:
+                    image = cached.scaled[(width, height)] = Image(
+                        cached.image.content_type,
+                        scale_jpeg_camera_image(cached.image, width, height),
+                    )
+                return image
+
+        if (task := self._fetches.get(key)) is None:
+            task = self._fetches[key] = camera.hass.async_create_task(
+                self._async_fetch(camera, key, max_age),
+                f"camera image {camera.entity_id}",
+                eager_start=False,
+            )
+        # Requests that are cancelled do not cancel the fetch of the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, camera: Camera, key: tuple[int | None, int | None], max_age: float
+    ) -> Image:
+        """Fetch an image from the camera."""
+        try:
+            image = await _async_get_image(camera, CAMERA_IMAGE_TIMEOUT, *key)
+        finally:
+            del self._fetches[key]
+        now = time.monotonic()
+        for old_key, cached in list(self._images.items()):
+            if now - cached.fetched >= max_age:
+                del self._images[old_key]
+        self._images[key] = _CachedCameraImage(image, now)
+        return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -336,6 +417,93 @@ async def async_get_still_stream(
     return response
 
 
+@dataclass(slots=True)
+class _StillStream:
+    """Images of a camera fetched at an interval for the stream viewers."""
+
+    viewers: set[asyncio.Queue[bytes | None]] = field(default_factory=set)
+    last_image: bytes | None = None
+    task: asyncio.Task[None] | None = None
+
+
+def _queue_image(viewer: asyncio.Queue[bytes | None], image: bytes | None) -> None:
+    """Queue an image for a viewer, dropping the oldest one if it is full."""
+    if viewer.full():
+        viewer.get_nowait()
+    viewer.put_nowait(image)
+
+
+class _CameraStillStreams:
+    """Share the images of a camera between the viewers of its MJPEG streams.
+
+    The viewers of the same interval share one task fetching the images of
+    the camera. Each viewer has a bounded queue of images, so a slow viewer
+    skips images instead of holding back the others. The task is cancelled
+    when the last viewer leaves.
+    """
+
+    def __init__(self, camera: Camera) -> None:
+        """Initialize the streams."""
+        self._camera = camera
+        self._streams: dict[float, _StillStream] = {}
+
+    async def async_get_still_stream(
+        self, request: web.Request, interval: float
+    ) -> web.StreamResponse:
+        """Generate an HTTP MJPEG stream from the shared camera images."""
+        if (stream := self._streams.get(interval)) is None:
+            stream = self._streams[interval] = _StillStream()
+            stream.task = self._camera.hass.async_create_background_task(
+                self._async_fetch_images(stream, interval),
+                f"camera still stream {self._camera.entity_id}",
+            )
+        viewer: asyncio.Queue[bytes | None] = asyncio.Queue(
+            STILL_STREAM_VIEWER_QUEUE_SIZE
+        )
+        if stream.last_image:
+            viewer.put_nowait(stream.last_image)
+        stream.viewers.add(viewer)
+        try:
+            # The viewers are paced by the task fetching the images
+            return await async_get_still_stream(
+                request, viewer.get, self._camera.content_type, 0
+            )
+        finally:
+            stream.viewers.discard(viewer)
+            if not stream.viewers and self._streams.get(interval) is stream:
+                del self._streams[interval]
+                assert stream.task is not None
+                stream.task.cancel()
+
+    async def _async_fetch_images(self, stream: _StillStream, interval: float) -> None:
+        """Fetch the camera images for the viewers of a stream."""
+        image: bytes | None = None
+        try:
+            while True:
+                last_fetch = time.monotonic()
+                image = await self._camera.async_camera_image()
+                if not image:
+                    break
+                stream.last_image = image
+                for viewer in stream.viewers:
+                    _queue_image(viewer, image)
+
+                next_fetch = last_fetch + interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        except Exception:
+            _LOGGER.exception(
+                "Error fetching image of %s for MJPEG stream", self._camera.entity_id
+            )
+        finally:
+            # End the stream of the viewers
+            if self._streams.get(interval) is stream:
+                del self._streams[interval]
+            for viewer in stream.viewers:
+                _queue_image(viewer, None)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the camera component."""
     component = hass.data[DATA_COMPONENT] = EntityComponent[Camera](
@@ -479,6 +647,8 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
+        self._image_cache = _CameraImageCache()
+        self._still_streams = _CameraStillStreams(self)
         self._webrtc_provider: CameraWebRTCProvider | None = None
         self._supports_native_async_webrtc = (
             type(self).async_handle_async_webrtc_offer
@@ -607,10 +777,11 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The viewers of the same interval share the fetched images.
+        """
+        return await self._still_streams.async_get_still_stream(request, interval)
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -850,11 +1021,11 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
+            image = await camera._image_cache.async_get_image(  # noqa: SLF001
                 camera,
-                CAMERA_IMAGE_TIMEOUT,
                 int(width) if width else None,
                 int(height) if height else None,
+                camera.frame_interval,
             )
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError from ex
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Collection, Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
 import logging
@@ -89,6 +89,10 @@ METADATA_FUZZY_MATCH = "hass_fuzzy_match"
 
 ERROR_SENTINEL = object()
 
+# Names that were added or removed since the trie of an EntityNameIndex was
+# built before it is built again
+_NAME_TRIE_MIN_CHANGES = 64
+
 
 def json_load(fp: IO[str]) -> JsonObjectType:
     """Wrap json_loads for get_intents."""
@@ -190,6 +194,128 @@ class IntentCache:
         """Clear the cache."""
         self.cache.clear()
 
+    def invalidate(self, names: Collection[str]) -> None:
+        """Remove the results that may depend on one of the normalized names."""
+        if len(names) > self.capacity:
+            self.clear()
+            return
+
+        # Results are cached from the executor, so iterate over a copy
+        for key, value in list(self.cache.items()):
+            texts = {_normalize_name(key.text)}
+            if value.result is not None:
+                for entity in value.result.entities_list:
+                    texts.add(_normalize_name(entity.text))
+                    if isinstance(entity.value, str):
+                        texts.add(_normalize_name(entity.value))
+            if any(name in text for name in names for text in texts):
+                self.cache.pop(key, None)
+
+
+class EntityNameIndex:
+    """Slot values for the names and aliases of entities, by entity id.
+
+    Names are found in the input text with a trie. The trie is not rebuilt
+    when the names of a few entities change: added names go to a small
+    second trie and removed names are skipped until enough names changed
+    to build the trie again. Tries are replaced and never modified, so they
+    can be searched from the executor while the index is updated.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._values: dict[str, list[tuple[str, TextSlotValue]]] = {}
+        self._live: set[int] = set()
+        self._added: list[tuple[str, TextSlotValue]] = []
+        self._removed = 0
+        self._trie = Trie()
+        self._added_trie = Trie()
+
+    def __len__(self) -> int:
+        """Return the number of entities with names."""
+        return len(self._values)
+
+    def __contains__(self, entity_id: str) -> bool:
+        """Return if an entity has names in the index."""
+        return entity_id in self._values
+
+    def entity_ids(self) -> list[str]:
+        """Return the entities with names in the index."""
+        return list(self._values)
+
+    def values(self) -> list[TextSlotValue]:
+        """Return the slot values of all names."""
+        return [
+            value
+            for entity_values in self._values.values()
+            for _, value in entity_values
+        ]
+
+    def set(self, entity_id: str, values: list[TextSlotValue]) -> set[str]:
+        """Set the names of an entity and return the names that changed."""
+        keyed_values = []
+        for value in values:
+            assert isinstance(value.text_in, TextChunk)
+            keyed_values.append((_normalize_name(value.text_in.text), value))
+
+        old_values = self._values.get(entity_id, [])
+        if [(key, value.value_out, value.context) for key, value in old_values] == [
+            (key, value.value_out, value.context) for key, value in keyed_values
+        ]:
+            return set()
+
+        for _, value in old_values:
+            self._live.discard(id(value))
+        self._removed += len(old_values)
+        if keyed_values:
+            self._values[entity_id] = keyed_values
+        else:
+            self._values.pop(entity_id, None)
+        for keyed_value in keyed_values:
+            self._live.add(id(keyed_value[1]))
+            self._added.append(keyed_value)
+
+        return {key for key, _ in old_values} | {key for key, _ in keyed_values}
+
+    def update_tries(self) -> None:
+        """Make the names set since the last update searchable."""
+        if not self._added and not self._removed:
+            return
+        if len(self._added) + self._removed > max(
+            _NAME_TRIE_MIN_CHANGES, len(self._live) // 4
+        ):
+            trie = Trie()
+            for entity_values in self._values.values():
+                for key, value in entity_values:
+                    trie.insert(key, value)
+            # Searches may briefly find added names twice, but never miss one
+            self._trie = trie
+            self._added_trie = Trie()
+            self._added = []
+            self._removed = 0
+            return
+
+        added_trie = Trie()
+        for key, value in self._added:
+            if id(value) in self._live:
+                added_trie.insert(key, value)
+        self._added_trie = added_trie
+
+    def find(self, text: str) -> list[TextSlotValue]:
+        """Return the slot values of the names in the normalized text."""
+        live = self._live
+        return [
+            result[2]
+            for trie in (self._trie, self._added_trie)
+            for result in trie.find(text)
+            if id(result[2]) in live
+        ]
+
+
+def _normalize_name(text: str) -> str:
+    """Normalize a name or input text for matching names."""
+    return remove_punctuation(text).strip().lower()
+
 
 async def async_setup_default_agent(
     hass: core.HomeAssistant,
@@ -241,11 +367,17 @@ class DefaultAgent(ConversationEntity):
 
         # Slot lists for entities, areas, etc.
         self._slot_lists: dict[str, SlotList] | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._unsub_update_slot_lists: list[Callable[[], None]] | None = None
+
+        # Changes to apply to the slot lists before the next intent matching
+        self._outdated_entity_ids: set[str] = set()
+        self._outdated_exposure = False
+        self._outdated_areas = False
+        self._outdated_floors = False
 
         # Used to filter slot lists before intent matching
-        self._exposed_names_trie: Trie | None = None
-        self._unexposed_names_trie: Trie | None = None
+        self._exposed_names: EntityNameIndex | None = None
+        self._unexposed_names: EntityNameIndex | None = None
 
         # LRU cache to avoid unnecessary intent matching
         self._intent_cache = IntentCache(capacity=128)
@@ -274,30 +406,32 @@ class DefaultAgent(ConversationEntity):
         return not event_data["old_state"] or not event_data["new_state"]
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+    def _listen_update_slot_lists(self) -> None:
+        """Listen for changes that can outdate the slot lists."""
+        assert self._unsub_update_slot_lists is None
 
-        self._unsub_clear_slot_list = [
+        self._unsub_update_slot_lists = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_areas_changed,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_floors_changed,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_entity_names_changed,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_entity_names_changed,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_exposure_changed
+            ),
         ]
 
     async def async_recognize_intent(
@@ -315,12 +449,11 @@ class DefaultAgent(ConversationEntity):
         slot_lists = await self._make_slot_lists()
         intent_context = self._make_intent_context(user_input)
 
-        if self._exposed_names_trie is not None:
+        if self._exposed_names is not None:
             # Filter by input string
-            text = remove_punctuation(user_input.text).strip().lower()
             slot_lists["name"] = TextSlotList(
                 name="name",
-                values=[result[2] for result in self._exposed_names_trie.find(text)],
+                values=self._exposed_names.find(_normalize_name(user_input.text)),
             )
 
         start = time.monotonic()
@@ -806,61 +939,55 @@ class DefaultAgent(ConversationEntity):
 
     def _get_unexposed_entity_names(self, text: str) -> TextSlotList:
         """Get filtered slot list with unexposed entity names in Home Assistant."""
-        if self._unexposed_names_trie is None:
-            # Build trie
-            self._unexposed_names_trie = Trie()
-            for name_tuple in self._get_entity_name_tuples(exposed=False):
-                self._unexposed_names_trie.insert(
-                    name_tuple[0].lower(),
-                    TextSlotValue.from_tuple(name_tuple, allow_template=False),
-                )
-
-        # Build filtered slot list
-        text_lower = text.strip().lower()
+        assert self._unexposed_names is not None
         return TextSlotList(
-            name="name",
-            values=[
-                result[2] for result in self._unexposed_names_trie.find(text_lower)
-            ],
+            name="name", values=self._unexposed_names.find(_normalize_name(text))
         )
 
     def _get_entity_name_tuples(
-        self, exposed: bool
+        self, state: core.State, entity_registry: er.EntityRegistry
     ) -> Iterable[tuple[str, str, dict[str, Any]]]:
-        """Yield (input name, output name, context) tuples for entities."""
-        entity_registry = er.async_get(self.hass)
-
-        for state in self.hass.states.async_all():
-            entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-            if exposed and (not entity_exposed):
-                # Required exposed, entity is not
-                continue
-
-            if (not exposed) and entity_exposed:
-                # Required not exposed, entity is
-                continue
+        """Yield (input name, output name, context) tuples for an entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in _DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in _DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+        if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+            for alias in entity.aliases:
+                alias = alias.strip()
+                if not alias:
+                    continue
 
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
-                for alias in entity.aliases:
-                    alias = alias.strip()
-                    if not alias:
-                        continue
+                yield (alias, alias, context)
 
-                    yield (alias, alias, context)
+        # Default name
+        yield (state.name, state.name, context)
 
-            # Default name
-            yield (state.name, state.name, context)
+    @core.callback
+    def _async_set_entity_names(
+        self, entity_id: str, entity_registry: er.EntityRegistry
+    ) -> set[str]:
+        """Index the names of an entity and return the names that changed."""
+        assert self._exposed_names is not None
+        assert self._unexposed_names is not None
+
+        values: list[TextSlotValue] = []
+        exposed = False
+        if state := self.hass.states.get(entity_id):
+            values = [
+                TextSlotValue.from_tuple(name_tuple, allow_template=False)
+                for name_tuple in self._get_entity_name_tuples(state, entity_registry)
+            ]
+            exposed = async_should_expose(self.hass, DOMAIN, entity_id)
+
+        return self._exposed_names.set(
+            entity_id, values if exposed else []
+        ) | self._unexposed_names.set(entity_id, [] if exposed else values)
 
     def _recognize_strict(
         self,
@@ -1191,40 +1318,36 @@ class DefaultAgent(ConversationEntity):
         )
 
     @callback
-    def _async_clear_slot_list(self, event: Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        # Two subscribers can be scheduled at same time
-        _LOGGER.debug("Clearing slot lists")
-        if self._unsub_clear_slot_list is None:
-            return
-        self._slot_lists = None
-        self._exposed_names_trie = None
-        self._unexposed_names_trie = None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
-
-        # Slot lists have changed, so we must clear the cache
-        self._intent_cache.clear()
+    def _async_entity_names_changed(
+        self,
+        event: Event[er.EventEntityRegistryUpdatedData]
+        | Event[core.EventStateChangedData],
+    ) -> None:
+        """Update the names of an entity before the next intent matching."""
+        self._outdated_entity_ids.add(event.data["entity_id"])
 
-    async def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    @callback
+    def _async_exposure_changed(self) -> None:
+        """Check which entities are exposed before the next intent matching."""
+        self._outdated_exposure = True
 
-        start = time.monotonic()
+    @callback
+    def _async_areas_changed(
+        self, event: Event[ar.EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Update the area names before the next intent matching."""
+        self._outdated_areas = True
 
-        # Gather entity names, keeping track of exposed names.
-        # We try intent recognition with only exposed names first, then all names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        exposed_entity_names = list(self._get_entity_name_tuples(exposed=True))
-        _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
+    @callback
+    def _async_floors_changed(
+        self, event: Event[fr.EventFloorRegistryUpdatedData]
+    ) -> None:
+        """Update the floor names before the next intent matching."""
+        self._outdated_floors = True
 
-        # Expose all areas.
+    @callback
+    def _async_get_area_names(self) -> list[tuple[str, str]]:
+        """Return (input name, output name) tuples for all areas."""
         areas = ar.async_get(self.hass)
         area_names = []
         for area in areas.async_list_areas():
@@ -1239,7 +1362,11 @@ class DefaultAgent(ConversationEntity):
 
                 area_names.append((alias, alias))
 
-        # Expose all floors.
+        return area_names
+
+    @callback
+    def _async_get_floor_names(self) -> list[tuple[str, str]]:
+        """Return (input name, output name) tuples for all floors."""
         floors = fr.async_get(self.hass)
         floor_names = []
         for floor in floors.async_list_floors():
@@ -1254,25 +1381,111 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        # Build trie
-        self._exposed_names_trie = Trie()
-        name_list = TextSlotList.from_tuples(exposed_entity_names, allow_template=False)
-        for name_value in name_list.values:
-            assert isinstance(name_value.text_in, TextChunk)
-            name_text = remove_punctuation(name_value.text_in.text).strip().lower()
-            self._exposed_names_trie.insert(name_text, name_value)
+        return floor_names
+
+    @callback
+    def _async_update_slot_lists(self) -> bool:
+        """Apply the changes since the slot lists were updated.
+
+        Only the names of the changed entities, areas and floors are
+        updated, and only the cached intents that may have matched one of
+        the changed names are dropped. Returns if anything changed.
+        """
+        assert self._slot_lists is not None
+        assert self._exposed_names is not None
+        assert self._unexposed_names is not None
+
+        outdated_entity_ids = self._outdated_entity_ids
+        if self._outdated_exposure:
+            for entity_id in self._exposed_names.entity_ids():
+                if not async_should_expose(self.hass, DOMAIN, entity_id):
+                    outdated_entity_ids.add(entity_id)
+            for entity_id in self._unexposed_names.entity_ids():
+                if async_should_expose(self.hass, DOMAIN, entity_id):
+                    outdated_entity_ids.add(entity_id)
+
+        changed_names: set[str] = set()
+        if outdated_entity_ids:
+            entity_registry = er.async_get(self.hass)
+            for entity_id in outdated_entity_ids:
+                changed_names |= self._async_set_entity_names(
+                    entity_id, entity_registry
+                )
+            self._exposed_names.update_tries()
+            self._unexposed_names.update_tries()
+
+        for list_name, outdated, get_names in (
+            ("area", self._outdated_areas, self._async_get_area_names),
+            ("floor", self._outdated_floors, self._async_get_floor_names),
+        ):
+            if not outdated:
+                continue
+            old_list = self._slot_lists[list_name]
+            assert isinstance(old_list, TextSlotList)
+            new_list = TextSlotList.from_tuples(get_names(), allow_template=False)
+            old_names = {_slot_value_name(value) for value in old_list.values}
+            new_names = {_slot_value_name(value) for value in new_list.values}
+            if old_names != new_names:
+                self._slot_lists[list_name] = new_list
+                changed_names |= old_names ^ new_names
+
+        self._outdated_entity_ids = set()
+        self._outdated_exposure = False
+        self._outdated_areas = False
+        self._outdated_floors = False
+
+        if not changed_names:
+            return False
+
+        _LOGGER.debug("Updating slot lists for changed names: %s", changed_names)
+        self._intent_cache.invalidate(changed_names)
+        return True
+
+    async def _make_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with areas and entity names/aliases."""
+        if self._slot_lists is not None:
+            if (
+                self._outdated_entity_ids
+                or self._outdated_exposure
+                or self._outdated_areas
+                or self._outdated_floors
+            ) and self._async_update_slot_lists():
+                await self._async_reload_fuzzy_matchers()
+            return self._slot_lists
+
+        start = time.monotonic()
+
+        # Gather entity names, keeping track of exposed names.
+        # We try intent recognition with only exposed names first, then all names.
+        #
+        # NOTE: We do not pass entity ids in here because multiple entities may
+        # have the same name. The intent matcher doesn't gather all matching
+        # values for a list, just the first. So we will need to match by name no
+        # matter what.
+        self._exposed_names = EntityNameIndex()
+        self._unexposed_names = EntityNameIndex()
+        entity_registry = er.async_get(self.hass)
+        for state in self.hass.states.async_all():
+            self._async_set_entity_names(state.entity_id, entity_registry)
+        self._exposed_names.update_tries()
+        self._unexposed_names.update_tries()
+        self._outdated_entity_ids = set()
+        self._outdated_exposure = False
+        self._outdated_areas = False
+        self._outdated_floors = False
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": name_list,
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+            "area": TextSlotList.from_tuples(
+                self._async_get_area_names(), allow_template=False
+            ),
+            "floor": TextSlotList.from_tuples(
+                self._async_get_floor_names(), allow_template=False
+            ),
         }
 
-        # Reload fuzzy matchers with new slot lists
-        if self.fuzzy_matching:
-            await self.hass.async_add_executor_job(self._load_fuzzy_matchers)
+        await self._async_reload_fuzzy_matchers()
 
-        self._listen_clear_slot_list()
+        self._listen_update_slot_lists()
 
         _LOGGER.debug(
             "Created slot lists in %.2f seconds",
@@ -1281,6 +1494,21 @@ class DefaultAgent(ConversationEntity):
 
         return self._slot_lists
 
+    async def _async_reload_fuzzy_matchers(self) -> None:
+        """Reload fuzzy matchers with the slot lists of all exposed names."""
+        assert self._slot_lists is not None
+        assert self._exposed_names is not None
+
+        # The name list is replaced by the names in the input text before
+        # each intent matching
+        exposed_names = self._exposed_names.values()
+        _LOGGER.debug("Exposed entities: %s", exposed_names)
+        self._slot_lists["name"] = TextSlotList(name="name", values=exposed_names)
+
+        # Reload fuzzy matchers with new slot lists
+        if self.fuzzy_matching:
+            await self.hass.async_add_executor_job(self._load_fuzzy_matchers)
+
     def _load_fuzzy_matchers(self) -> None:
         """Reload fuzzy matchers for all loaded languages."""
         for lang_intents in self._lang_intents.values():
@@ -1716,6 +1944,12 @@ def _get_match_error_response(
     return ErrorKey.NO_INTENT, {}
 
 
+def _slot_value_name(value: TextSlotValue) -> str:
+    """Return the normalized name of a slot value."""
+    assert isinstance(value.text_in, TextChunk)
+    return _normalize_name(value.text_in.text)
+
+
 def _collect_list_references(expression: Expression, list_names: set[str]) -> None:
     """Collect list reference names recursively."""
     if isinstance(expression, Group):
@@ -360,22 +360,15 @@ class SensorFilter(SensorEntity):
                     history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                history_list.extend(
+                    [
+                        state
+                        for state in await history.async_state_changes_since(
+                            self.hass, self._entity, start
+                        )
+                        if state not in history_list
+                    ]
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 from typing import cast
@@ -17,6 +18,7 @@ from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import HomeAssistant, valid_entity_id
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
@@ -27,6 +29,8 @@ from .helpers import entities_may_have_state_changes_after, has_states_before
 CONF_ORDER = "use_include_order"
 
 _ONE_DAY = timedelta(days=1)
+# Number of entities queried at once when streaming json lines
+NDJSON_ENTITIES_PER_QUERY = 10
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -60,10 +64,15 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
-        """Return history over a period of time."""
+    ) -> web.StreamResponse:
+        """Return history over a period of time.
+
+        If the client accepts newline-delimited JSON, the history of
+        each entity is streamed as a separate line.
+        """
         datetime_ = None
         query = request.query
+        ndjson = self.ndjson_requested(request)
 
         if datetime and (datetime_ := dt_util.parse_datetime(datetime)) is None:
             return self.json_message("Invalid datetime", HTTPStatus.BAD_REQUEST)
@@ -90,7 +99,7 @@ class HistoryPeriodView(HomeAssistantView):
             start_time = now - _ONE_DAY
 
         if start_time > now:
-            return self.json([])
+            return await self._empty_response(request, ndjson)
 
         if end_time_str := query.get("end_time"):
             if end_time := dt_util.parse_datetime(end_time_str):
@@ -119,7 +128,22 @@ class HistoryPeriodView(HomeAssistantView):
                 )
             )
         ):
-            return self.json([])
+            return await self._empty_response(request, ndjson)
+
+        if ndjson:
+            return await self.ndjson(
+                request,
+                self._async_significant_states_ndjson(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                ),
+            )
 
         return cast(
             web.Response,
@@ -136,6 +160,75 @@ class HistoryPeriodView(HomeAssistantView):
             ),
         )
 
+    async def _empty_response(
+        self, request: web.Request, ndjson: bool
+    ) -> web.StreamResponse:
+        """Return an empty history response."""
+        if ndjson:
+            return await self.ndjson(request, ())
+        return self.json([])
+
+    async def _async_significant_states_ndjson(
+        self,
+        hass: HomeAssistant,
+        start_time: dt,
+        end_time: dt,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> AsyncIterator[bytes]:
+        """Yield the json lines of the significant states.
+
+        The entities are queried a few at a time so the first lines are
+        written before the later entities are fetched, and only the states
+        of one batch are held in memory at once.
+        """
+        instance = get_instance(hass)
+        for idx in range(0, len(entity_ids), NDJSON_ENTITIES_PER_QUERY):
+            if chunk := await instance.async_add_executor_job(
+                self._sorted_significant_states_ndjson,
+                hass,
+                start_time,
+                end_time,
+                entity_ids[idx : idx + NDJSON_ENTITIES_PER_QUERY],
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            ):
+                yield chunk
+
+    def _sorted_significant_states_ndjson(
+        self,
+        hass: HomeAssistant,
+        start_time: dt,
+        end_time: dt,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> bytes:
+        """Fetch significant stats from the database as json lines."""
+        with session_scope(hass=hass, read_only=True) as session:
+            states = history.get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        return b"".join(
+            json_bytes(states.pop(entity_id)) + b"\n" for entity_id in list(states)
+        )
+
     def _sorted_significant_states_json(
         self,
         hass: HomeAssistant,
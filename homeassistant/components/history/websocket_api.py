@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -72,22 +72,22 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            history.get_significant_compressed_state_columns(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
+                max_points,
             ),
         )
     )
@@ -103,6 +103,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -172,12 +173,13 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
 
 def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
+    states: Mapping[str, Sequence[dict[str, Any]]],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -205,7 +207,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: dict[str, list[dict[str, Any]]],
+    states: Mapping[str, Sequence[dict[str, Any]]],
 ) -> bytes:
     """Generate a websocket response."""
     return json_bytes(
@@ -225,23 +227,20 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = history.get_significant_compressed_state_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        max_points,
     )
     last_time_ts = 0.0
     for state_list in states.values():
@@ -280,6 +279,7 @@ async def _async_send_historical_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
@@ -295,6 +295,7 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        max_points,
         send_empty,
     )
     if payload:
@@ -409,6 +410,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -448,6 +450,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -473,6 +476,7 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
             True,
         )
         return
@@ -537,6 +541,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        max_points,
         True,
     )
 
@@ -583,5 +588,6 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        max_points,
         send_empty=not last_event_time,
     )
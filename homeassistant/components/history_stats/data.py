@@ -7,8 +7,8 @@ import datetime
 import logging
 import math
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.components.recorder import history
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant
 from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 
@@ -156,8 +156,14 @@ class HistoryStats:
             )
             for pending_event in self._pending_events:
                 if (new_state := pending_event.data["new_state"]) is not None:
+                    # The shared history window already follows the
+                    # state changes, skip the ones it returned
                     if current_period_start_timestamp <= floored_timestamp(
                         new_state.last_changed
+                    ) and (
+                        not self._history_current_period
+                        or self._history_current_period[-1].last_changed
+                        < new_state.last_changed_timestamp
                     ):
                         self._history_current_period.append(
                             HistoryState(
@@ -186,11 +192,12 @@ class HistoryStats:
         """Update history data for the current period from the database."""
         self._query_count += 1
         try:
-            instance = get_instance(self.hass)
-            states = await instance.async_add_executor_job(
-                self._state_changes_during_period,
-                current_period_start_timestamp,
-                current_period_end_timestamp,
+            states = await history.async_state_changes_since(
+                self.hass,
+                self.entity_id,
+                dt_util.utc_from_timestamp(current_period_start_timestamp),
+                end_time=dt_util.utc_from_timestamp(current_period_end_timestamp),
+                no_attributes=True,
             )
         finally:
             self._query_count -= 1
@@ -199,21 +206,6 @@ class HistoryStats:
             for state in states
         ]
 
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
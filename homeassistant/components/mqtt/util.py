@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine
 from functools import lru_cache
+from itertools import chain
 import logging
+from operator import itemgetter
 import os
 from pathlib import Path
 import tempfile
@@ -145,6 +147,120 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A node in the topic trie, representing one topic level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # Maps the value to its insertion sequence number
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie[_T]:
+    """Index of MQTT topic filters, split by topic level.
+
+    Matching a topic walks the trie one level at a time, so the cost
+    depends on the depth of the topic and not on the number of filters.
+    Values are returned in the order they were added.
+    """
+
+    __slots__ = ("_root", "_sequence", "_size")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._sequence = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._size
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        if value in node.values:
+            return
+        self._size += 1
+        self._sequence += 1
+        node.values[value] = self._sequence
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        self._size -= 1
+        # Prune the levels that are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if there are values for exactly this topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        matched: list[dict[_T, int]] = []
+        self._match(self._root, topic.split("/"), 0, not topic.startswith("$"), matched)
+        if not matched:
+            return []
+        if len(matched) == 1:
+            return list(matched[0])
+        return [
+            value
+            for value, _ in sorted(
+                chain.from_iterable(values.items() for values in matched),
+                key=itemgetter(1),
+            )
+        ]
+
+    def _match(
+        self,
+        node: _TopicTrieNode[_T],
+        levels: list[str],
+        idx: int,
+        wildcard_allowed: bool,
+        matched: list[dict[_T, int]],
+    ) -> None:
+        """Collect the values of the nodes matching the topic levels from idx."""
+        children = node.children
+        # Topics starting with $ are not matched by a wildcard at the first level
+        wildcard_allowed = wildcard_allowed or idx > 0
+        if wildcard_allowed and (multi := children.get("#")) and multi.values:
+            # The multi level wildcard also matches the parent level
+            matched.append(multi.values)
+        if idx == len(levels):
+            if node.values:
+                matched.append(node.values)
+            return
+        if (child := children.get(levels[idx])) is not None:
+            self._match(child, levels, idx + 1, wildcard_allowed, matched)
+        if wildcard_allowed and (single := children.get("+")) is not None:
+            self._match(single, levels, idx + 1, wildcard_allowed, matched)
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
@@ -20,13 +20,20 @@ import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
+from .loop_monitor import LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -41,6 +48,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_LOOP_STATS = "log_loop_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -64,6 +72,7 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_LOOP_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -75,6 +84,7 @@ CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+LOOP_MONITOR = "loop_monitor"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -86,6 +96,8 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    loop_monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
+    loop_monitor.async_start()
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -283,6 +295,25 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_log_loop_stats(call: ServiceCall) -> ServiceResponse:
+        """Log the loop lag and the slowest event listeners."""
+        stats = loop_monitor.async_as_dict()
+        loop_lag = stats["loop_lag"]
+        _LOGGER.critical(
+            "Loop lag: %d samples, %.1f ms average, %.1f ms max",
+            loop_lag["count"],
+            loop_lag["total"] / max(loop_lag["count"], 1) * 1000,
+            loop_lag["max"] * 1000,
+        )
+        for slow in stats["slowest"]:
+            _LOGGER.critical(
+                "Slow listener: %s for %s took %.1f ms",
+                slow["listener"],
+                slow["event_type"],
+                slow["duration"] * 1000,
+            )
+        return stats
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -399,6 +430,14 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_LOOP_STATS,
+        _async_log_loop_stats,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     return True
 
 
@@ -408,6 +447,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.data[DOMAIN][LOOP_MONITOR].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
@@ -0,0 +1,172 @@
+"""Monitor the event loop lag and the time event listeners take to run."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import functools
+import heapq
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.util.event_type import EventType
+
+# Upper bounds of the histogram buckets in seconds, the last bucket holds
+# everything slower
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+# Time the listeners of one of every SAMPLE_INTERVAL events
+SAMPLE_INTERVAL = 20
+
+# Seconds between the loop lag measurements
+LAG_INTERVAL = 0.5
+
+SLOWEST_LISTENERS = 20
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Count durations by bucket."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a duration."""
+        self.counts[bisect_left(BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "counts": self.counts,
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+def _job_name(job: HassJob[..., Any]) -> str:
+    """Return the module and name of the function run by a job."""
+    target: Any = job.target
+    while isinstance(target, functools.partial):
+        target = target.func
+    name = getattr(target, "__qualname__", None) or type(target).__qualname__
+    return f"{getattr(target, '__module__', None)}.{name}"
+
+
+class LoopMonitor:
+    """Sample the time event listeners take to run and measure the loop lag.
+
+    The callback listeners of one of every SAMPLE_INTERVAL events are
+    timed and added to a histogram per listener function. The loop lag is the delay
+    of a timer scheduled every LAG_INTERVAL seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._countdown = SAMPLE_INTERVAL
+        self._job_names: dict[HassJob[..., Any], str] = {}
+        self.listeners: dict[str, Histogram] = {}
+        self.slowest: list[tuple[float, str, str]] = []
+        self.loop_lag = Histogram()
+        self._lag_timer: asyncio.TimerHandle | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring."""
+        self._hass.bus.async_set_job_monitor(self)
+        self._unsub_stop = self._hass.bus.async_listen(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+        self._async_schedule_lag_check()
+
+    @callback
+    def _async_handle_stop(self, _: Event) -> None:
+        """Stop monitoring when Home Assistant stops."""
+        self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring."""
+        self._hass.bus.async_set_job_monitor(None)
+        if self._unsub_stop:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._lag_timer:
+            self._lag_timer.cancel()
+            self._lag_timer = None
+
+    @callback
+    def _async_schedule_lag_check(self) -> None:
+        """Schedule the next loop lag measurement."""
+        loop = self._hass.loop
+        self._lag_timer = loop.call_at(
+            loop.time() + LAG_INTERVAL, self._async_check_lag, loop.time()
+        )
+
+    @callback
+    def _async_check_lag(self, scheduled: float) -> None:
+        """Measure how late the timer ran."""
+        self.loop_lag.add(max(self._hass.loop.time() - scheduled - LAG_INTERVAL, 0.0))
+        self._async_schedule_lag_check()
+
+    @callback
+    def async_should_sample(self) -> bool:
+        """Return if the listeners of the event being fired should be timed."""
+        self._countdown -= 1
+        if self._countdown:
+            return False
+        self._countdown = SAMPLE_INTERVAL
+        return True
+
+    @callback
+    def async_record(
+        self,
+        event_type: EventType[Any] | str,
+        job: HassJob[..., Any],
+        duration: float,
+    ) -> None:
+        """Record how long a listener took to run."""
+        if (name := self._job_names.get(job)) is None:
+            if len(self._job_names) > 4096:
+                # Jobs of removed listeners are not reused
+                self._job_names.clear()
+            name = self._job_names[job] = _job_name(job)
+        if (histogram := self.listeners.get(name)) is None:
+            histogram = self.listeners[name] = Histogram()
+        histogram.add(duration)
+        entry = (duration, name, str(event_type))
+        if len(self.slowest) < SLOWEST_LISTENERS:
+            heapq.heappush(self.slowest, entry)
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    @callback
+    def async_as_dict(self) -> dict[str, Any]:
+        """Return the collected statistics."""
+        return {
+            "buckets": BUCKETS,
+            "sample_interval": SAMPLE_INTERVAL,
+            "loop_lag": self.loop_lag.as_dict(),
+            "listeners": {
+                name: histogram.as_dict()
+                for name, histogram in sorted(
+                    self.listeners.items(),
+                    key=lambda item: item[1].total,
+                    reverse=True,
+                )
+            },
+            "slowest": [
+                {"listener": name, "event_type": event_type, "duration": duration}
+                for duration, name, event_type in sorted(self.slowest, reverse=True)
+            ],
+        }
@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache.api import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -167,6 +174,7 @@ class Recorder(threading.Thread):
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        bulk_write: bool,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
     ) -> None:
@@ -186,6 +194,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.bulk_write = bulk_write
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DATA_RECORDER].db_connected
@@ -208,6 +217,11 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States buffered for a bulk insert at the next commit,
+        # only used when bulk write is enabled and supported
+        # by the database engine.
+        self._bulk_write_states = False
+        self._pending_bulk_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -821,6 +835,7 @@ class Recorder(threading.Thread):
             # herd of queries to find the statistics meta data if
             # there are a lot of statistics graphs on the frontend.
             self.statistics_meta_manager.load(session)
+            self.state_attributes_manager.load_cache(session)
 
         migration.migrate_data_live(self, self.get_session, schema_status)
 
@@ -1176,8 +1191,54 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
+        if self._bulk_write_states and states_meta_manager.active:
+            # The state is written with the other buffered states in
+            # _bulk_insert_pending_states instead of by the session flush
+            self._event_session_has_pending_writes = True
+            self._pending_bulk_states.append(dbstate)
+            return
+
         self._add_to_session(session, dbstate)
 
+    def _bulk_insert_pending_states(self, session: Session) -> None:
+        """Insert the buffered states with executemany batches.
+
+        The buffered States objects are never added to the session,
+        they only carry the row values and receive the state_id so
+        the StatesManager can link the old_state_id of the next state.
+        """
+        # Flush the pending StatesMeta and StateAttributes
+        # first so their ids are known.
+        session.flush()
+        remaining = self._pending_bulk_states
+        while remaining:
+            # Each batch holds at most one state per entity so the returned
+            # state_ids can be mapped back by metadata_id. Later states of the
+            # same entity go in the next batch since they link to the
+            # state_id of the previous one.
+            batch: dict[int, States] = {}
+            deferred: list[States] = []
+            for dbstate in remaining:
+                metadata_id = dbstate.metadata_id
+                if metadata_id is None:
+                    assert dbstate.states_meta_rel is not None
+                    metadata_id = dbstate.states_meta_rel.metadata_id
+                if metadata_id in batch:
+                    deferred.append(dbstate)
+                else:
+                    batch[metadata_id] = dbstate
+            result = session.execute(
+                insert(States).returning(States.state_id, States.metadata_id),
+                [
+                    _bulk_state_row(metadata_id, dbstate)
+                    for metadata_id, dbstate in batch.items()
+                ],
+            )
+            for state_id, metadata_id in result:
+                batch[metadata_id].state_id = state_id
+            remaining = deferred
+        self._pending_bulk_states = []
+
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1224,6 +1285,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_bulk_states:
+            self._bulk_insert_pending_states(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1279,6 +1343,7 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_bulk_states = []
 
         if not self.event_session:
             return
@@ -1464,6 +1529,17 @@ class Recorder(threading.Thread):
             self.recorder_runs_manager.start(session)
             self.states_manager.load_from_db(session)
 
+        assert self.engine is not None
+        # Bulk writes need the ids of the inserted rows returned
+        # from an executemany, which not all database engines support.
+        self._bulk_write_states = (
+            self.bulk_write and self.engine.dialect.insert_executemany_returning
+        )
+        if self.bulk_write and not self._bulk_write_states:
+            _LOGGER.warning(
+                "The database engine does not support bulk writes, "
+                "falling back to writing states one by one"
+            )
         self._open_event_session()
 
     def _schedule_compile_missing_statistics(self) -> None:
@@ -1480,6 +1556,7 @@ class Recorder(threading.Thread):
             self.recorder_runs_manager.end(self.event_session)
         try:
             self._commit_event_session_or_retry()
+            self.state_attributes_manager.save_cache()
         except Exception:
             _LOGGER.exception("Error saving the event session during shutdown")
 
@@ -1512,3 +1589,28 @@ class Recorder(threading.Thread):
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+
+
+def _bulk_state_row(metadata_id: int, dbstate: States) -> dict[str, Any]:
+    """Return the row values of a buffered state for a bulk insert."""
+    if (old_state_id := dbstate.old_state_id) is None and (
+        old_state := dbstate.old_state
+    ) is not None:
+        old_state_id = old_state.state_id
+    if (attributes_id := dbstate.attributes_id) is None and (
+        state_attributes := dbstate.state_attributes
+    ) is not None:
+        attributes_id = state_attributes.attributes_id
+    return {
+        "state": dbstate.state,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "last_reported_ts": dbstate.last_reported_ts,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "old_state_id": old_state_id,
+        "attributes_id": attributes_id,
+        "origin_idx": dbstate.origin_idx,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "metadata_id": metadata_id,
+    }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -15,17 +16,21 @@ from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_significant_compressed_state_columns as _modern_get_significant_compressed_state_columns,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
+from .window import async_state_changes_since
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_state_changes_since",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_significant_compressed_state_columns",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -80,6 +85,51 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_significant_compressed_state_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, Sequence[dict[str, Any]]]:
+    """Return significant states during a time period in the compressed format.
+
+    States are not downsampled to max_points before the schema is migrated.
+    """
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # noqa: PLC0415
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        return _legacy_get_significant_states(  # type: ignore[return-value]
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+    return _modern_get_significant_compressed_state_columns(  # type: ignore[return-value]
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        max_points,
+    )
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
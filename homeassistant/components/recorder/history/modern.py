@@ -38,6 +38,7 @@ from ..db_schema import (
 )
 from ..filters import Filters
 from ..models import (
+    CompressedStateColumns,
     LazyState,
     datetime_to_timestamp_or_none,
     extract_metadata_ids,
@@ -236,6 +237,97 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        result := _get_significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_compressed_state_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, CompressedStateColumns]:
+    """Return significant states in the compressed state format as columns.
+
+    This is the same as get_significant_states with compressed_state_format,
+    without creating a dict for every row.
+
+    If max_points is set, the states of each entity are downsampled
+    to about max_points states.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            result := _get_significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}
+        rows, start_time_ts, entity_id_to_metadata_id = result
+        columns = _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+        )
+    if max_points:
+        return {
+            entity_id: entity_columns.downsample(max_points)
+            for entity_id, entity_columns in columns.items()
+        }
+    return columns
+
+
+def _get_significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[list[Row], float | None, dict[str, int | None]] | None:
+    """Return the significant state rows sorted by metadata_id and last_updated.
+
+    The start time timestamp is returned if the start time state is included.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -244,7 +336,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -299,14 +391,10 @@ def get_significant_states_with_session(
             # as this is the common case since its rare that
             # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
             rows = row_chunk
-    return _sorted_states_to_dict(
+    return (
         rows,
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -933,3 +1021,81 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+) -> dict[str, CompressedStateColumns]:
+    """Convert SQL results into compressed state columns.
+
+    This is the same as _sorted_states_to_dict with compressed_state_format,
+    but appends the rows to a CompressedStateColumns per entity.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    # Set all entity IDs to empty columns in result set to maintain the order
+    result: dict[str, CompressedStateColumns] = {
+        entity_id: CompressedStateColumns() for entity_id in entity_ids
+    }
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
+            (metadata_id, iter(states)),
+        )
+    else:
+        states_iter = groupby(states, itemgetter(field_map["metadata_id"]))
+
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        columns = result[entity_id]
+        append_row = columns.append_row
+        if (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        ):
+            for db_state in group:
+                append_row(
+                    db_state,
+                    attr_cache,
+                    start_time_ts,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
+                )
+            continue
+
+        # With minimal response only the first state has attributes,
+        # and duplicate states are filtered out
+        if (first_state := next(group, None)) is None:
+            continue
+        prev_state: str = first_state[state_idx]
+        append_row(
+            first_state,
+            attr_cache,
+            start_time_ts,
+            prev_state,
+            first_state[last_updated_ts_idx],
+            no_attributes,
+        )
+        append = columns.append
+        for row in group:
+            if (state := row[state_idx]) != prev_state:
+                append(state, row[last_updated_ts_idx])
+                prev_state = state
+
+    # Filter out the empty columns if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
@@ -0,0 +1,295 @@
+"""Shared windows of recorded state changes."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import partial
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .. import history
+
+DATA_HISTORY_WINDOWS: HassKey[HistoryWindows] = HassKey("recorder_history_windows")
+
+# Seconds a window is kept after it was last read, so integrations that
+# set up one after the other at startup share the same database query
+WINDOW_LINGER = 60
+
+
+class _HistoryWindow:
+    """Recorded state changes of an entity since a start time."""
+
+    __slots__ = ("load_task", "release_timer", "start_ts", "states", "unsub", "users")
+
+    def __init__(self, start_ts: float) -> None:
+        """Initialize the window."""
+        self.start_ts = start_ts
+        self.states: list[State] = []
+        self.users = 0
+        self.load_task: asyncio.Task[None] | None = None
+        self.release_timer: asyncio.TimerHandle | None = None
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_close(self) -> None:
+        """Stop following the state changes of the entity."""
+        if self.release_timer:
+            self.release_timer.cancel()
+            self.release_timer = None
+        if self.unsub:
+            self.unsub()
+            self.unsub = None
+
+
+class HistoryWindows:
+    """Share the recorded state changes of entities between integrations.
+
+    The state changes of an entity are loaded from the database once, for
+    the earliest start time any reader asked for. The window then follows
+    the state changes of the entity, so later readers with the same or a
+    later start time are answered without a database query. Windows are
+    reference counted and dropped WINDOW_LINGER seconds after the last
+    reader is done.
+
+    Windows are kept per entity with and without attributes. Readers that
+    do not need the attributes also read from a window with attributes
+    that covers their start time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the windows."""
+        self._hass = hass
+        self._windows: dict[tuple[str, bool], _HistoryWindow] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
+
+    async def async_state_changes_since(
+        self,
+        entity_id: str,
+        start_time: datetime,
+        end_time: datetime | None,
+        include_start_time_state: bool,
+        no_attributes: bool,
+    ) -> list[State]:
+        """Return the state changes of an entity between start_time and end_time."""
+        start_ts = start_time.timestamp()
+        key = (entity_id, no_attributes)
+        if (
+            no_attributes
+            and (window := self._windows.get((entity_id, False))) is not None
+            and window.start_ts <= start_ts
+        ):
+            key = (entity_id, False)
+        elif (window := self._windows.get(key)) is None or window.start_ts > start_ts:
+            window = self._async_open(key, start_time)
+        if window.release_timer:
+            window.release_timer.cancel()
+            window.release_timer = None
+        window.users += 1
+        try:
+            assert window.load_task is not None
+            await asyncio.shield(window.load_task)
+        finally:
+            window.users -= 1
+            if not window.users and self._windows.get(key) is window:
+                window.release_timer = self._hass.loop.call_later(
+                    WINDOW_LINGER, self._async_release, key, window
+                )
+        return _states_between(
+            window.states, start_time, end_time, include_start_time_state
+        )
+
+    @callback
+    def _async_open(
+        self, key: tuple[str, bool], start_time: datetime
+    ) -> _HistoryWindow:
+        """Open a window and load the state changes since start_time."""
+        if old_window := self._windows.pop(key, None):
+            old_window.async_close()
+        window = self._windows[key] = _HistoryWindow(start_time.timestamp())
+        entity_id, no_attributes = key
+        instance = get_instance(self._hass)
+        if EVENT_STATE_CHANGED not in instance.exclude_event_types and (
+            instance.entity_filter is None or instance.entity_filter(entity_id)
+        ):
+            # Follow the state changes before querying the database, the
+            # ones that were already recorded are dropped once it is loaded
+            window.unsub = async_track_state_change_event(
+                self._hass,
+                entity_id,
+                partial(
+                    _async_add_event_without_attributes
+                    if no_attributes
+                    else _async_add_event,
+                    window,
+                ),
+            )
+        window.load_task = self._hass.async_create_task(
+            self._async_load(key, window, start_time),
+            f"history window {entity_id}",
+            eager_start=True,
+        )
+        return window
+
+    async def _async_load(
+        self, key: tuple[str, bool], window: _HistoryWindow, start_time: datetime
+    ) -> None:
+        """Load the state changes of the window from the database."""
+        try:
+            states = await get_instance(self._hass).async_add_executor_job(
+                _state_changes_during_period, self._hass, *key, start_time
+            )
+        except BaseException:
+            if self._windows.get(key) is window:
+                del self._windows[key]
+            window.async_close()
+            raise
+        # The window is bisected by time, sorting the already ordered
+        # database result is a single linear pass
+        states.sort(key=lambda state: state.last_changed_timestamp)
+        last_ts = states[-1].last_changed_timestamp if states else window.start_ts
+        states.extend(
+            state for state in window.states if state.last_changed_timestamp > last_ts
+        )
+        window.states = states
+
+    @callback
+    def _async_release(self, key: tuple[str, bool], window: _HistoryWindow) -> None:
+        """Drop a window nobody has read for WINDOW_LINGER seconds."""
+        window.release_timer = None
+        if self._windows.get(key) is window:
+            del self._windows[key]
+        window.async_close()
+
+    @callback
+    def _async_shutdown(self, _: Event) -> None:
+        """Drop all windows."""
+        for window in self._windows.values():
+            window.async_close()
+        self._windows.clear()
+
+
+@callback
+def _async_add_event(
+    window: _HistoryWindow, event: Event[EventStateChangedData]
+) -> None:
+    """Add a state change the recorder will record to the window."""
+    if (
+        new_state := event.data["new_state"]
+    ) is not None and new_state.last_changed_timestamp == (
+        new_state.last_updated_timestamp
+    ):
+        window.states.append(new_state)
+
+
+@callback
+def _async_add_event_without_attributes(
+    window: _HistoryWindow, event: Event[EventStateChangedData]
+) -> None:
+    """Add a state change without its attributes to the window."""
+    if (
+        new_state := event.data["new_state"]
+    ) is not None and new_state.last_changed_timestamp == (
+        new_state.last_updated_timestamp
+    ):
+        window.states.append(
+            State(
+                new_state.entity_id,
+                new_state.state,
+                None,
+                last_changed=new_state.last_changed,
+                last_reported=new_state.last_reported,
+                last_updated=new_state.last_updated,
+                context=new_state.context,
+                validate_entity_id=False,
+            )
+        )
+
+
+def _state_changes_during_period(
+    hass: HomeAssistant, entity_id: str, no_attributes: bool, start_time: datetime
+) -> list[State]:
+    """Return the state changes of an entity since start_time."""
+    return history.state_changes_during_period(
+        hass,
+        start_time,
+        None,
+        entity_id,
+        no_attributes=no_attributes,
+        include_start_time_state=True,
+    ).get(entity_id, [])
+
+
+def _states_between(
+    states: list[State],
+    start_time: datetime,
+    end_time: datetime | None,
+    include_start_time_state: bool,
+) -> list[State]:
+    """Return the state changes after start_time and before end_time.
+
+    If include_start_time_state is set, the state at start_time is
+    prepended with its time moved to start_time, the same as the
+    recorder history queries do.
+    """
+    start_ts = start_time.timestamp()
+    idx = bisect_right(states, start_ts, key=lambda state: state.last_changed_timestamp)
+    end_idx = (
+        len(states)
+        if end_time is None
+        else bisect_left(
+            states, end_time.timestamp(), key=lambda state: state.last_changed_timestamp
+        )
+    )
+    if not include_start_time_state or not idx:
+        return states[idx:end_idx]
+    if (start_state := states[idx - 1]).last_changed_timestamp != start_ts:
+        start_state = State(
+            start_state.entity_id,
+            start_state.state,
+            start_state.attributes,
+            last_changed=start_time,
+            last_reported=start_time,
+            last_updated=start_time,
+            context=start_state.context,
+            validate_entity_id=False,
+        )
+    return [start_state, *states[idx:end_idx]]
+
+
+@singleton(DATA_HISTORY_WINDOWS)
+@callback
+def _async_get_history_windows(hass: HomeAssistant) -> HistoryWindows:
+    """Return the shared history windows."""
+    return HistoryWindows(hass)
+
+
+async def async_state_changes_since(
+    hass: HomeAssistant,
+    entity_id: str,
+    start_time: datetime,
+    include_start_time_state: bool = True,
+    end_time: datetime | None = None,
+    no_attributes: bool = False,
+) -> list[State]:
+    """Return the recorded state changes of an entity since start_time.
+
+    This is the same as state_changes_during_period, except that the
+    state changes are shared with other callers asking for the same entity.
+    """
+    return await _async_get_history_windows(hass).async_state_changes_since(
+        entity_id.lower(), start_time, end_time, include_start_time_state, no_attributes
+    )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, overload
 
 from propcache.api import cached_property
 from sqlalchemy.engine.row import Row
@@ -16,6 +18,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_STATE,
 )
 from homeassistant.core import Context, State
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 
 from .state_attributes import decode_attributes_from_source
@@ -164,3 +167,195 @@ def row_to_compressed_state(
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
     return comp_state
+
+
+class CompressedStateColumns(Sequence[dict[str, Any]]):
+    """Compressed states of one entity kept in parallel columns.
+
+    Large history queries keep the states, timestamps and attribute indexes
+    in columns instead of creating a dict per row. The columns are
+    serialized straight to the compressed state format by json_fragment,
+    while indexing still returns the compressed state dict of a row.
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_attributes_idx",
+        "_attributes_lookup",
+        "_last_changed_ts",
+        "_last_updated_ts",
+        "_states",
+    )
+
+    def __init__(self) -> None:
+        """Init the columns."""
+        self._states: list[str] = []
+        self._last_updated_ts = array("d")
+        # Index into _attributes, or -1 if the row has no attributes
+        self._attributes_idx = array("i")
+        # The unique attributes of the entity and their index by source
+        self._attributes: list[dict[str, Any]] = []
+        self._attributes_lookup: dict[str, int] = {}
+        # Only set for the rows where last_changed differs from last_updated
+        self._last_changed_ts: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return len(self._states)
+
+    @overload
+    def __getitem__(self, idx: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, idx: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        """Return the compressed state of a row."""
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: self._states[idx]}
+        if (attributes_idx := self._attributes_idx[idx]) != -1:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = self._attributes[attributes_idx]
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = self._last_updated_ts[idx]
+        if (last_changed_ts := self._last_changed_ts.get(idx)) is not None:
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+        return comp_state
+
+    def append(self, state: str, last_updated_ts: float) -> None:
+        """Append a state without attributes."""
+        self._states.append(state)
+        self._last_updated_ts.append(last_updated_ts)
+        self._attributes_idx.append(-1)
+
+    def append_row(
+        self,
+        row: Row,
+        attr_cache: dict[str, dict[str, Any]],
+        start_time_ts: float | None,
+        state: str,
+        last_updated_ts: float | None,
+        no_attributes: bool,
+    ) -> None:
+        """Append a database row, the same as row_to_compressed_state."""
+        row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
+        if (
+            (row_last_changed_ts := getattr(row, "last_changed_ts", None))
+            and row_last_changed_ts
+            and row_last_updated_ts != row_last_changed_ts
+        ):
+            self._last_changed_ts[len(self._states)] = row_last_changed_ts
+        self._states.append(state)
+        self._last_updated_ts.append(row_last_updated_ts)
+        if no_attributes:
+            self._attributes_idx.append(-1)
+            return
+        source = getattr(row, "attributes", None) or ""
+        if (attributes_idx := self._attributes_lookup.get(source)) is None:
+            attributes_idx = self._attributes_lookup[source] = len(self._attributes)
+            self._attributes.append(decode_attributes_from_source(source, attr_cache))
+        self._attributes_idx.append(attributes_idx)
+
+    def downsample(self, max_points: int) -> CompressedStateColumns:
+        """Return the columns reduced to about max_points states.
+
+        The time range is split in max_points // 2 buckets and the states with
+        the lowest and highest numeric value in each bucket are kept, so peaks
+        stay visible. The first and last states, and states that are not
+        numeric or None, are always kept.
+        """
+        if (count := len(self._states)) <= max_points:
+            return self
+        states = self._states
+        last_updated_ts = self._last_updated_ts
+        first_ts = last_updated_ts[0]
+        bucket_size = (last_updated_ts[-1] - first_ts) / max(max_points // 2, 1)
+        keep: set[int] = {0, count - 1}
+        bucket = -1
+        min_idx = max_idx = -1
+        min_value = max_value = 0.0
+        for idx in range(1, count - 1):
+            try:
+                value = float(states[idx])
+            except (TypeError, ValueError):
+                # Not numeric, or None for an entity that was removed
+                keep.add(idx)
+                continue
+            if bucket_size:
+                row_bucket = int((last_updated_ts[idx] - first_ts) / bucket_size)
+            else:
+                row_bucket = 0
+            if row_bucket != bucket:
+                if bucket != -1:
+                    keep.add(min_idx)
+                    keep.add(max_idx)
+                bucket = row_bucket
+                min_idx = max_idx = idx
+                min_value = max_value = value
+            elif value < min_value:
+                min_idx, min_value = idx, value
+            elif value > max_value:
+                max_idx, max_value = idx, value
+        if bucket != -1:
+            keep.add(min_idx)
+            keep.add(max_idx)
+        return self._select(sorted(keep))
+
+    def _select(self, indexes: list[int]) -> CompressedStateColumns:
+        """Return new columns with the states at indexes."""
+        columns = CompressedStateColumns()
+        states = self._states
+        last_updated_ts = self._last_updated_ts
+        attributes_idx = self._attributes_idx
+        last_changed_ts = self._last_changed_ts
+        columns._states = [states[idx] for idx in indexes]
+        columns._last_updated_ts = array("d", [last_updated_ts[idx] for idx in indexes])
+        columns._attributes_idx = array("i", [attributes_idx[idx] for idx in indexes])
+        columns._attributes = self._attributes
+        columns._attributes_lookup = self._attributes_lookup
+        columns._last_changed_ts = {
+            new_idx: last_changed_ts[idx]
+            for new_idx, idx in enumerate(indexes)
+            if idx in last_changed_ts
+        }
+        return columns
+
+    @property
+    def json_fragment(self) -> json_fragment:
+        """Return the compressed states as a JSON fragment."""
+        states = self._states
+        last_updated_ts = self._last_updated_ts
+        last_changed_ts = self._last_changed_ts
+        attributes_idx = self._attributes_idx
+        # Each unique state and attributes is only encoded once
+        encoded_states: dict[str, bytes] = {}
+        encoded_attributes: dict[int, bytes] = {}
+        attributes = self._attributes
+        attributes_key = b',"' + COMPRESSED_STATE_ATTRIBUTES.encode() + b'":'
+        state_key = b'{"' + COMPRESSED_STATE_STATE.encode() + b'":'
+        last_updated_key = b',"' + COMPRESSED_STATE_LAST_UPDATED.encode() + b'":'
+        last_changed_key = b',"' + COMPRESSED_STATE_LAST_CHANGED.encode() + b'":'
+        buffer = bytearray(b"[")
+        for idx, state in enumerate(states):
+            if idx:
+                buffer += b"},"
+            buffer += state_key
+            if (encoded_state := encoded_states.get(state)) is None:
+                encoded_state = encoded_states[state] = json_bytes(state)
+            buffer += encoded_state
+            if (row_attributes_idx := attributes_idx[idx]) != -1:
+                if (
+                    encoded_attrs := encoded_attributes.get(row_attributes_idx)
+                ) is None:
+                    encoded_attrs = encoded_attributes[row_attributes_idx] = (
+                        attributes_key + json_bytes(attributes[row_attributes_idx])
+                    )
+                buffer += encoded_attrs
+            buffer += last_updated_key
+            buffer += json_bytes(last_updated_ts[idx])
+            if idx in last_changed_ts:
+                buffer += last_changed_key
+                buffer += json_bytes(last_changed_ts[idx])
+        buffer += b"}]" if states else b"]"
+        return json_fragment(bytes(buffer))
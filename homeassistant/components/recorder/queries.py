@@ -44,6 +44,17 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_shared_attributes_by_ids(
+    attributes_ids: list[int],
+) -> StatementLambdaElement:
+    """Load shared attributes from the database by attributes_id."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(StateAttributes.attributes_id.in_(attributes_ids))
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -55,6 +55,16 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_attributes_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get state attributes cache info."""
+    manager = instance.state_attributes_manager
+    cache_info: dict[str, Any] = {"attributes_cache_size": manager.cache_size}
+    if lookups := manager.hits + manager.misses:
+        cache_info["attributes_cache_hit_rate"] = f"{manager.hits / lookups:.1%}"
+    return cache_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +82,6 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs | db_stats | db_engine_info | _async_get_attributes_cache_info(instance)
+    )
@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 from collections.abc import Collection, Iterable
+from contextlib import suppress
 import logging
+import os
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util.collection import chunked_or_all
-from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.json import (
+    JSON_DECODE_EXCEPTIONS,
+    JSON_ENCODE_EXCEPTIONS,
+    json_loads_object,
+)
 
-from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
-from ..util import execute_stmt_lambda_element
+from ..const import SQLITE_URL_PREFIX
+from ..db_schema import SCHEMA_VERSION, StateAttributes
+from ..queries import get_shared_attributes, get_shared_attributes_by_ids
+from ..util import dburl_to_path, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
@@ -28,6 +37,9 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The cache is saved next to SQLite databases on shutdown
+CACHE_SUFFIX = ".attributes_cache"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,6 +49,27 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_size(self) -> int:
+        """Return the number of attributes ids in the cache."""
+        return len(self._id_map)
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        Hits and misses are counted to report the hit rate of the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return attributes_id
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -136,6 +169,96 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
 
+    def load_cache(self, session: Session) -> None:
+        """Load the cache saved on the last clean shutdown.
+
+        The cached attributes ids are checked against the database once,
+        as the database can be changed while Home Assistant is stopped.
+        The file is removed once it is loaded, so the cache is only used
+        again after it was saved on the next clean shutdown.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (path := self._cache_path()) is None:
+            return
+        try:
+            with open(path, "rb") as fdesc:
+                data = fdesc.read()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.warning("Unable to load the state attributes cache: %s", err)
+            return
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+        try:
+            saved = json_loads_object(data)
+            if saved.get("schema_version") != SCHEMA_VERSION:
+                return
+            cached = {
+                cast(str, shared_attrs): cast(int, attributes_id)
+                for attributes_id, shared_attrs in cast(
+                    list[list[int | str]], saved["attributes"]
+                )
+            }
+        except (*JSON_DECODE_EXCEPTIONS, KeyError, TypeError, ValueError):
+            _LOGGER.warning("The state attributes cache is invalid, ignoring")
+            return
+        stored: dict[int, str] = {}
+        with session.no_autoflush:
+            for ids_chunk in chunked_or_all(
+                set(cached.values()), self.recorder.max_bind_vars
+            ):
+                for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                    session, get_shared_attributes_by_ids(ids_chunk), orm_rows=False
+                ):
+                    stored[cast(int, attributes_id)] = shared_attrs
+        id_map = self._id_map
+        # The cache was saved from the most recently used attributes, so
+        # they are added in reverse to keep the order of the LRU
+        for shared_attrs, attributes_id in reversed(cached.items()):
+            if stored.get(attributes_id) == shared_attrs:
+                id_map[shared_attrs] = attributes_id
+        _LOGGER.debug("Loaded %s cached state attributes", len(id_map))
+
+    def save_cache(self) -> None:
+        """Save the cache to resolve the attributes ids after a restart.
+
+        This call is not thread-safe and must be called from the
+        recorder thread after the pending attributes were committed.
+        """
+        if (path := self._cache_path()) is None:
+            return
+        data = json_bytes(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "attributes": [
+                    [attributes_id, shared_attrs]
+                    for shared_attrs, attributes_id in self._id_map.items()
+                ],
+            }
+        )
+        try:
+            write_utf8_file(path, data, mode="wb")
+        except WriteError as err:
+            _LOGGER.warning("Unable to save the state attributes cache: %s", err)
+
+    def _cache_path(self) -> str | None:
+        """Return the path of the saved cache.
+
+        The cache is only saved for SQLite databases, next to the database
+        so it is moved, backed up and restored together with it.
+        """
+        db_url = self.recorder.db_url
+        if (
+            not db_url.startswith(SQLITE_URL_PREFIX)
+            or db_url == SQLITE_URL_PREFIX
+            or ":memory:" in db_url
+        ):
+            return None
+        return f"{dburl_to_path(db_url)}{CACHE_SUFFIX}"
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
@@ -64,6 +64,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.dt import parse_datetime
+from homeassistant.util.hass_dict import HassKey
 
 from .config import ScriptConfig, ValidationStatus
 from .const import (
@@ -86,6 +87,10 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+DATA_REFERENCE_INDEX: HassKey[dict[str, dict[str, list[str]]]] = HassKey(
+    f"{DOMAIN}_reference_index"
+)
+
 
 @bind_hass
 def is_on(hass: HomeAssistant, entity_id: str) -> bool:
@@ -100,13 +105,25 @@ def _scripts_with_x(
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
+    return list(_async_reference_index(hass, property_name).get(referenced_id, ()))
 
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+
+def _async_reference_index(
+    hass: HomeAssistant, property_name: str
+) -> dict[str, list[str]]:
+    """Return the scripts referencing each x.
+
+    The index is built on first use and dropped when a script is added or
+    removed.
+    """
+    indexes = hass.data.setdefault(DATA_REFERENCE_INDEX, {})
+    if (index := indexes.get(property_name)) is None:
+        component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
+        index = indexes[property_name] = {}
+        for script_entity in component.entities:
+            for referenced_id in getattr(script_entity, property_name):
+                index.setdefault(referenced_id, []).append(script_entity.entity_id)
+    return index
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -427,6 +444,16 @@ class BaseScriptEntity(ToggleEntity, ABC):
 
     raw_config: ConfigType | None
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Drop the reference index when a script is added."""
+        await super().async_internal_added_to_hass()
+        self.hass.data.pop(DATA_REFERENCE_INDEX, None)
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Drop the reference index when a script is removed."""
+        await super().async_internal_will_remove_from_hass()
+        self.hass.data.pop(DATA_REFERENCE_INDEX, None)
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
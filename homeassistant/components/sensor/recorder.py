@@ -14,6 +14,13 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+try:
+    import numpy as np
+except ImportError:
+    NUMPY_AVAILABLE = False
+else:
+    NUMPY_AVAILABLE = True
+
 from homeassistant.components.recorder import (
     DOMAIN as RECORDER_DOMAIN,
     get_instance,
@@ -111,7 +118,7 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     entity_filter = instance.entity_filter
     return [
         state
-        for state in hass.states.all(DOMAIN)
+        for state in hass.states.snapshot().domain_states(DOMAIN)
         if (state_class := state.attributes.get(ATTR_STATE_CLASS))
         and (
             type(state_class) is SensorStateClass
@@ -159,6 +166,53 @@ def _time_weighted_arithmetic_mean(
     return accumulated / (end - start).total_seconds()
 
 
+def _time_weighted_arithmetic_mean_min_max(
+    fstates_list: list[list[tuple[float, State]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> tuple[list[float], list[float], list[float]]:
+    """Calculate the time weighted average, min and max of many sensors with numpy.
+
+    The states of all sensors are concatenated to a single array, so the
+    statistics of all sensors are calculated in one pass. The result is the
+    same as calling _time_weighted_arithmetic_mean, min and max per sensor.
+    """
+    count = len(fstates_list)
+    lengths = np.fromiter(map(len, fstates_list), dtype=np.intp, count=count)
+    offsets = np.zeros(count, dtype=np.intp)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    total = int(lengths.sum())
+    values = np.fromiter(
+        (fstate for fstates in fstates_list for fstate, _ in fstates),
+        dtype=np.float64,
+        count=total,
+    )
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = np.fromiter(
+        (
+            state.last_updated_timestamp
+            for fstates in fstates_list
+            for _, state in fstates
+        ),
+        dtype=np.float64,
+        count=total,
+    )
+    np.maximum(start_times, start.timestamp(), out=start_times)
+    # Each value is weighted by the duration until the next state change
+    # of the sensor, or until the end of the period for its last state
+    end_times = np.empty_like(start_times)
+    end_times[:-1] = start_times[1:]
+    end_times[offsets[1:] - 1] = end_times[-1] = end.timestamp()
+    accumulated = np.add.reduceat(values * (end_times - start_times), offsets)
+    means = accumulated / (end.timestamp() - start_times[offsets])
+    return (
+        means.tolist(),
+        np.minimum.reduceat(values, offsets).tolist(),
+        np.maximum.reduceat(values, offsets).tolist(),
+    )
+
+
 def _time_weighted_circular_mean(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
 ) -> tuple[float, float]:
@@ -538,6 +592,7 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    vectorized: list[tuple[StatisticData, set[str], list[tuple[float, State]]]] = []
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -609,25 +664,32 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id].types:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
+        if NUMPY_AVAILABLE and mean_type is StatisticMeanType.ARITHMETIC:
+            # The mean, min and max of these sensors are calculated
+            # together once all sensors have been processed
+            vectorized.append(
+                (stat, wanted_statistics[entity_id].types, valid_float_states)
             )
-        if "min" in wanted_statistics[entity_id].types:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        match mean_type:
-            case StatisticMeanType.ARITHMETIC:
-                stat["mean"] = _time_weighted_arithmetic_mean(
-                    valid_float_states, start, end
+        else:
+            if "max" in wanted_statistics[entity_id].types:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
                 )
-            case StatisticMeanType.CIRCULAR:
-                stat["mean"], stat["mean_weight"] = _time_weighted_circular_mean(
-                    valid_float_states, start, end
+            if "min" in wanted_statistics[entity_id].types:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
                 )
 
+            match mean_type:
+                case StatisticMeanType.ARITHMETIC:
+                    stat["mean"] = _time_weighted_arithmetic_mean(
+                        valid_float_states, start, end
+                    )
+                case StatisticMeanType.CIRCULAR:
+                    stat["mean"], stat["mean_weight"] = _time_weighted_circular_mean(
+                        valid_float_states, start, end
+                    )
+
         if "sum" in wanted_statistics[entity_id].types:
             last_reset = old_last_reset = None
             new_state = old_state = None
@@ -731,6 +793,19 @@ def compile_statistics(  # noqa: C901
 
         result.append({"meta": meta, "stat": stat})
 
+    if vectorized:
+        means, mins, maxs = _time_weighted_arithmetic_mean_min_max(
+            [valid_float_states for _, _, valid_float_states in vectorized], start, end
+        )
+        for (stat, types, _), mean, min_, max_ in zip(
+            vectorized, means, mins, maxs, strict=True
+        ):
+            if "max" in types:
+                stat["max"] = max_
+            if "min" in types:
+                stat["min"] = min_
+            stat["mean"] = mean
+
     return statistics.PlatformCompiledStatistics(result, old_metadatas)
 
 
@@ -784,7 +859,7 @@ def list_statistic_ids(
 @callback
 def _update_issues(
     report_issue: Callable[[str, str, dict[str, Any]], None],
-    sensor_states: list[State],
+    sensor_states: Iterable[State],
     metadatas: dict[str, tuple[int, StatisticMetaData]],
 ) -> None:
     """Update repair issues."""
@@ -859,7 +934,7 @@ def update_statistics_issues(
 ) -> None:
     """Validate statistics."""
     instance = get_instance(hass)
-    sensor_states = hass.states.all(DOMAIN)
+    sensor_states = hass.states.snapshot().domain_states(DOMAIN)
     metadatas = statistics.get_metadata_with_session(
         instance, session, statistic_source=RECORDER_DOMAIN
     )
@@ -920,7 +995,7 @@ def validate_statistics(
     """Validate statistics."""
     validation_result = defaultdict(list)
 
-    sensor_states = hass.states.all(DOMAIN)
+    sensor_states = hass.states.snapshot().domain_states(DOMAIN)
     metadatas = statistics.get_metadata(hass, statistic_source=RECORDER_DOMAIN)
     sensor_entity_ids = {i.entity_id for i in sensor_states}
     sensor_statistic_ids = set(metadatas)
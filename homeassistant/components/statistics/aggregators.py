@@ -0,0 +1,323 @@
+"""Incremental aggregators for the statistics sensor.
+
+The aggregators are updated as samples are added to and removed from the
+sample buffer, so the characteristic does not need to be recalculated over
+the whole buffer on every update. Samples are always removed in the order
+they were added.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+from typing import cast
+
+from homeassistant.util import dt as dt_util
+
+
+class StatisticsAggregator(ABC):
+    """Base class for an incremental aggregator."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+
+    @abstractmethod
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+
+    @abstractmethod
+    def result(self, ages: deque[float], percentile: int) -> float | datetime | None:
+        """Return the characteristic of the samples."""
+
+
+class SumAggregator(StatisticsAggregator):
+    """Running sum of the samples."""
+
+    __slots__ = ("_count", "_sum")
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._count = 0
+        self._sum = 0.0
+
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+        self._count += 1
+        self._sum += value
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        self._count -= 1
+        # Do not carry rounding errors over once the buffer is empty
+        self._sum = self._sum - value if self._count else 0.0
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the sum of the samples."""
+        return self._sum if self._count else None
+
+
+class MeanAggregator(StatisticsAggregator):
+    """Running mean and variance of the samples using Welford's algorithm."""
+
+    __slots__ = ("_count", "_m2", "_mean")
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        self._count -= 1
+        if not self._count:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def variance(self) -> float | None:
+        """Return the sample variance."""
+        if self._count == 1:
+            return 0.0
+        if self._count >= 2:
+            # Rounding errors must not make the variance negative
+            return max(self._m2, 0.0) / (self._count - 1)
+        return None
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the mean of the samples."""
+        return self._mean if self._count else None
+
+
+class VarianceAggregator(MeanAggregator):
+    """Running sample variance."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the sample variance."""
+        return self.variance()
+
+
+class StandardDeviationAggregator(MeanAggregator):
+    """Running sample standard deviation."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the sample standard deviation."""
+        if (variance := self.variance()) is None:
+            return None
+        return math.sqrt(variance)
+
+
+class Distance95PercentAggregator(StandardDeviationAggregator):
+    """Running distance of 95% of the samples."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the distance of 95% of the samples."""
+        if (standard_deviation := super().result(ages, percentile)) is None:
+            return None
+        return 2 * 1.96 * standard_deviation
+
+
+class Distance99PercentAggregator(StandardDeviationAggregator):
+    """Running distance of 99% of the samples."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the distance of 99% of the samples."""
+        if (standard_deviation := super().result(ages, percentile)) is None:
+            return None
+        return 2 * 2.58 * standard_deviation
+
+
+class MedianAggregator(StatisticsAggregator):
+    """Keep the samples sorted to look up order statistics."""
+
+    __slots__ = ("_sorted",)
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._sorted: list[float] = []
+
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+        insort(self._sorted, value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        sorted_values = self._sorted
+        idx = bisect_left(sorted_values, value)
+        if idx < len(sorted_values) and sorted_values[idx] == value:
+            del sorted_values[idx]
+        else:
+            # NaN does not compare equal to itself
+            sorted_values.remove(value)
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the median of the samples like statistics.median."""
+        sorted_values = self._sorted
+        if not (count := len(sorted_values)):
+            return None
+        idx = count // 2
+        if count % 2:
+            return sorted_values[idx]
+        return (sorted_values[idx - 1] + sorted_values[idx]) / 2
+
+
+class PercentileAggregator(MedianAggregator):
+    """Percentile of the sorted samples."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the percentile like statistics.quantiles with exclusive method."""
+        sorted_values = self._sorted
+        if (count := len(sorted_values)) == 1:
+            return sorted_values[0]
+        if count < 2:
+            return None
+        size = count + 1
+        idx = min(max(percentile * size // 100, 1), count - 1)
+        delta = percentile * size - idx * 100
+        return (
+            sorted_values[idx - 1] * (100 - delta) + sorted_values[idx] * delta
+        ) / 100
+
+
+class _ExtremeAggregator(StatisticsAggregator):
+    """Track the largest sample with a monotonic deque.
+
+    The deque holds the candidates to become the largest sample once older
+    samples are removed, together with the number of samples added before
+    them. The first candidate is the oldest of the largest samples.
+    Subclasses track the smallest sample by overriding _replaces.
+    """
+
+    __slots__ = ("_added", "_candidates", "_removed")
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._candidates: deque[tuple[int, float]] = deque()
+        self._added = 0
+        self._removed = 0
+
+    def _replaces(self, value: float, candidate: float) -> bool:
+        """Return if a new sample makes an older candidate obsolete."""
+        return value > candidate
+
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+        candidates = self._candidates
+        while candidates and self._replaces(value, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self._added, value))
+        self._added += 1
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        if self._candidates and self._candidates[0][0] == self._removed:
+            self._candidates.popleft()
+        self._removed += 1
+
+    def extreme(self) -> tuple[int, float] | None:
+        """Return the position in the buffer and the value of the extreme."""
+        if not self._candidates:
+            return None
+        added, value = self._candidates[0]
+        return added - self._removed, value
+
+
+class MaxAggregator(_ExtremeAggregator):
+    """Largest sample."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the largest sample."""
+        return self._candidates[0][1] if self._candidates else None
+
+
+class MinAggregator(MaxAggregator):
+    """Smallest sample."""
+
+    __slots__ = ()
+
+    def _replaces(self, value: float, candidate: float) -> bool:
+        """Return if a new sample makes an older candidate obsolete."""
+        return value < candidate
+
+
+class DatetimeValueMaxAggregator(_ExtremeAggregator):
+    """Time of the oldest of the largest samples."""
+
+    __slots__ = ()
+
+    def result(self, ages: deque[float], percentile: int) -> datetime | None:
+        """Return the time of the largest sample."""
+        if (extreme := self.extreme()) is None:
+            return None
+        return dt_util.utc_from_timestamp(ages[extreme[0]])
+
+
+class DatetimeValueMinAggregator(DatetimeValueMaxAggregator):
+    """Time of the oldest of the smallest samples."""
+
+    __slots__ = ()
+
+    def _replaces(self, value: float, candidate: float) -> bool:
+        """Return if a new sample makes an older candidate obsolete."""
+        return value < candidate
+
+    def result(self, ages: deque[float], percentile: int) -> datetime | None:
+        """Return the time of the smallest sample."""
+        if (extreme := self.extreme()) is None:
+            return None
+        return dt_util.utc_from_timestamp(ages[extreme[0]])
+
+
+class DistanceAbsoluteAggregator(StatisticsAggregator):
+    """Difference between the largest and the smallest sample."""
+
+    __slots__ = ("_max", "_min")
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._max = MaxAggregator()
+        self._min = MinAggregator()
+
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+        self._max.add(value)
+        self._min.add(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        self._max.remove(value)
+        self._min.remove(value)
+
+    def result(self, ages: deque[float], percentile: int) -> float | None:
+        """Return the distance between the largest and the smallest sample."""
+        if (largest := self._max.result(ages, percentile)) is None:
+            return None
+        return largest - cast(float, self._min.result(ages, percentile))
@@ -62,6 +62,22 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregators import (
+    DatetimeValueMaxAggregator,
+    DatetimeValueMinAggregator,
+    Distance95PercentAggregator,
+    Distance99PercentAggregator,
+    DistanceAbsoluteAggregator,
+    MaxAggregator,
+    MeanAggregator,
+    MedianAggregator,
+    MinAggregator,
+    PercentileAggregator,
+    StandardDeviationAggregator,
+    StatisticsAggregator,
+    SumAggregator,
+    VarianceAggregator,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -458,6 +474,25 @@ STATS_NUMERIC_SUPPORT = {
     STAT_VARIANCE: _stat_variance,
 }
 
+# Statistics of a sensor source that are updated incrementally instead of
+# being calculated over all samples by the functions above on every update
+STATS_NUMERIC_INCREMENTAL: dict[str, type[StatisticsAggregator]] = {
+    STAT_DATETIME_VALUE_MAX: DatetimeValueMaxAggregator,
+    STAT_DATETIME_VALUE_MIN: DatetimeValueMinAggregator,
+    STAT_DISTANCE_95P: Distance95PercentAggregator,
+    STAT_DISTANCE_99P: Distance99PercentAggregator,
+    STAT_DISTANCE_ABSOLUTE: DistanceAbsoluteAggregator,
+    STAT_MEAN: MeanAggregator,
+    STAT_MEDIAN: MedianAggregator,
+    STAT_PERCENTILE: PercentileAggregator,
+    STAT_STANDARD_DEVIATION: StandardDeviationAggregator,
+    STAT_SUM: SumAggregator,
+    STAT_TOTAL: SumAggregator,
+    STAT_VALUE_MAX: MaxAggregator,
+    STAT_VALUE_MIN: MinAggregator,
+    STAT_VARIANCE: VarianceAggregator,
+}
+
 # Statistics supported by a binary_sensor source
 STATS_BINARY_SUPPORT = {
     STAT_AVERAGE_STEP: _stat_binary_average_step,
@@ -700,6 +735,11 @@ class StatisticsSensor(SensorEntity):
             [deque[bool | float], deque[float], int],
             float | int | datetime | None,
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
+        self._aggregator: StatisticsAggregator | None = None
+        if not self.is_binary and (
+            aggregator_cls := STATS_NUMERIC_INCREMENTAL.get(state_characteristic)
+        ):
+            self._aggregator = aggregator_cls()
 
         self._update_listener: CALLBACK_TYPE | None = None
         self._preview_callback: Callable[[str, Mapping[str, Any]], None] | None = None
@@ -809,7 +849,13 @@ class StatisticsSensor(SensorEntity):
                 assert new_state.state in ("on", "off")
                 self.states.append(new_state.state == "on")
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+                if (aggregator := self._aggregator) is not None:
+                    if len(self.states) == self.states.maxlen:
+                        # The oldest sample is dropped by the append below
+                        aggregator.remove(self.states[0])
+                    aggregator.add(value)
+                self.states.append(value)
             self.ages.append(last_reported_timestamp)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
@@ -955,7 +1001,9 @@ class StatisticsSensor(SensorEntity):
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
             self.ages.popleft()
-            self.states.popleft()
+            value = self.states.popleft()
+            if self._aggregator is not None:
+                self._aggregator.remove(value)
 
     @callback
     def _async_next_to_purge_timestamp(self) -> float | None:
@@ -1028,7 +1076,6 @@ class StatisticsSensor(SensorEntity):
 
     def _fetch_states_from_database(self) -> list[State]:
         """Fetch the states from the database."""
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
         lower_entity_id = self._source_entity_id.lower()
         if (max_age := self._samples_max_age) is not None:
             start_date = (
@@ -1053,6 +1100,28 @@ class StatisticsSensor(SensorEntity):
             include_start_time_state=False,
         ).get(lower_entity_id, [])
 
+    async def _async_fetch_states_since_max_age(self, max_age: float) -> list[State]:
+        """Fetch the states not older than max_age, newest first.
+
+        The states come from the history window shared with other sensors
+        of the same source entity, so they are only queried once. This is
+        only used without a buffer limit, since the window loads all states
+        within max_age.
+        """
+        start_date = (
+            dt_util.utcnow() - timedelta(seconds=max_age) - timedelta(microseconds=1)
+        )
+        _LOGGER.debug(
+            "%s: retrieve records not older then %s", self.entity_id, start_date
+        )
+        states = await history.async_state_changes_since(
+            self.hass,
+            self._source_entity_id,
+            start_date,
+            include_start_time_state=False,
+        )
+        return states[::-1]
+
     async def _initialize_from_database(self) -> None:
         """Initialize the list of states from the database.
 
@@ -1063,9 +1132,16 @@ class StatisticsSensor(SensorEntity):
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
-        ):
+        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
+        if (
+            max_age := self._samples_max_age
+        ) is not None and self._samples_max_buffer_size is None:
+            states = await self._async_fetch_states_since_max_age(max_age)
+        else:
+            states = await get_instance(self.hass).async_add_executor_job(
+                self._fetch_states_from_database
+            )
+        if states:
             for state in reversed(states):
                 self._add_state_to_queue(state, state.last_reported_timestamp)
                 self._calculate_state_attributes(state)
@@ -1098,10 +1174,16 @@ class StatisticsSensor(SensorEntity):
     def _update_value(self) -> None:
         """Front to call the right statistical characteristics functions.
 
-        One of the _stat_*() functions is represented by self._state_characteristic_fn().
+        One of the _stat_*() functions is represented by self._state_characteristic_fn(),
+        unless the characteristic is kept up to date by an incremental aggregator.
         """
 
-        value = self._state_characteristic_fn(self.states, self.ages, self._percentile)
+        if self._aggregator is not None:
+            value = self._aggregator.result(self.ages, self._percentile)
+        else:
+            value = self._state_characteristic_fn(
+                self.states, self.ages, self._percentile
+            )
         _LOGGER.debug(
             "Updating value: states: %s, ages: %s => %s", self.states, self.ages, value
         )
@@ -15,10 +15,10 @@ import os
 from pathlib import Path
 import re
 import secrets
-from time import monotonic
+from time import monotonic, time
 from typing import Any, Final, Generic, Protocol, TypeVar
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import mutagen
 from mutagen.id3 import ID3, TextFrame as ID3Text
 from propcache.api import cached_property
@@ -45,6 +45,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import language as language_util, ulid as ulid_util
 
@@ -128,6 +129,16 @@ SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 FFMPEG_CHUNK_SIZE: Final[int] = 4096
 
+# Bytes of audio kept in memory, the least recently used results are evicted
+MEMORY_CACHE_MAX_SIZE: Final[int] = 32 * 1024 * 1024
+
+# Bytes of audio kept in the cache dir, the least recently used files are removed
+FILE_CACHE_MAX_SIZE: Final[int] = 512 * 1024 * 1024
+
+FILE_CACHE_INDEX_STORAGE_KEY = f"{DOMAIN}.file_cache"
+FILE_CACHE_INDEX_STORAGE_VERSION = 1
+FILE_CACHE_INDEX_SAVE_DELAY = 60
+
 
 class TTSCache:
     """Cached bytes of a TTS result."""
@@ -149,13 +160,30 @@ class TTSCache:
         cache_key: str,
         extension: str,
         data_gen: AsyncGenerator[bytes],
+        file_path: str | None = None,
     ) -> None:
         """Initialize the TTS cache."""
         self.cache_key = cache_key
         self.extension = extension
         self.last_used = monotonic()
+        self.file_path = file_path
+        """Path of the result in the file cache, if stored."""
         self._data_gen = data_gen
 
+    @property
+    def loading_started(self) -> bool:
+        """Return if the data is being loaded or was loaded."""
+        return (
+            self._result_data is not None
+            or self._partial_data is not None
+            or self._loading_error is not None
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes held when fully loaded."""
+        return len(self._result_data) if self._result_data is not None else 0
+
     async def async_load_data(self) -> bytes:
         """Load the data from the generator."""
         if self._result_data is not None or self._partial_data is not None:
@@ -407,6 +435,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_list_engines)
     websocket_api.async_register_command(hass, websocket_get_engine)
     websocket_api.async_register_command(hass, websocket_list_engine_voices)
+    websocket_api.async_register_command(hass, websocket_get_cache_info)
 
     # Legacy config options
     conf = config[DOMAIN][0] if config.get(DOMAIN) else {}
@@ -563,11 +592,21 @@ class ResultStream:
             return
 
         cache = await self._result_cache
+        self._manager.async_load_cache(cache)
         async for chunk in cache.async_stream_data():
             yield chunk
 
         self.last_used = monotonic()
 
+    async def async_get_result_file(self) -> str | None:
+        """Return the path of the result if it can be served from the file cache."""
+        if self._override_media_path is not None:
+            return None
+
+        cache = await self._result_cache
+        self.last_used = monotonic()
+        return cache.file_path
+
     def async_override_result(self, media_path: str | Path) -> None:
         """Override the TTS stream with a different media path."""
         self._override_media_path = Path(media_path)
@@ -687,8 +726,26 @@ class DictCleaning(Generic[T]):
             self.schedule()
 
 
+@dataclass(slots=True)
+class TTSCacheStats:
+    """Hits and misses of the TTS cache."""
+
+    memory_hits: int = 0
+    file_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    file_evictions: int = 0
+
+
 class SpeechManager:
-    """Representation of a speech store."""
+    """Representation of a speech store.
+
+    Results are kept in memory until they were not used for the memory cache
+    max age, or until they are the least recently used ones when the memory
+    cache holds more than MEMORY_CACHE_MAX_SIZE bytes. Results can also be
+    stored in the cache dir, which holds at most FILE_CACHE_MAX_SIZE bytes.
+    The size and last use of the files is kept in an index in storage.
+    """
 
     def __init__(
         self,
@@ -705,45 +762,168 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.memory_cache_maxage = memory_cache_maxage
         self.file_cache: dict[str, str] = {}
+        # Size and last use of the files in the file cache
+        self.file_cache_index: dict[str, tuple[int, float]] = {}
+        self.file_cache_size = 0
+        self._file_cache_index_store: Store[dict[str, Any]] = Store(
+            hass, FILE_CACHE_INDEX_STORAGE_VERSION, FILE_CACHE_INDEX_STORAGE_KEY
+        )
+        # Ordered from least to most recently used
         self.mem_cache: dict[str, TTSCache] = {}
+        self.cache_stats = TTSCacheStats()
         self.token_to_stream: dict[str, ResultStream] = {}
         self.memcache_cleanup = DictCleaning(hass, memory_cache_maxage, self.mem_cache)
         self.token_to_stream_cleanup = DictCleaning(
             hass, memory_cache_maxage, self.token_to_stream
         )
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+    def _init_cache(
+        self, indexed_files: dict[str, list[Any]]
+    ) -> tuple[dict[str, str], dict[str, tuple[int, float]]]:
+        """Init cache folder, fetch files and index the files not indexed yet."""
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
         try:
-            return _get_cache_files(self.cache_dir)
+            files = _get_cache_files(self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
+        index: dict[str, tuple[int, float]] = {}
+        for cache_key, filename in files.items():
+            if (entry := indexed_files.get(filename)) is not None:
+                index[cache_key] = (entry[0], entry[1])
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, filename))
+            except OSError:
+                continue
+            index[cache_key] = (stat.st_size, stat.st_mtime)
+
+        return files, index
+
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        stored = await self._file_cache_index_store.async_load()
+        indexed_files: dict[str, list[Any]] = stored["files"] if stored else {}
+        files, index = await self.hass.async_add_executor_job(
+            self._init_cache, indexed_files
+        )
+        self.file_cache.update(files)
+        self.file_cache_index.update(index)
+        self.file_cache_size = sum(size for size, _ in index.values())
+        self._async_evict_files()
+
+    @callback
+    def _file_cache_index_data(self) -> dict[str, Any]:
+        """Return the file cache index to store."""
+        return {
+            "files": {
+                self.file_cache[cache_key]: [size, last_used]
+                for cache_key, (size, last_used) in self.file_cache_index.items()
+            }
+        }
+
+    @callback
+    def _async_schedule_save_file_cache_index(self) -> None:
+        """Schedule storing the file cache index."""
+        self._file_cache_index_store.async_delay_save(
+            self._file_cache_index_data, FILE_CACHE_INDEX_SAVE_DELAY
+        )
+
+    @callback
+    def _async_use_file(self, cache_key: str) -> None:
+        """Mark a file in the file cache as used."""
+        if (entry := self.file_cache_index.get(cache_key)) is None:
+            return
+        self.file_cache_index[cache_key] = (entry[0], time())
+        self._async_schedule_save_file_cache_index()
+
+    @callback
+    def _async_add_file(self, cache_key: str, filename: str, size: int) -> None:
+        """Add a file to the file cache and evict files if it is full."""
+        self._async_remove_file(cache_key)
+        self.file_cache[cache_key] = filename
+        self.file_cache_index[cache_key] = (size, time())
+        self.file_cache_size += size
+        self._async_evict_files()
+        self._async_schedule_save_file_cache_index()
+
+    @callback
+    def _async_remove_file(self, cache_key: str) -> str | None:
+        """Remove a file from the file cache and return its filename."""
+        if (entry := self.file_cache_index.pop(cache_key, None)) is not None:
+            self.file_cache_size -= entry[0]
+        return self.file_cache.pop(cache_key, None)
+
+    @callback
+    def _async_evict_files(self) -> None:
+        """Remove the least recently used files when the file cache is full."""
+        if self.file_cache_size <= FILE_CACHE_MAX_SIZE:
+            return
+
+        evicted: list[str] = []
+        for cache_key, _ in sorted(
+            self.file_cache_index.items(), key=lambda item: item[1][1]
+        ):
+            if self.file_cache_size <= FILE_CACHE_MAX_SIZE:
+                break
+            if (filename := self._async_remove_file(cache_key)) is None:
+                continue
+            evicted.append(filename)
+            if cache := self.mem_cache.get(cache_key):
+                cache.file_path = None
+                if not cache.loading_started:
+                    del self.mem_cache[cache_key]
+
+        _LOGGER.debug("Removing %s files from the file cache", len(evicted))
+        self.cache_stats.file_evictions += len(evicted)
+        self.hass.async_add_executor_job(_remove_cache_files, self.cache_dir, evicted)
+
+    @callback
+    def _async_evict_memory(self, loaded: TTSCache) -> None:
+        """Remove the least recently used results when the memory cache is full."""
+        size = sum(cache.size for cache in self.mem_cache.values())
+        for cache_key, cache in list(self.mem_cache.items()):
+            if size <= MEMORY_CACHE_MAX_SIZE:
+                break
+            if cache is loaded or not cache.size:
+                continue
+            _LOGGER.debug("Removing %s from the memory cache", cache_key)
+            del self.mem_cache[cache_key]
+            size -= cache.size
+            self.cache_stats.memory_evictions += 1
+
+    @callback
+    def async_get_cache_info(self) -> dict[str, Any]:
+        """Return the size and the hits and misses of the cache."""
+        return {
+            "memory_entries": len(self.mem_cache),
+            "memory_size": sum(cache.size for cache in self.mem_cache.values()),
+            "memory_max_size": MEMORY_CACHE_MAX_SIZE,
+            "file_entries": len(self.file_cache),
+            "file_size": self.file_cache_size,
+            "file_max_size": FILE_CACHE_MAX_SIZE,
+            "memory_hits": self.cache_stats.memory_hits,
+            "file_hits": self.cache_stats.file_hits,
+            "misses": self.cache_stats.misses,
+            "memory_evictions": self.cache_stats.memory_evictions,
+            "file_evictions": self.cache_stats.file_evictions,
+        }
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
         self.mem_cache.clear()
 
-        def remove_files(files: list[str]) -> None:
-            """Remove files from filesystem."""
-            for filename in files:
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
-
         task = self.hass.async_add_executor_job(
-            remove_files, list(self.file_cache.values())
+            _remove_cache_files, self.cache_dir, list(self.file_cache.values())
         )
         self.file_cache.clear()
+        self.file_cache_index.clear()
+        self.file_cache_size = 0
+        self._async_schedule_save_file_cache_index()
         await task
 
     @callback
@@ -908,40 +1088,71 @@ class SpeechManager:
         ).lower()
 
         # Is speech already in memory
-        if cache := self.mem_cache.get(cache_key):
+        if cache := self.mem_cache.pop(cache_key, None):
             _LOGGER.debug("Found audio in cache for %s", message[0:32])
+            if cache.loading_started:
+                self.cache_stats.memory_hits += 1
+            else:
+                self.cache_stats.file_hits += 1
+                self._async_use_file(cache_key)
+            # Move to the end, the most recently used results are kept longest
+            self.mem_cache[cache_key] = cache
             return cache
 
-        store_to_disk = use_file_cache
-
         if use_file_cache and (filename := self.file_cache.get(cache_key)):
-            _LOGGER.debug("Loading audio from disk for %s", message[0:32])
-            extension = os.path.splitext(filename)[1][1:]
-            data_gen = self._async_load_file(cache_key)
-            store_to_disk = False
-        else:
-            _LOGGER.debug("Generating audio for %s", message[0:32])
-
-            extension = options.get(ATTR_PREFERRED_FORMAT, _DEFAULT_FORMAT)
-            data_gen = self._async_generate_tts_audio(
-                engine_instance, message, language, options
+            # Loaded into memory when streamed, the file can be served directly
+            _LOGGER.debug("Found audio on disk for %s", message[0:32])
+            self.cache_stats.file_hits += 1
+            self._async_use_file(cache_key)
+            cache = self.mem_cache[cache_key] = TTSCache(
+                cache_key=cache_key,
+                extension=os.path.splitext(filename)[1][1:],
+                data_gen=self._async_load_file(cache_key),
+                file_path=os.path.join(self.cache_dir, filename),
             )
+            self.memcache_cleanup.schedule()
+            return cache
+
+        _LOGGER.debug("Generating audio for %s", message[0:32])
+        self.cache_stats.misses += 1
 
         cache = TTSCache(
             cache_key=cache_key,
-            extension=extension,
-            data_gen=data_gen,
+            extension=options.get(ATTR_PREFERRED_FORMAT, _DEFAULT_FORMAT),
+            data_gen=self._async_generate_tts_audio(
+                engine_instance, message, language, options
+            ),
         )
         self.mem_cache[cache_key] = cache
         self.hass.async_create_background_task(
             self._load_data_into_cache(
-                cache, engine_instance, message, store_to_disk, language, options
+                cache, engine_instance, message, use_file_cache, language, options
             ),
             f"tts_load_data_into_cache_{engine_instance.name}",
         )
         self.memcache_cleanup.schedule()
         return cache
 
+    @callback
+    def async_load_cache(self, cache: TTSCache) -> None:
+        """Start loading a result that was found in the file cache."""
+        if cache.loading_started:
+            return
+        self.hass.async_create_background_task(
+            self._load_file_into_cache(cache), "tts_load_file_into_cache"
+        )
+
+    async def _load_file_into_cache(self, cache: TTSCache) -> None:
+        """Load a result from the file cache into memory."""
+        try:
+            await cache.async_load_data()
+        except Exception as err:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.error("Error loading audio for %s: %s", cache.cache_key, err)
+            if self.mem_cache.get(cache.cache_key) is cache:
+                del self.mem_cache[cache.cache_key]
+            return
+        self._async_evict_memory(cache)
+
     async def _load_data_into_cache(
         self,
         cache: TTSCache,
@@ -962,6 +1173,8 @@ class SpeechManager:
             self.mem_cache.pop(cache.cache_key, None)
             return
 
+        self._async_evict_memory(cache)
+
         if not store_to_disk:
             return
 
@@ -993,7 +1206,8 @@ class SpeechManager:
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
         else:
-            self.file_cache[cache.cache_key] = filename
+            cache.file_path = voice_file
+            self._async_add_file(cache.cache_key, filename, len(data))
 
     async def _async_generate_tts_audio(
         self,
@@ -1126,7 +1340,8 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_file(cache_key)
+            self._async_schedule_save_file_cache_index()
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         yield data
@@ -1194,6 +1409,15 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _remove_cache_files(cache_dir: str, files: list[str]) -> None:
+    """Remove files from the cache dir."""
+    for filename in files:
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+        except OSError as err:
+            _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1292,6 +1516,12 @@ class TextToSpeechView(HomeAssistantView):
         if stream is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
+        if (file_path := await stream.async_get_result_file()) is not None:
+            # Let the web server send the file without reading it into memory
+            return web.FileResponse(
+                file_path, headers={hdrs.CONTENT_TYPE: stream.content_type}
+            )
+
         response: web.StreamResponse | None = None
         try:
             async for data in stream.async_stream_result():
@@ -1438,3 +1668,15 @@ def websocket_list_engine_voices(
     voices = {"voices": engine_instance.async_get_supported_voices(language)}
 
     connection.send_message(websocket_api.result_message(msg["id"], voices))
+
+
+@websocket_api.websocket_command({"type": "tts/cache/info"})
+@websocket_api.require_admin
+@callback
+def websocket_get_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the size and the hits and misses of the TTS cache."""
+    connection.send_result(
+        msg["id"], hass.data[DATA_TTS_MANAGER].async_get_cache_info()
+    )
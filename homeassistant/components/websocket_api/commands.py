@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -83,6 +84,7 @@ from .messages import construct_event_message, construct_result_message
 ALL_CONDITION_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_condition_descriptions_json"
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 ALL_TRIGGER_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_trigger_descriptions_json"
+ALL_COMPRESSED_STATES_JSON_CACHE = "websocket_api_all_compressed_states_json"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -330,12 +332,16 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_can_read_all_states(user: User) -> bool:
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_states(connection.user):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -391,7 +397,6 @@ def _send_handle_get_states_response(
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
@@ -399,9 +404,7 @@ def _forward_entity_changes(
 ) -> None:
     """Forward entity state changed events to websocket."""
     entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
+    if entity_filter and not entity_filter(entity_id):
         return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
@@ -415,11 +418,108 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+class _EntityChangesConflator:
+    """Send the latest change of each entity once per window.
+
+    Changes are collected until the window ends and sent as a single
+    message with one diff per entity, from the state the client knows
+    to the current state.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_message_id_as_bytes",
+        "_pending",
+        "_send_message",
+        "_timer",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        message_id_as_bytes: bytes,
+        window: float,
+    ) -> None:
+        """Initialize the conflator."""
+        self._hass = hass
+        self._send_message = send_message
+        self._message_id_as_bytes = message_id_as_bytes
+        self._window = window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> None:
+        """Add a change of an entity."""
+        if (pending := self._pending.get(entity_id)) is not None:
+            old_state = pending[0]
+        self._pending[entity_id] = (old_state, new_state)
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self._window, self._async_send)
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the changes collected in the window."""
+        self._timer = None
+        # An entity that was added and removed again in the
+        # window is unknown to the client
+        changes = {
+            entity_id: states
+            for entity_id, states in self._pending.items()
+            if states != (None, None)
+        }
+        self._pending.clear()
+        if changes:
+            self._send_message(
+                messages.state_diffs_message(self._message_id_as_bytes, changes)
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+
+@callback
+def _conflate_entity_changes(
+    conflator: _EntityChangesConflator,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    event: Event[EventStateChangedData],
+) -> None:
+    """Collect entity state changed events to send them conflated to websocket."""
+    entity_id = event.data["entity_id"]
+    if entity_filter and not entity_filter(entity_id):
+        return
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    if (
+        not user.is_admin
+        and not permissions.access_all_entities(POLICY_READ)
+        and not permissions.check_entity(entity_id, POLICY_READ)
+    ):
+        return
+    conflator.async_add(entity_id, event.data["old_state"], event.data["new_state"])
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        # Only send the latest change of each entity once per window of
+        # this many seconds, to limit the bandwidth used by slow clients
+        vol.Optional("conflate"): vol.All(
+            vol.Coerce(float), vol.Range(min=0.05, max=60)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -436,17 +536,42 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
+    conflator: _EntityChangesConflator | None = None
+    forward_entity_changes: Callable[[Event[EventStateChangedData]], None]
+    if (window := msg.get("conflate")) is not None:
+        conflator = _EntityChangesConflator(
+            hass, connection.send_message, message_id_as_bytes, window
+        )
+        forward_entity_changes = partial(
+            _conflate_entity_changes, conflator, entity_filter, connection.user
+        )
+    else:
+        forward_entity_changes = partial(
             _forward_entity_changes,
             connection.send_message,
-            entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
-    )
+        )
+    if entity_ids:
+        # The bus only calls the listener for the subscribed entity_ids
+        unsub = hass.bus.async_listen_entities(
+            EVENT_STATE_CHANGED, forward_entity_changes, entity_ids=entity_ids
+        )
+    else:
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, forward_entity_changes)
+    if conflator is not None:
+        conflator_cancel = conflator.async_cancel
+
+        @callback
+        def _unsub_conflated() -> None:
+            """Stop listening and drop the pending changes."""
+            unsub()
+            conflator_cancel()
+
+        connection.subscriptions[msg_id] = _unsub_conflated
+    else:
+        connection.subscriptions[msg_id] = unsub
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -460,14 +585,20 @@ def handle_subscribe_entities(
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
             ]
+            joined_states = b",".join(serialized_states)
+        elif _async_can_read_all_states(connection.user):
+            # Fast path when not filtering, subscribers connecting before the
+            # next state change share the payload
+            joined_states = _async_get_all_compressed_states_json(hass, states)
         else:
-            # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
+            joined_states = b",".join(
+                [state.as_compressed_state_json for state in states]
+            )
     except (ValueError, TypeError):
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, joined_states
         )
         return
 
@@ -484,14 +615,14 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, b",".join(serialized_states)
     )
 
 
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
-    serialized_states: list[bytes],
+    joined_states: bytes,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -500,13 +631,35 @@ def _send_handle_entities_init_response(
                 b'{"id":',
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
+                joined_states,
                 b"}}}",
             )
         )
     )
 
 
+@callback
+def _async_get_all_compressed_states_json(
+    hass: HomeAssistant, states: list[State]
+) -> bytes:
+    """Return the joined compressed states of all states.
+
+    The compressed state of each state is cached on the state, this caches
+    the join for the version of the state machine so reconnecting clients
+    do not each build it again.
+    """
+    version = hass.states.version
+    if ALL_COMPRESSED_STATES_JSON_CACHE in hass.data:
+        cached_version, cached_json_payload = hass.data[
+            ALL_COMPRESSED_STATES_JSON_CACHE
+        ]
+        if cached_version == version:
+            return cast(bytes, cached_json_payload)
+    json_payload = b",".join([state.as_compressed_state_json for state in states])
+    hass.data[ALL_COMPRESSED_STATES_JSON_CACHE] = (version, json_payload)
+    return json_payload
+
+
 async def _async_get_all_condition_descriptions_json(hass: HomeAssistant) -> bytes:
     """Return JSON of descriptions (i.e. user documentation) for all condition."""
     descriptions = await async_get_all_condition_descriptions(hass)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -208,9 +209,22 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
+    data = event.data
+    return _state_diff(data["entity_id"], data["old_state"], data["new_state"])
+
+
+def _state_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Return the minimal version of the change from old_state to new_state."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
@@ -251,6 +265,29 @@ def _state_diff_event(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
+def state_diffs_message(
+    message_id_as_bytes: bytes,
+    changes: Mapping[str, tuple[State | None, State | None]],
+) -> bytes:
+    """Return an event message with the changes of multiple entities.
+
+    The changes map each entity_id to the state the client knows
+    and the current state.
+    """
+    event: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        for key, value in _state_diff(entity_id, old_state, new_state).items():
+            if key == ENTITY_EVENT_REMOVE:
+                event.setdefault(key, []).extend(value)
+            else:
+                event.setdefault(key, {}).update(value)
+    partial_message = (
+        _message_to_json_bytes_or_none({"type": "event", "event": event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+
+
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
     """Serialize a websocket message to json or return None."""
     try:
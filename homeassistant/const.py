@@ -1043,6 +1043,7 @@ HTTP_HEADER_X_REQUESTED_WITH: Final = "X-Requested-With"
 
 CONTENT_TYPE_JSON: Final = "application/json"
 CONTENT_TYPE_MULTIPART: Final = "multipart/x-mixed-replace; boundary={}"
+CONTENT_TYPE_NDJSON: Final = "application/x-ndjson"
 CONTENT_TYPE_TEXT_PLAIN: Final = "text/plain"
 
 # The exit code to send to request a restart
@@ -13,6 +13,7 @@ from collections.abc import (
     Collection,
     Coroutine,
     Iterable,
+    Iterator,
     KeysView,
     Mapping,
     ValuesView,
@@ -23,7 +24,9 @@ import datetime
 import enum
 import functools
 import inspect
+from itertools import chain
 import logging
+from operator import itemgetter
 import re
 import threading
 import time
@@ -34,6 +37,7 @@ from typing import (
     Final,
     Generic,
     NotRequired,
+    Protocol,
     Self,
     TypedDict,
     TypeVar,
@@ -1454,19 +1458,50 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
         raise MaxLengthExceeded(event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE)
 
 
+class JobMonitor(Protocol):
+    """Record how long the callback listeners of sampled events take to run.
+
+    Only callbacks run to completion when the event is fired, so only
+    they are timed; coroutine and executor listeners are scheduled.
+    """
+
+    def async_should_sample(self) -> bool:
+        """Return if the listeners of the event being fired should be timed."""
+
+    def async_record(
+        self,
+        event_type: EventType[Any] | str,
+        job: HassJob[..., Any],
+        duration: float,
+    ) -> None:
+        """Record how long a listener took to run."""
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_job_monitor",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # Listeners by event_type and then by entity_id or domain
+        self._keyed_listeners: defaultdict[
+            EventType[Any] | str, defaultdict[str, list[_FilterableJobType[Any]]]
+        ] = defaultdict(lambda: defaultdict(list))
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
+        self._job_monitor: JobMonitor | None = None
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
 
@@ -1475,13 +1510,31 @@ class EventBus:
         """Handle logging change."""
         self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
+    @callback
+    def async_set_job_monitor(self, job_monitor: JobMonitor | None) -> None:
+        """Set the monitor timing the listeners of sampled events.
+
+        This method must be run in the event loop.
+        """
+        self._job_monitor = job_monitor
+
     @callback
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, keyed_listeners in self._keyed_listeners.items():
+            # A keyed listener is registered once for every entity_id or domain
+            listeners[key] = listeners.get(key, 0) + len(
+                {
+                    id(filterable_job)
+                    for filterable_jobs in keyed_listeners.values()
+                    for filterable_job in filterable_jobs
+                }
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1551,6 +1604,30 @@ class EventBus:
             match_all_listeners = self._match_all_listeners
         else:
             match_all_listeners = EMPTY_LIST
+        if (
+            (keyed_listeners := self._keyed_listeners.get(event_type)) is not None
+            and event_data is not None
+            and type(entity_id := event_data.get("entity_id")) is str
+        ):
+            entity_id_listeners = keyed_listeners.get(entity_id, EMPTY_LIST)
+            domain_listeners = keyed_listeners.get(
+                entity_id.partition(".")[0], EMPTY_LIST
+            )
+            if entity_id_listeners and domain_listeners:
+                # A listener may be registered for both the entity_id and domain
+                match_all_listeners = [
+                    *dict.fromkeys(entity_id_listeners + domain_listeners),
+                    *match_all_listeners,
+                ]
+            elif entity_id_listeners or domain_listeners:
+                match_all_listeners = (
+                    entity_id_listeners or domain_listeners
+                ) + match_all_listeners
+
+        if (
+            job_monitor := self._job_monitor
+        ) is not None and not job_monitor.async_should_sample():
+            job_monitor = None
 
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
@@ -1571,10 +1648,19 @@ class EventBus:
                     context,
                 )
 
+            if job_monitor is None or job.job_type is not HassJobType.Callback:
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+                continue
+
+            start = time.perf_counter()
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
+            job_monitor.async_record(event_type, job, time.perf_counter() - start)
 
     def listen(
         self,
@@ -1639,6 +1725,46 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_entities(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        *,
+        entity_ids: Iterable[str] = (),
+        domains: Iterable[str] = (),
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for entity_ids or domains.
+
+        The listener is only called for events with an entity_id in the
+        event data that is one of the entity_ids or in one of the domains.
+        Listeners are looked up by the entity_id and domain when the event
+        is fired instead of running an event_filter for every listener.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        listener callable should run for a matching event.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Entity listeners require an event type")
+        if not (keys := {*entity_ids, *domains}):
+            raise HomeAssistantError("Entity listeners require entity_ids or domains")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type}"),
+            event_filter,
+        )
+        keyed_listeners = self._keyed_listeners[event_type]
+        for key in keys:
+            keyed_listeners[key].append(filterable_job)
+        return functools.partial(
+            self._async_remove_entities_listener, event_type, keys, filterable_job
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1739,6 +1865,34 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_entities_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        keys: set[str],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener of a specific event_type for entity_ids or domains.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners: dict[str, list[_FilterableJobType[Any]]] = (
+            self._keyed_listeners.get(event_type, {})
+        )
+        try:
+            for key in keys:
+                filterable_jobs = keyed_listeners.get(key, EMPTY_LIST)
+                filterable_jobs.remove(filterable_job)
+                if not filterable_jobs:
+                    del keyed_listeners[key]
+        except ValueError:
+            # ValueError if listener did not exist for an entity_id or domain
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+        if not keyed_listeners:
+            self._keyed_listeners.pop(event_type, None)
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -2090,10 +2244,96 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# The states are spread over this many buckets for snapshots, so a change
+# only copies the bucket of the entity when a snapshot still shares it
+_SNAPSHOT_BUCKETS = 256
+_SNAPSHOT_BUCKET_MASK = _SNAPSHOT_BUCKETS - 1
+
+
+class StatesSnapshot(Mapping[str, State]):
+    """Immutable view of the states at a version of the state machine.
+
+    Snapshots are safe to read from any thread and are shared between all
+    readers until the state machine changes again. The buckets of the
+    states are shared with the state machine, which copies a bucket
+    before it changes it. Each state is stored with the order in which
+    its entity was added, to iterate in the same order as the state machine.
+    """
+
+    __slots__ = ("_buckets", "_domain_index", "_len", "_ordered", "version")
+
+    def __init__(
+        self,
+        version: int,
+        buckets: tuple[dict[str, tuple[int, State]], ...],
+        length: int,
+    ) -> None:
+        """Initialize the snapshot."""
+        self.version = version
+        self._buckets = buckets
+        self._len = length
+        self._ordered: tuple[State, ...] | None = None
+        self._domain_index: dict[str, tuple[State, ...]] | None = None
+
+    def __getitem__(self, key: str) -> State:
+        """Return the state of an entity."""
+        return self._buckets[hash(key) & _SNAPSHOT_BUCKET_MASK][key][1]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity_ids."""
+        return (state.entity_id for state in self._ordered_states())
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return self._len
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<StatesSnapshot version={self.version} states={self._len}>"
+
+    def _ordered_states(self) -> tuple[State, ...]:
+        """Return the states in the order their entities were added.
+
+        Built on first use; concurrent readers may build it twice,
+        which is harmless as the snapshot never changes.
+        """
+        if (ordered := self._ordered) is None:
+            ordered = self._ordered = tuple(
+                state
+                for _, state in sorted(
+                    chain.from_iterable(bucket.values() for bucket in self._buckets),
+                    key=itemgetter(0),
+                )
+            )
+        return ordered
+
+    def domain_states(self, domain: str) -> tuple[State, ...]:
+        """Get all states for a domain."""
+        if (domain_index := self._domain_index) is None:
+            index: defaultdict[str, list[State]] = defaultdict(list)
+            for state in self._ordered_states():
+                index[state.domain].append(state)
+            domain_index = self._domain_index = {
+                key: tuple(states) for key, states in index.items()
+            }
+        return domain_index.get(domain, ())
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_buckets",
+        "_bus",
+        "_loop",
+        "_reservations",
+        "_sequence",
+        "_shared",
+        "_snapshot",
+        "_states",
+        "_states_data",
+        "_version",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2104,6 +2344,17 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # The version is increased on every change to the states and
+        # the current snapshot is dropped so it does not keep
+        # replaced states alive. The buckets shared with snapshots are
+        # flagged per bucket to copy a bucket before it is changed.
+        self._version = 0
+        self._snapshot: StatesSnapshot | None = None
+        self._sequence = 0
+        self._buckets: list[dict[str, tuple[int, State]]] = [
+            {} for _ in range(_SNAPSHOT_BUCKETS)
+        ]
+        self._shared = [False] * _SNAPSHOT_BUCKETS
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2174,6 +2425,61 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @property
+    def version(self) -> int:
+        """Return the version of the states, increased on every change.
+
+        Async friendly.
+        """
+        return self._version
+
+    def snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of all states.
+
+        The published snapshot is returned without a round trip to the
+        event loop when the states did not change since it was created.
+        """
+        if (snapshot := self._snapshot) is not None:
+            return snapshot
+        return run_callback_threadsafe(self._loop, self.async_snapshot).result()
+
+    @callback
+    def async_snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of all states.
+
+        A new snapshot only references the buckets of the states, the
+        buckets are copied on the next change to them instead.
+
+        This method must be run in the event loop.
+        """
+        if (snapshot := self._snapshot) is None:
+            snapshot = self._snapshot = StatesSnapshot(
+                self._version, tuple(self._buckets), len(self._states_data)
+            )
+            self._shared = [True] * _SNAPSHOT_BUCKETS
+        return snapshot
+
+    @callback
+    def _async_update_bucket(self, entity_id: str, state: State | None) -> None:
+        """Update the snapshot bucket of an entity, copying it if it is shared.
+
+        This method must be run in the event loop.
+        """
+        self._version += 1
+        self._snapshot = None
+        idx = hash(entity_id) & _SNAPSHOT_BUCKET_MASK
+        bucket = self._buckets[idx]
+        if self._shared[idx]:
+            bucket = self._buckets[idx] = bucket.copy()
+            self._shared[idx] = False
+        if state is None:
+            del bucket[entity_id]
+        elif (entry := bucket.get(entity_id)) is not None:
+            bucket[entity_id] = (entry[0], state)
+        else:
+            self._sequence += 1
+            bucket[entity_id] = (self._sequence, state)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2215,6 +2521,7 @@ class StateMachine:
         if old_state is None:
             return False
 
+        self._async_update_bucket(entity_id, None)
         old_state.expire()
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
@@ -2416,6 +2723,7 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._async_update_bucket(entity_id, state)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -1013,6 +1013,10 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # Number of renders after a state change, and the number of renders
+        # skipped because the state change did not affect the template
+        self.render_count = 0
+        self.skipped_render_count = 0
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -1157,6 +1161,7 @@ class TrackTemplateResultInfo:
             info = self._info[template]
 
             if not _event_triggers_rerender(event, info):
+                self.skipped_render_count += 1
                 return False
 
             had_timer = self._rate_limit.async_has_timer(template)
@@ -1179,6 +1184,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        self.render_count += 1
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
@@ -1980,11 +1986,22 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        # Templates that only read the state of the entity
+        # do not change when only the attributes change
+        return (
+            new_state is None
+            or old_state is None
+            or new_state.state != old_state.state
+            or entity_id not in info.entities_state_only
+            or info.all_states
+            or new_state.domain in info.domains
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
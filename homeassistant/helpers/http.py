@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
 from contextvars import ContextVar
 from http import HTTPStatus
 import inspect
 import logging
 from typing import Any, Final
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.typedefs import LooseHeaders
 from aiohttp.web import AppKey, Request
 from aiohttp.web_exceptions import (
@@ -21,7 +21,7 @@ from aiohttp.web_urldispatcher import AbstractResource, AbstractRoute
 import voluptuous as vol
 
 from homeassistant import exceptions
-from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.const import CONTENT_TYPE_JSON, CONTENT_TYPE_NDJSON
 from homeassistant.core import Context, HomeAssistant, is_callback
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, format_unserializable_data
 
@@ -161,6 +161,34 @@ class HomeAssistantView:
             data["code"] = message_code
         return self.json(data, status_code, headers=headers)
 
+    @staticmethod
+    def ndjson_requested(request: web.Request) -> bool:
+        """Return if the client accepts a newline-delimited JSON response."""
+        return CONTENT_TYPE_NDJSON in request.headers.get(hdrs.ACCEPT, "")
+
+    @staticmethod
+    async def ndjson(
+        request: web.Request, chunks: Iterable[bytes] | AsyncIterable[bytes]
+    ) -> web.StreamResponse:
+        """Stream a newline-delimited JSON response.
+
+        Each chunk must hold one or more complete JSON lines. The chunks
+        are written as they are produced, also when they come from an
+        async iterable, so the response is never held in memory as a whole.
+        """
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_NDJSON
+        response.enable_compression()
+        await response.prepare(request)
+        if isinstance(chunks, AsyncIterable):
+            async for chunk in chunks:
+                await response.write(chunk)
+        else:
+            for chunk in chunks:
+                await response.write(chunk)
+        await response.write_eof()
+        return response
+
     def register(
         self, hass: HomeAssistant, app: web.Application, router: web.UrlDispatcher
     ) -> None:
@@ -28,9 +28,18 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
+STORAGE_JOURNAL_KEY = "core.restore_state_journal"
+STORAGE_JOURNAL_VERSION = 1
+
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between compacting the journal into a full dump of the states
+STATE_COMPACT_INTERVAL = timedelta(hours=24)
+
+# Compact earlier once the journal holds this share of the stored states
+STATE_COMPACT_RATIO = 0.5
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -108,7 +117,13 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
 
 
 class RestoreStateData:
-    """Helper class for managing the helper saved data."""
+    """Helper class for managing the helper saved data.
+
+    The states are stored as a full dump, and a journal of the states that
+    changed since. Periodic dumps and the dump at shutdown only write the
+    journal. The journal is compacted into a full dump at startup, once a
+    day, and when it holds a large share of the states.
+    """
 
     @classmethod
     async def async_save_persistent_states(cls, hass: HomeAssistant) -> None:
@@ -121,8 +136,19 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal_store = Store[dict[str, Any]](
+            hass, STORAGE_JOURNAL_VERSION, STORAGE_JOURNAL_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Time of the last full dump
+        self._compacted: datetime | None = None
+        # The state and extra data of the stored states as last dumped
+        self._dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        # Stored states changed since the last full dump, and if they were
+        # of a current entity when they were dumped
+        self._journal_states: dict[str, tuple[StoredState, bool]] = {}
+        self._journal_removed: set[str] = set()
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -146,13 +172,51 @@ class RestoreStateData:
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
-        else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            return
+
+        self.last_states = {
+            item["state"]["entity_id"]: StoredState.from_dict(item)
+            for item in stored_states
+            if valid_entity_id(item["state"]["entity_id"])
+        }
+
+        try:
+            journal = await self.journal_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading journal of last states", exc_info=exc)
+            journal = None
+
+        if journal is not None:
+            self._async_apply_journal(journal)
+        _LOGGER.debug("Created cache with %s", list(self.last_states))
+
+    @callback
+    def _async_apply_journal(self, journal: dict[str, Any]) -> None:
+        """Apply the states that changed since the full dump."""
+        compacted = _parse_datetime(journal["compacted"])
+        dumped = _parse_datetime(journal["dumped"])
+        last_states = self.last_states
+
+        # A journal older than the full dump was left behind when stopping
+        # between writing the full dump and the new journal
+        if any(
+            stored_state.last_seen > compacted for stored_state in last_states.values()
+        ):
+            _LOGGER.debug("Ignoring journal of last states from %s", compacted)
+            return
+
+        for entity_id in journal["removed"]:
+            last_states.pop(entity_id, None)
+
+        # States of current entities that did not change were still seen
+        # when the journal was written
+        for stored_state in last_states.values():
+            if stored_state.last_seen == compacted:
+                stored_state.last_seen = dumped
+
+        for item in journal["states"]:
+            if valid_entity_id(entity_id := item["state"]["entity_id"]):
+                last_states[entity_id] = StoredState.from_dict(item)
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -162,7 +226,11 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
-        now = dt_util.utcnow()
+        return self._async_get_stored_states(dt_util.utcnow())
+
+    @callback
+    def _async_get_stored_states(self, now: datetime) -> list[StoredState]:
+        """Get the set of states which should be stored, seen at now."""
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_states_by_entity_id = {
@@ -200,42 +268,132 @@ class RestoreStateData:
 
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
+        now = dt_util.utcnow()
+        await self._async_dump_all_states(now, self._async_get_stored_states(now))
+
+    async def _async_dump_all_states(
+        self, now: datetime, stored_states: list[StoredState]
+    ) -> None:
+        """Save the stored states as a full dump and start a new journal."""
         _LOGGER.debug("Dumping states")
+        dumped = {
+            stored_state.state.entity_id: (
+                stored_state.state,
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None,
+            )
+            for stored_state in stored_states
+        }
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._compacted = now
+        self._dumped = dumped
+        self._journal_states.clear()
+        self._journal_removed.clear()
+        await self._async_save_journal(now)
+
+    async def async_dump_changed_states(self, compact: bool = True) -> None:
+        """Save the states that changed since the last dump to the journal.
+
+        When compact is set and the journal is due to be compacted, the
+        states are saved as a full dump instead.
+        """
+        now = dt_util.utcnow()
+        stored_states = self._async_get_stored_states(now)
+        if self._compacted is None:
+            await self._async_dump_all_states(now, stored_states)
+            return
+
+        current_states = self.hass.states
+        dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        for stored_state in stored_states:
+            state = stored_state.state
+            entity_id = state.entity_id
+            extra_data = (
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None
+            )
+            dumped[entity_id] = (state, extra_data)
+            if (
+                (previous := self._dumped.get(entity_id)) is None
+                or previous[0] is not state
+                or previous[1] != extra_data
+            ):
+                self._journal_states[entity_id] = (
+                    stored_state,
+                    current_states.get(entity_id) is state,
+                )
+                self._journal_removed.discard(entity_id)
+
+        for entity_id in self._dumped.keys() - dumped.keys():
+            self._journal_states.pop(entity_id, None)
+            self._journal_removed.add(entity_id)
+        self._dumped = dumped
+
+        if compact and (
+            now - self._compacted >= STATE_COMPACT_INTERVAL
+            or len(self._journal_states) + len(self._journal_removed)
+            > len(dumped) * STATE_COMPACT_RATIO
+        ):
+            await self._async_dump_all_states(now, stored_states)
+            return
+
+        _LOGGER.debug(
+            "Dumping %s changed and %s removed states",
+            len(self._journal_states),
+            len(self._journal_removed),
+        )
+        await self._async_save_journal(now)
+
+    async def _async_save_journal(self, now: datetime) -> None:
+        """Save the states changed since the last full dump."""
+        try:
+            await self.journal_store.async_save(
+                {
+                    "compacted": self._compacted,
+                    "dumped": now,
+                    # States of current entities were seen now
+                    "states": [
+                        stored_state.as_dict() | {"last_seen": now}
+                        if current
+                        else stored_state.as_dict()
+                        for stored_state, current in self._journal_states.values()
+                    ],
+                    "removed": list(self._journal_removed),
+                }
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
-        async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
         self.hass.async_create_task_internal(
-            _async_dump_states(), "RestoreStateData dump"
+            self.async_dump_states(), "RestoreStateData dump"
         )
 
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states(compact=False)
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -268,6 +426,13 @@ class RestoreStateData:
         del self.entities[entity_id]
 
 
+def _parse_datetime(value: datetime | str) -> datetime:
+    """Parse a datetime loaded from storage."""
+    if isinstance(value, str):
+        return cast(datetime, dt_util.parse_datetime(value))
+    return value
+
+
 class RestoreEntity(Entity):
     """Mixin class for restoring previous entity state."""
 
@@ -76,6 +76,11 @@ from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.thread import ThreadWithException
 
+from .bytecode_cache import (
+    TemplateBytecodeCache,
+    async_load_bytecode_cache as async_load_bytecode_cache,
+    get_bytecode_cache,
+)
 from .context import (
     TemplateContextManager as TemplateContextManager,
     render_with_context,
@@ -913,7 +918,10 @@ class TemplateStateBase(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := render_info_cv.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item == "state":
+                    render_info.entities_state_only.add(self._entity_id)  # type: ignore[attr-defined]
+                else:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -932,7 +940,8 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        if self._collect and (render_info := render_info_cv.get()):
+            render_info.entities_state_only.add(self._entity_id)  # type: ignore[attr-defined]
         return self._state.state
 
     @property
@@ -2464,6 +2473,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
         self.limited = limited
+        self.template_bytecode_cache: TemplateBytecodeCache | None = None
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -2540,6 +2550,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         # This environment has access to hass, attach its loader to enable imports.
         self.loader = _get_hass_loader(hass)
+        self.template_bytecode_cache = get_bytecode_cache(hass)
 
         # We mark these as a context functions to ensure they get
         # evaluated fresh with every execution, rather than executed
@@ -2821,7 +2832,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (bytecode_cache := self.template_bytecode_cache) is None or not isinstance(
+            source, str
+        ):
+            compiled = super().compile(source)
+        else:
+            key = bytecode_cache.key(source, self.limited)
+            if (cached := bytecode_cache.get(key)) is not None:
+                compiled = cached
+            else:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -0,0 +1,175 @@
+"""Persistent cache of compiled template code for Home Assistant."""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+import logging
+import marshal
+import os
+from types import CodeType
+from typing import Any
+
+import jinja2
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+    __version__,
+)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TEMPLATE_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey(
+    "template.bytecode_cache"
+)
+STORAGE_KEY = "core.template_bytecode"
+
+# The cache is discarded when Home Assistant, Jinja or the Python
+# bytecode format changes, as the compiled code depends on all of them.
+CACHE_VERSION = f"{__version__}-{jinja2.__version__}-{MAGIC_NUMBER.hex()}"
+
+# Templates rendered on the fly would otherwise grow the cache without
+# bound, the least recently used code is dropped first
+MAX_ENTRIES = 2048
+
+
+class TemplateBytecodeCache:
+    """Cache the compiled code of templates across restarts.
+
+    The code is kept marshaled and only unmarshaled when a template
+    with the same source is compiled again. At most MAX_ENTRIES entries
+    are kept.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._path = hass.config.path(STORAGE_DIR, STORAGE_KEY)
+        # Code loaded from disk that was not requested yet
+        self._stored: dict[str, bytes] = {}
+        # Code compiled or requested since Home Assistant started, ordered
+        # from least to most recently used
+        self._used: dict[str, bytes] = {}
+        self._dirty = False
+
+    @staticmethod
+    def key(source: str, limited: bool | None) -> str:
+        """Return the cache key of a template source."""
+        digest = sha256(source.encode()).hexdigest()
+        return f"limited-{digest}" if limited else digest
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code for a key."""
+        if (data := self._used.pop(key, None)) is None and (
+            data := self._stored.pop(key, None)
+        ) is None:
+            return None
+        self._add_used(key, data)
+        try:
+            code = marshal.loads(data)
+        except (EOFError, TypeError, ValueError):
+            del self._used[key]
+            return None
+        if type(code) is not CodeType:
+            del self._used[key]
+            return None
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the compiled code for a key."""
+        self._used.pop(key, None)
+        self._add_used(key, marshal.dumps(code))
+        self._dirty = True
+
+    def _add_used(self, key: str, data: bytes) -> None:
+        """Add code as the most recently used and drop the least recently used."""
+        used = self._used
+        used[key] = data
+        if len(used) > MAX_ENTRIES:
+            del used[next(iter(used))]
+
+    async def async_load(self, hass: HomeAssistant) -> None:
+        """Load the cache and save it after start and on shutdown."""
+        stored = await hass.async_add_executor_job(self._load)
+        used = self._used
+        self._stored = {
+            key: data
+            for key, data in list(stored.items())[-MAX_ENTRIES:]
+            if key not in used
+        }
+
+        async def _async_save_after_start(_: Event) -> None:
+            """Save the code compiled during startup."""
+            if self._dirty:
+                await self.async_save(hass, False)
+
+        async def _async_save_on_final_write(_: Event) -> None:
+            """Save the code used since start and drop the rest."""
+            if self._dirty or self._stored:
+                await self.async_save(hass, True)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_after_start)
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_on_final_write
+        )
+
+    async def async_save(self, hass: HomeAssistant, prune: bool) -> None:
+        """Save the cache.
+
+        If prune is set, only the code of the templates that were used
+        since Home Assistant started is kept.
+        """
+        if prune:
+            entries = dict(self._used)
+            self._stored.clear()
+        else:
+            # Entries are ordered from least to most recently used
+            entries = dict(list({**self._stored, **self._used}.items())[-MAX_ENTRIES:])
+        self._dirty = False
+        await hass.async_add_executor_job(self._save, entries)
+
+    def _load(self) -> dict[str, bytes]:
+        """Load the marshaled code from disk."""
+        try:
+            with open(self._path, "rb") as fdesc:
+                data: Any = marshal.load(fdesc)
+        except FileNotFoundError:
+            return {}
+        except (EOFError, OSError, TypeError, ValueError) as err:
+            _LOGGER.warning("Unable to load template bytecode cache: %s", err)
+            return {}
+        if (
+            type(data) is not dict
+            or data.get("version") != CACHE_VERSION
+            or type(entries := data.get("entries")) is not dict
+        ):
+            return {}
+        return entries
+
+    def _save(self, entries: dict[str, bytes]) -> None:
+        """Write the marshaled code to disk."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        try:
+            write_utf8_file(
+                self._path,
+                marshal.dumps({"version": CACHE_VERSION, "entries": entries}),
+                mode="wb",
+            )
+        except WriteError as err:
+            _LOGGER.warning("Unable to save template bytecode cache: %s", err)
+
+
+@singleton(DATA_TEMPLATE_BYTECODE_CACHE)
+def get_bytecode_cache(hass: HomeAssistant) -> TemplateBytecodeCache:
+    """Return the template bytecode cache."""
+    return TemplateBytecodeCache(hass)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the template bytecode cache."""
+    await get_bytecode_cache(hass).async_load(hass)
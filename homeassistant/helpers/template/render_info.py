@@ -45,6 +45,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entities_state_only",
         "exception",
         "filter",
         "filter_lifecycle",
@@ -68,6 +69,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only the state was read, they are
+        # added to entities when frozen
+        self.entities_state_only: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -80,6 +84,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entities_state_only={self.entities_state_only}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -122,7 +127,8 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
-        self.entities = frozenset(self.entities)
+        self.entities_state_only = frozenset(self.entities_state_only - self.entities)
+        self.entities = frozenset({*self.entities, *self.entities_state_only})
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import importlib
@@ -137,6 +138,7 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("import_times")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -154,6 +156,9 @@ IMPORT_EVENT_LOOP_WARNING = (
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+# Number of threads used to import independent integrations at the same time
+MAX_PARALLEL_IMPORTS = 4
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -275,6 +280,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -770,6 +776,7 @@ class Integration:
 
         self._platforms_to_preload = hass.data[DATA_PRELOAD_PLATFORMS]
         self._component_future: asyncio.Future[ComponentProtocol] | None = None
+        self._prefetch_future: asyncio.Future[None] | None = None
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
@@ -978,11 +985,18 @@ class Integration:
         if domain in (cache := self._cache):
             return cache[domain]
 
+        if self._prefetch_future:
+            # Wait for the import started by async_prefetch_components;
+            # if it failed, the import is tried again below.
+            await self._prefetch_future
+            if domain in cache:
+                return cache[domain]
+
         if self._component_future:
             return await self._component_future
 
-        if debug := _LOGGER.isEnabledFor(logging.DEBUG):
-            start = time.perf_counter()
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        start = time.perf_counter()
 
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
@@ -992,11 +1006,13 @@ class Integration:
         )
         if not load_executor:
             comp = self._get_component()
+            import_time = time.perf_counter() - start
+            self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[domain] = import_time
             if debug:
                 _LOGGER.debug(
                     "Component %s import took %.3f seconds (loaded_executor=False)",
                     self.domain,
-                    time.perf_counter() - start,
+                    import_time,
                 )
             return comp
 
@@ -1028,16 +1044,44 @@ class Integration:
         finally:
             self._component_future = None
 
+        import_time = time.perf_counter() - start
+        self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[domain] = import_time
         if debug:
             _LOGGER.debug(
                 "Component %s import took %.3f seconds (loaded_executor=%s)",
                 self.domain,
-                time.perf_counter() - start,
+                import_time,
                 load_executor,
             )
 
         return comp
 
+    async def async_prefetch_component(self, executor: Executor) -> None:
+        """Import the component in the executor ahead of its setup.
+
+        Any error is ignored and the import is left to
+        async_get_component, which imports it again and raises the error.
+        """
+        if (
+            self.domain in self._cache
+            or self._component_future
+            or self._prefetch_future
+        ):
+            return
+        self._prefetch_future = future = self.hass.loop.create_future()
+        start = time.perf_counter()
+        try:
+            await self.hass.loop.run_in_executor(executor, self._get_component, True)
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("Failed to prefetch %s", self.domain, exc_info=ex)
+        else:
+            self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[self.domain] = (
+                time.perf_counter() - start
+            )
+        finally:
+            self._prefetch_future = None
+            future.set_result(None)
+
     def get_component(self) -> ComponentProtocol:
         """Return the component.
 
@@ -1453,6 +1497,75 @@ class _ResolveDependenciesCache(_ResolveDependenciesCacheProtocol):
         itg._all_dependencies = all_dependencies  # noqa: SLF001
 
 
+def _group_by_dependency_level(
+    integrations: Iterable[Integration],
+) -> list[list[Integration]]:
+    """Group integrations so each group only depends on earlier groups."""
+    cache = _ResolveDependenciesCache()
+    dependencies = {
+        itg.domain: deps if isinstance(deps := cache.get(itg), set) else set()
+        for itg in integrations
+    }
+    # The dependencies of a dependency are a subset of the dependencies
+    # of the integration, so sorting by the number of dependencies makes
+    # sure the level of all dependencies is known.
+    levels: dict[str, int] = {}
+    groups: list[list[Integration]] = []
+    for itg in sorted(integrations, key=lambda itg: len(dependencies[itg.domain])):
+        level = max(
+            (levels[dep] + 1 for dep in dependencies[itg.domain] if dep in levels),
+            default=0,
+        )
+        levels[itg.domain] = level
+        if level == len(groups):
+            groups.append([])
+        groups[level].append(itg)
+    return groups
+
+
+async def async_prefetch_components(
+    hass: HomeAssistant, integrations: Iterable[Integration]
+) -> None:
+    """Import the components of integrations in parallel.
+
+    The import executor only has a single thread, so importing the
+    components of many integrations during startup is serialized.
+    Integrations that do not depend on each other are imported
+    at the same time in a separate pool, one dependency level after
+    the other to avoid waiting for the import lock of a dependency
+    that is being imported by another thread.
+
+    Errors are ignored here; the component is imported again
+    in the import executor when the integration is set up.
+    """
+    if not (
+        groups := _group_by_dependency_level(
+            [
+                itg
+                for itg in integrations
+                if itg.import_executor and itg.pkg_path not in sys.modules
+            ]
+        )
+    ):
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=MAX_PARALLEL_IMPORTS, thread_name_prefix="ImportPrefetch"
+    )
+    try:
+        for group in groups:
+            await asyncio.gather(
+                *(itg.async_prefetch_component(executor) for itg in group)
+            )
+    finally:
+        await hass.async_add_executor_job(executor.shutdown)
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return the time it took to import the component of each integration."""
+    return hass.data.get(DATA_IMPORT_TIMES, {})
+
+
 async def resolve_integrations_dependencies(
     hass: HomeAssistant, integrations: Iterable[Integration]
 ) -> dict[str, set[str]]:
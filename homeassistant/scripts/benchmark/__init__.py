@@ -7,10 +7,17 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import tempfile
+import threading
 from timeit import default_timer as timer
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    recorder as recorder_helper,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -223,6 +230,59 @@ async def state_changed_event_filter_helper(hass: core.HomeAssistant) -> float:
     return timer() - start
 
 
+async def _state_changed_entity_listeners(
+    hass: core.HomeAssistant, keyed: bool
+) -> float:
+    """Set 100k states of 5000 entities with 200 listeners for 25 entities each."""
+    count = 0
+    entity_ids = [f"sensor.temperature_{idx}" for idx in range(5000)]
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(0, 5000, 25):
+        listener_entity_ids = set(entity_ids[idx : idx + 25])
+        if keyed:
+            hass.bus.async_listen_entities(
+                EVENT_STATE_CHANGED, listener, entity_ids=listener_entity_ids
+            )
+            continue
+
+        @core.callback
+        def event_filter(event_data, entity_ids=listener_entity_ids):
+            """Filter the entity_ids."""
+            return event_data["entity_id"] in entity_ids
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for value in range(20):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(value))
+
+    await hass.async_block_till_done()
+
+    assert count == 10**5
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_filtered_listeners(hass: core.HomeAssistant) -> float:
+    """Set 100k states with 200 listeners that filter by entity_id."""
+    return await _state_changed_entity_listeners(hass, False)
+
+
+@benchmark
+async def state_changed_entities_listeners(hass: core.HomeAssistant) -> float:
+    """Set 100k states with 200 listeners keyed by entity_id."""
+    return await _state_changed_entity_listeners(hass, True)
+
+
 @benchmark
 async def filtering_entity_id(hass: core.HomeAssistant) -> float:
     """Run a 100k state changes through entity filter."""
@@ -308,3 +368,261 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_topic_matching(hass: core.HomeAssistant) -> float:
+    """Match 100k topics against 10k wildcard subscriptions."""
+    from homeassistant.components.mqtt.util import TopicTrie  # noqa: PLC0415
+
+    trie: TopicTrie[int] = TopicTrie()
+    for idx in range(10**4):
+        trie.add(f"zigbee2mqtt/device_{idx}/+", idx)
+        trie.add(f"tasmota/discovery/{idx}/#", idx)
+    topics = [f"zigbee2mqtt/device_{idx}/state" for idx in range(0, 10**4, 100)]
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(10**5):
+        assert trie.match(topics[i % size])
+
+    return timer() - start
+
+
+async def _recorder_write_states(hass: core.HomeAssistant, bulk_write: bool) -> float:
+    """Record 100k state changes of 500 entities in a SQLite database."""
+    from homeassistant.components.recorder import Recorder  # noqa: PLC0415
+
+    events: list[core.Event] = []
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx in range(10**5):
+        hass.states.async_set(
+            f"sensor.energy_meter_{idx % 500}", str(idx), {"unit": "kWh"}
+        )
+    await hass.async_block_till_done()
+
+    recorder_helper.async_initialize_recorder(hass)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        instance = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=1,
+            commit_interval=1,
+            uri=f"sqlite:///{tmp_dir}/benchmark.db",
+            db_max_retries=1,
+            db_retry_wait=1,
+            bulk_write=bulk_write,
+            entity_filter=None,
+            exclude_event_types=set(),
+        )
+
+        def _write_states() -> float:
+            """Write the states like the recorder thread does."""
+            instance.recorder_and_worker_thread_ids.add(threading.get_ident())
+            instance._setup_connection()  # noqa: SLF001
+            instance.states_meta_manager.active = True
+            instance._setup_run()  # noqa: SLF001
+
+            start = timer()
+
+            # Commit every 200 states, as a busy system would
+            # with the default commit interval.
+            for idx, event in enumerate(events, 1):
+                instance._process_one_event(event)  # noqa: SLF001
+                if idx % 200 == 0:
+                    instance._commit_event_session_or_retry()  # noqa: SLF001
+            instance._commit_event_session_or_retry()  # noqa: SLF001
+
+            runtime = timer() - start
+            instance._close_event_session()  # noqa: SLF001
+            instance._close_connection()  # noqa: SLF001
+            return runtime
+
+        return await hass.async_add_executor_job(_write_states)
+
+
+@benchmark
+async def recorder_write_states(hass: core.HomeAssistant) -> float:
+    """Record 100k state changes through the session flush."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_bulk_write_states(hass: core.HomeAssistant) -> float:
+    """Record 100k state changes with bulk writes."""
+    return await _recorder_write_states(hass, True)
+
+
+async def _recorder_purge(hass: core.HomeAssistant, repack: bool) -> float:
+    """Purge half of 100k recorded state changes."""
+    from homeassistant.components.recorder import Recorder  # noqa: PLC0415
+    from homeassistant.components.recorder.purge import purge_old_data  # noqa: PLC0415
+
+    events: list[core.Event] = []
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx in range(10**5):
+        hass.states.async_set(
+            f"sensor.energy_meter_{idx % 500}", str(idx), {"unit": "kWh"}
+        )
+    await hass.async_block_till_done()
+    purge_before = events[len(events) // 2].time_fired
+
+    recorder_helper.async_initialize_recorder(hass)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        instance = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=1,
+            commit_interval=1,
+            uri=f"sqlite:///{tmp_dir}/benchmark.db",
+            db_max_retries=1,
+            db_retry_wait=1,
+            bulk_write=True,
+            entity_filter=None,
+            exclude_event_types=set(),
+        )
+
+        def _purge() -> float:
+            """Purge like the recorder thread does."""
+            instance.recorder_and_worker_thread_ids.add(threading.get_ident())
+            instance._setup_connection()  # noqa: SLF001
+            instance.states_meta_manager.active = True
+            instance._setup_run()  # noqa: SLF001
+            for idx, event in enumerate(events, 1):
+                instance._process_one_event(event)  # noqa: SLF001
+                if idx % 1000 == 0:
+                    instance._commit_event_session_or_retry()  # noqa: SLF001
+            instance._commit_event_session_or_retry()  # noqa: SLF001
+            instance._close_event_session()  # noqa: SLF001
+
+            start = timer()
+
+            # The rows are deleted in batches until the purge is done,
+            # the last cycle repacks the database when asked to
+            while not purge_old_data(instance, purge_before, repack=repack):
+                pass
+
+            runtime = timer() - start
+            instance._close_connection()  # noqa: SLF001
+            return runtime
+
+        return await hass.async_add_executor_job(_purge)
+
+
+@benchmark
+async def recorder_purge(hass: core.HomeAssistant) -> float:
+    """Purge 50k state changes by deleting their rows."""
+    return await _recorder_purge(hass, False)
+
+
+@benchmark
+async def recorder_purge_repack(hass: core.HomeAssistant) -> float:
+    """Purge 50k state changes by deleting their rows and repack the database."""
+    return await _recorder_purge(hass, True)
+
+
+async def _read_states_from_executor(hass: core.HomeAssistant, snapshot: bool) -> float:
+    """Read the sensor states of 20k entities 1000 times from the executor."""
+    for idx in range(2 * 10**4):
+        domain = "sensor" if idx % 2 else "light"
+        hass.states.async_set(f"{domain}.entity_{idx}", "on", {"state_class": "total"})
+
+    def _read_states() -> int:
+        """Read the states like the sensor statistics do."""
+        if snapshot:
+            return len(hass.states.snapshot().domain_states("sensor"))
+        return len(hass.states.all("sensor"))
+
+    start = timer()
+
+    for idx in range(1000):
+        # A state change every 10 reads
+        if idx % 10 == 0:
+            hass.states.async_set("sensor.entity_1", str(idx))
+        assert await hass.async_add_executor_job(_read_states) == 10**4
+
+    return timer() - start
+
+
+@benchmark
+async def read_states_all(hass: core.HomeAssistant) -> float:
+    """Read the states of 20k entities with copies of the state machine."""
+    return await _read_states_from_executor(hass, False)
+
+
+@benchmark
+async def read_states_snapshot(hass: core.HomeAssistant) -> float:
+    """Read the states of 20k entities from the shared snapshot."""
+    return await _read_states_from_executor(hass, True)
+
+
+async def _statistics_sensor_updates(
+    hass: core.HomeAssistant, incremental: bool
+) -> float:
+    """Add 500 samples to statistics sensors with 20k samples each."""
+    from homeassistant.components.statistics.sensor import (  # noqa: PLC0415
+        StatisticsSensor,
+    )
+
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    sensors = [
+        StatisticsSensor(
+            hass,
+            source_entity_id="sensor.temperature",
+            name=characteristic,
+            unique_id=None,
+            state_characteristic=characteristic,
+            samples_max_buffer_size=2 * 10**4,
+            samples_max_age=None,
+            samples_keep_last=False,
+            precision=2,
+            percentile=90,
+        )
+        for characteristic in ("mean", "median", "percentile", "variance", "value_max")
+    ]
+    states = [
+        core.State("sensor.temperature", str(idx % 997 / 10))
+        for idx in range(2 * 10**4 + 500)
+    ]
+    for sensor in sensors:
+        if not incremental:
+            sensor._aggregator = None  # noqa: SLF001
+        for state in states[: 2 * 10**4]:
+            sensor._add_state_to_queue(state, state.last_updated_timestamp)  # noqa: SLF001
+
+    start = timer()
+
+    for state in states[2 * 10**4 :]:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state, state.last_updated_timestamp)  # noqa: SLF001
+            sensor._update_value()  # noqa: SLF001
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_updates(hass: core.HomeAssistant) -> float:
+    """Update statistics sensors by calculating over all samples."""
+    return await _statistics_sensor_updates(hass, False)
+
+
+@benchmark
+async def statistics_sensor_incremental_updates(hass: core.HomeAssistant) -> float:
+    """Update statistics sensors with incremental aggregators."""
+    return await _statistics_sensor_updates(hass, True)
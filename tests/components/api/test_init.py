@@ -818,6 +818,25 @@ async def test_states(
     assert json[1]["entity_id"] == "test.entity2"
 
 
+async def test_states_ndjson(
+    hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
+) -> None:
+    """Test streaming all states as newline-delimited JSON."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.entity2", "hello")
+    with patch("homeassistant.components.api.NDJSON_STATES_PER_CHUNK", 1):
+        resp = await mock_api_client.get(
+            const.URL_API_STATES, headers={"Accept": "application/x-ndjson"}
+        )
+    assert resp.status == HTTPStatus.OK
+    assert resp.content_type == "application/x-ndjson"
+    lines = (await resp.read()).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        json.loads(hass.states.get("test.entity").as_dict_json),
+        json.loads(hass.states.get("test.entity2").as_dict_json),
+    ]
+
+
 async def test_states_view_filters(
     hass: HomeAssistant,
     hass_read_only_user: MockUser,
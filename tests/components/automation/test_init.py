@@ -1891,6 +1891,33 @@ async def test_extraction_functions_not_setup(hass: HomeAssistant) -> None:
     assert automation.labels_in_automation(hass, "automation.test") == []
 
 
+async def test_extraction_functions_updated_on_reload(hass: HomeAssistant) -> None:
+    """Test automations referencing an entity are updated when reloading."""
+
+    def _config(entity_id: str) -> dict[str, Any]:
+        return {
+            "alias": "hello",
+            "trigger": {"platform": "state", "entity_id": entity_id},
+            "action": {"action": "test.automation"},
+        }
+
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: _config("light.old")}
+    )
+    assert automation.automations_with_entity(hass, "light.old") == ["automation.hello"]
+    assert automation.automations_with_entity(hass, "light.new") == []
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: _config("light.new")},
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert automation.automations_with_entity(hass, "light.old") == []
+    assert automation.automations_with_entity(hass, "light.new") == ["automation.hello"]
+
+
 async def test_extraction_functions_unknown_automation(hass: HomeAssistant) -> None:
     """Test extraction functions for an unknown automation."""
     assert await async_setup_component(hass, DOMAIN, {})
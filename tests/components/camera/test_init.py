@@ -1,11 +1,13 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Callable
 from http import HTTPStatus
 import io
 from types import ModuleType
 from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from aiohttp import ClientResponse
 import pytest
 from syrupy.assertion import SnapshotAssertion
 from webrtc_models import RTCIceCandidateInit
@@ -691,6 +693,114 @@ async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_camera_image_view_shares_images(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test concurrent and recent image requests share the camera fetches."""
+    client = await hass_client()
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    demo_camera._attr_frame_interval = 60
+    release = asyncio.Event()
+
+    async def _async_camera_image(
+        width: int | None = None, height: int | None = None
+    ) -> bytes:
+        await release.wait()
+        return b"Valid jpeg"
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with (
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch.object(
+            demo_camera, "async_camera_image", side_effect=_async_camera_image
+        ) as mock_camera_image,
+    ):
+        requests = [
+            hass.async_create_task(
+                client.get("/api/camera_proxy/camera.demo_camera?width=4&height=3")
+            )
+            for _ in range(3)
+        ]
+        while not mock_camera_image.called:
+            await asyncio.sleep(0.01)
+        # Let the other requests wait for the same fetch
+        await asyncio.sleep(0.1)
+        release.set()
+        for response in await asyncio.gather(*requests):
+            assert response.status == HTTPStatus.OK
+            assert await response.read() == EMPTY_8_6_JPEG
+        assert mock_camera_image.call_count == 1
+
+        # Requests with the same size are answered from the recent image
+        response = await client.get(
+            "/api/camera_proxy/camera.demo_camera?width=4&height=3"
+        )
+        assert await response.read() == EMPTY_8_6_JPEG
+        assert mock_camera_image.call_count == 1
+
+        # Requests without a size always fetch a new image
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert await response.read() == b"Valid jpeg"
+        assert mock_camera_image.call_count == 2
+
+        # Other sizes are scaled from the full size image
+        response = await client.get(
+            "/api/camera_proxy/camera.demo_camera?width=8&height=6"
+        )
+        assert await response.read() == EMPTY_8_6_JPEG
+        assert mock_camera_image.call_count == 2
+        assert turbo_jpeg.scale_with_quality.call_count == 2
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_camera_still_stream_viewers_share_images(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the viewers of an MJPEG stream from stills share the camera images."""
+    client = await hass_client()
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    async def _async_camera_image(
+        width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        return await images.get()
+
+    async def _async_read_image(response: ClientResponse) -> bytes:
+        # Skip the headers of the part
+        while (line := await response.content.readline()) != b"\r\n":
+            assert line
+        return await response.content.readline()
+
+    with patch.object(
+        demo_camera, "async_camera_image", side_effect=_async_camera_image
+    ):
+        images.put_nowait(b"image")
+        url = "/api/camera_proxy_stream/camera.demo_camera?interval=0.5"
+        response_1 = await client.get(url)
+        assert response_1.status == HTTPStatus.OK
+        assert await _async_read_image(response_1) == b"image\r\n"
+
+        # The second viewer gets the image fetched for the first one
+        response_2 = await client.get(url)
+        assert response_2.status == HTTPStatus.OK
+        assert await _async_read_image(response_2) == b"image\r\n"
+        assert images.empty()
+
+        # The streams of both viewers end with the camera stream
+        images.put_nowait(None)
+        await response_1.read()
+        await response_2.read()
+
+    assert not demo_camera._still_streams._streams
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_state_streaming(hass: HomeAssistant) -> None:
     """Camera state."""
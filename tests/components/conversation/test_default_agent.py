@@ -2942,13 +2942,138 @@ async def test_intent_cache_all_entities(hass: HomeAssistant) -> None:
     assert result is not None
     assert getattr(result, mark, None) is True
 
-    # Adding a new entity clears the cache
+    # Adding an entity with a name that is not in the text keeps the cache
     hass.states.async_set("light.new_light", "off")
     result = await agent.async_recognize_intent(user_input)
     assert result is not None
+    assert getattr(result, mark, None) is True
+
+    # Adding an entity with a name in the text clears the cache
+    hass.states.async_set("light.test", "off")
+    result = await agent.async_recognize_intent(user_input)
+    assert result is not None
     assert getattr(result, mark, None) is None
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test only the changed names are updated in the slot lists."""
+    agent = async_get_agent(hass)
+
+    entry = entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set(entry.entity_id, "off")
+    expose_entity(hass, entry.entity_id, True)
+    await hass.async_block_till_done()
+
+    user_input = ConversationInput(
+        text="turn on bedside lamp",
+        context=Context(),
+        conversation_id=None,
+        device_id=None,
+        satellite_id=None,
+        language=hass.config.language,
+        agent_id=None,
+    )
+    # Build the slot lists
+    await agent.async_recognize_intent(user_input)
+
+    with patch.object(
+        agent, "_get_entity_name_tuples", wraps=agent._get_entity_name_tuples
+    ) as mock_get_names:
+        entity_registry.async_update_entity(entry.entity_id, aliases={"bedside lamp"})
+        area_registry.async_create("bedroom")
+        await hass.async_block_till_done()
+
+        result = await agent.async_recognize_intent(user_input)
+        assert result is not None
+        assert result.entities["name"].value == "bedside lamp"
+
+        result = await agent.async_recognize_intent(
+            ConversationInput(
+                text="turn on the lights in the bedroom",
+                context=Context(),
+                conversation_id=None,
+                device_id=None,
+                satellite_id=None,
+                language=hass.config.language,
+                agent_id=None,
+            )
+        )
+        assert result is not None
+        assert result.entities["area"].value == "bedroom"
+
+    # Only the names of the changed entity were gathered again
+    assert mock_get_names.call_count == 1
+
+    # Unexposed entities are found after their names changed
+    expose_entity(hass, entry.entity_id, False)
+    entity_registry.async_update_entity(entry.entity_id, aliases={"reading lamp"})
+    await hass.async_block_till_done()
+
+    result = await agent.async_recognize_intent(
+        ConversationInput(
+            text="turn on reading lamp",
+            context=Context(),
+            conversation_id=None,
+            device_id=None,
+            satellite_id=None,
+            language=hass.config.language,
+            agent_id=None,
+        )
+    )
+    assert result is not None
+    assert result.entities["name"].value == "reading lamp"
+
+
+def test_entity_name_index() -> None:
+    """Test names are found after the tries are updated."""
+    index = default_agent.EntityNameIndex()
+
+    def _values(*names: str) -> list[default_agent.TextSlotValue]:
+        return [
+            default_agent.TextSlotValue.from_tuple((name, name), allow_template=False)
+            for name in names
+        ]
+
+    def _found(text: str) -> list[str]:
+        return sorted(value.value_out for value in index.find(text))
+
+    assert index.set("light.kitchen", _values("Kitchen", "Cooking light")) == {
+        "kitchen",
+        "cooking light",
+    }
+    index.update_tries()
+    assert _found("turn on kitchen") == ["Kitchen"]
+
+    # The same names do not change anything
+    assert index.set("light.kitchen", _values("Kitchen", "Cooking light")) == set()
+
+    # Changed names are found before the trie is built again
+    assert index.set("light.kitchen", _values("Kitchen light")) == {
+        "kitchen",
+        "cooking light",
+        "kitchen light",
+    }
+    index.update_tries()
+    assert _found("turn on kitchen light") == ["Kitchen light"]
+    assert _found("turn on cooking light") == []
+
+    for number in range(100):
+        index.set(f"light.number_{number}", _values(f"Number {number}"))
+    index.update_tries()
+    assert len(index) == 101
+    assert "Number 42" in _found("turn on number 42")
+
+    assert index.set("light.kitchen", []) == {"kitchen light"}
+    index.update_tries()
+    assert "light.kitchen" not in index
+    assert _found("turn on kitchen light") == []
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_intent_cache_fuzzy(hass: HomeAssistant) -> None:
     """Test that intent recognition results are cached for fuzzy matches."""
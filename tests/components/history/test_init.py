@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -450,6 +450,55 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_fetch_period_api_ndjson(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view streams newline-delimited JSON."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    hass.states.async_set("sensor.power", 0, {"attr": "any"})
+    hass.states.async_set("sensor.energy", 10, {"attr": "any"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", 50, {"attr": "any"})
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    url = (
+        f"/api/history/period/{now.isoformat()}"
+        "?filter_entity_id=sensor.power,sensor.energy"
+    )
+    response = await client.get(url)
+    assert response.status == HTTPStatus.OK
+    expected = await response.json()
+
+    response = await client.get(url, headers={"Accept": "application/x-ndjson"})
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/x-ndjson"
+    lines = (await response.read()).splitlines()
+    assert [json.loads(line) for line in lines] == expected
+    assert [[state["state"] for state in states] for states in expected] == [
+        ["0", "50"],
+        ["10"],
+    ]
+
+    # The entities are streamed in batches without changing the lines
+    with patch("homeassistant.components.history.NDJSON_ENTITIES_PER_QUERY", 1):
+        response = await client.get(url, headers={"Accept": "application/x-ndjson"})
+    assert response.status == HTTPStatus.OK
+    lines = (await response.read()).splitlines()
+    assert [json.loads(line) for line in lines] == expected
+
+    # An empty result is an empty body
+    future = dt_util.utcnow() + timedelta(days=1)
+    response = await client.get(
+        f"/api/history/period/{future.isoformat()}?filter_entity_id=sensor.power",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/x-ndjson"
+    assert await response.read() == b""
+
+
 async def test_fetch_period_api_with_no_timestamp(
     hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
 ) -> None:
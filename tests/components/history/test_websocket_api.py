@@ -173,6 +173,138 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period and stream downsample to max_points."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    values = [5, 1, 9, 4, 3, 7, 2, 8, 6, 0, 5, 4]
+    with freeze_time(now) as freezer:
+        for value in values:
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.power", str(value))
+            await async_recorder_block_till_done(hass)
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.power", "unavailable")
+        await async_recorder_block_till_done(hass)
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.power", "3")
+        await async_wait_recording_done(hass)
+    end_time = now + timedelta(seconds=20)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # The first and last states, the min and max of both halves
+    # and the state that is not numeric are kept
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "5",
+        "1",
+        "9",
+        "8",
+        "0",
+        "unavailable",
+        "3",
+    ]
+    lu = [state["lu"] for state in response["result"]["sensor.power"]]
+    assert lu == sorted(lu)
+
+    with freeze_time(end_time + timedelta(seconds=1)):
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/stream",
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "entity_ids": ["sensor.power"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "max_points": 4,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.power"]] == [
+        "5",
+        "1",
+        "9",
+        "8",
+        "0",
+        "unavailable",
+        "3",
+    ]
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_max_points_removed_entity(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test downsampling keeps the states of an entity that was removed."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for value in (5, 1, 9, 4):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.power", str(value))
+            await async_recorder_block_till_done(hass)
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_remove("sensor.power")
+        await async_recorder_block_till_done(hass)
+        for value in (3, 7, 2, 8):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.power", str(value))
+            await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    states = [state["s"] for state in response["result"]["sensor.power"]]
+    assert len(states) < 9
+    assert None in states
+    assert states[0] == "5"
+    assert states[-1] == "8"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
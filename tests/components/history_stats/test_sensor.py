@@ -1528,6 +1528,12 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor3").state == "0"
     assert hass.states.get("sensor.sensor4").state == "0.0"
 
+    # The recorded history is only read up to now, later state
+    # changes are followed as they happen
+    with freeze_time(t0):
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+
     past_next_update = start_time + timedelta(minutes=30)
     with (
         freeze_time(past_next_update),
@@ -2025,7 +2031,8 @@ async def test_history_stats_handles_floored_timestamps(
         await async_update_entity(hass, "sensor.sensor1")
         await hass.async_block_till_done()
 
-    assert last_times == (start_time, start_time)
+    # The shared history window is loaded without an end and clipped in memory
+    assert last_times == (start_time, None)
 
 
 async def test_unique_id(
@@ -12,7 +12,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -121,6 +121,56 @@ async def help_create_test_certificate_file(
     await hass.async_add_executor_job(_create_file)
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("sensor/kitchen/state", ["+/+/state", "sensor/#", "sensor/+/state", "#"]),
+        ("sensor/kitchen", ["sensor/#", "sensor/+", "#"]),
+        ("sensor", ["sensor/#", "#"]),
+        ("light/kitchen/state", ["+/+/state", "#"]),
+        ("sensor/kitchen/state/extra", ["sensor/#", "#"]),
+        ("$SYS/broker/uptime", ["$SYS/#"]),
+        ("other", ["#"]),
+    ],
+)
+def test_topic_trie_match(topic: str, expected: list[str]) -> None:
+    """Test matching topics against the topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in (
+        "+/+/state",
+        "sensor/#",
+        "sensor/+/state",
+        "sensor/+",
+        "#",
+        "$SYS/#",
+    ):
+        trie.add(topic_filter, topic_filter)
+    assert len(trie) == 6
+    assert trie.match(topic) == expected
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test adding and removing values from the topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("sensor/+/state", "first")
+    trie.add("sensor/+/state", "second")
+    trie.add("sensor/+/state", "first")
+    assert len(trie) == 2
+    assert trie.has_filter("sensor/+/state")
+    assert not trie.has_filter("sensor/+")
+    assert trie.match("sensor/kitchen/state") == ["first", "second"]
+
+    trie.remove("sensor/+/state", "first")
+    assert trie.match("sensor/kitchen/state") == ["second"]
+    trie.remove("sensor/+/state", "second")
+    assert len(trie) == 0
+    assert not trie.has_filter("sensor/+/state")
+    assert trie.match("sensor/kitchen/state") == []
+
+    with pytest.raises(KeyError):
+        trie.remove("sensor/+/state", "second")
+
+
 @pytest.mark.parametrize(
     ("option", "content"),
     [
@@ -1,5 +1,6 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
 import logging
@@ -22,6 +23,7 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_SOCKETS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_LOOP_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -31,10 +33,11 @@ from homeassistant.components.profiler import (
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    loop_monitor,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import dt as dt_util
 
@@ -273,6 +276,61 @@ async def test_log_scheduled(
     await hass.async_block_till_done()
 
 
+async def test_log_loop_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the event listeners and the loop lag are sampled while loaded."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    @callback
+    def _slow_listener(event: Event) -> None:
+        """Listen to the test event."""
+
+    async def _async_listener(event: Event) -> None:
+        """Listen to the test event in a task."""
+
+    hass.bus.async_listen("test_event", _slow_listener)
+    hass.bus.async_listen("test_event", _async_listener)
+
+    # Time the listeners of every event
+    with patch.object(loop_monitor, "SAMPLE_INTERVAL", 1):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        hass.bus.async_fire("test_event")
+        await asyncio.sleep(loop_monitor.LAG_INTERVAL * 2.5)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_LOG_LOOP_STATS, {}, blocking=True, return_response=True
+    )
+    assert response["loop_lag"]["count"] >= 1
+    listener = f"{__name__}.test_log_loop_stats.<locals>._slow_listener"
+    assert response["listeners"][listener]["count"] == 1
+    assert sum(response["listeners"][listener]["counts"]) == 1
+    # Only callbacks run to completion when the event is fired
+    assert (
+        f"{__name__}.test_log_loop_stats.<locals>._async_listener"
+        not in response["listeners"]
+    )
+    assert {
+        "listener": listener,
+        "event_type": "test_event",
+        "duration": response["listeners"][listener]["max"],
+    } in response["slowest"]
+    assert "Loop lag" in caplog.text
+    assert f"Slow listener: {listener} for test_event" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The listeners are no longer timed once unloaded
+    with patch.object(
+        loop_monitor.LoopMonitor, "async_record", side_effect=AssertionError
+    ):
+        hass.bus.async_fire("test_event")
+
+
 @pytest.mark.usefixtures("socket_enabled")
 async def test_dump_sockets(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -0,0 +1,124 @@
+"""The tests for the recorder state attributes manager."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from homeassistant.components.recorder.db_schema import StateAttributes, States
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    CACHE_SUFFIX,
+)
+from homeassistant.components.recorder.util import dburl_to_path, session_scope
+
+from ..common import async_wait_recording_done
+
+from tests.common import async_test_home_assistant
+from tests.typing import RecorderInstanceContextManager
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_cache_persisted_across_restarts(
+    async_test_recorder: RecorderInstanceContextManager, recorder_db_url: str
+) -> None:
+    """Test recorded attributes are resolved without a query after a restart."""
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass),
+    ):
+        hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "kWh"})
+        await async_wait_recording_done(hass)
+        await hass.async_stop()
+
+    cache_path = Path(f"{dburl_to_path(recorder_db_url)}{CACHE_SUFFIX}")
+    assert cache_path.exists()
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        manager = instance.state_attributes_manager
+        assert manager.cache_size == 2
+        # The cache is only valid until the database is written again
+        assert not cache_path.exists()
+        with patch.object(manager, "_load_from_hashes", side_effect=AssertionError):
+            hass.states.async_set("sensor.one", "3", {"unit_of_measurement": "W"})
+            await async_wait_recording_done(hass)
+        assert (manager.hits, manager.misses) == (1, 0)
+        await hass.async_stop()
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_cache_checked_against_database(
+    async_test_recorder: RecorderInstanceContextManager, recorder_db_url: str
+) -> None:
+    """Test cached attributes that changed in the database are not loaded."""
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass),
+    ):
+        hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+        await async_wait_recording_done(hass)
+        await hass.async_stop()
+
+    # Replace the attributes while Home Assistant is stopped, keeping the ids
+    engine = create_engine(recorder_db_url)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE state_attributes SET shared_attrs = "
+                '\'{"unit_of_measurement":"kW"}\''
+            )
+        )
+    engine.dispose()
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        manager = instance.state_attributes_manager
+        assert manager.cache_size == 0
+        hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "W"})
+        await async_wait_recording_done(hass)
+        assert (manager.hits, manager.misses) == (0, 1)
+
+        def _get_shared_attrs() -> str:
+            with session_scope(hass=hass, read_only=True) as session:
+                return session.execute(
+                    select(StateAttributes.shared_attrs)
+                    .join(States, States.attributes_id == StateAttributes.attributes_id)
+                    .where(States.state == "2")
+                ).scalar_one()
+
+        shared_attrs = await instance.async_add_executor_job(_get_shared_attrs)
+        assert shared_attrs == '{"unit_of_measurement":"W"}'
+        await hass.async_stop()
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_invalid_cache_is_ignored(
+    async_test_recorder: RecorderInstanceContextManager,
+    recorder_db_url: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an invalid cache is ignored and removed."""
+    cache_path = Path(f"{dburl_to_path(recorder_db_url)}{CACHE_SUFFIX}")
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(b"broken")
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        assert instance.state_attributes_manager.cache_size == 0
+        assert not cache_path.exists()
+        await hass.async_stop()
+
+    assert "The state attributes cache is invalid" in caplog.text
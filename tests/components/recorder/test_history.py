@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 from copy import copy
 from datetime import datetime, timedelta
@@ -9,6 +10,7 @@ import json
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import recorder
@@ -19,11 +21,13 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history.window import WINDOW_LINGER
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
@@ -34,6 +38,7 @@ from .common import (
     async_wait_recording_done,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceContextManager
 
 
@@ -751,6 +756,52 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+async def test_get_significant_compressed_state_columns(
+    hass: HomeAssistant,
+    minimal_response: bool,
+    no_attributes: bool,
+    significant_changes_only: bool,
+) -> None:
+    """Test compressed state columns match the compressed state format."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = [*states, "sensor.not_recorded"]
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        None,
+        True,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    columns = history.get_significant_compressed_state_columns(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        True,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+    assert list(columns) == list(hist)
+    for entity_id, compressed_states in hist.items():
+        assert list(columns[entity_id]) == compressed_states
+        assert columns[entity_id][-1] == compressed_states[-1]
+        assert columns[entity_id][1:] == compressed_states[1:]
+    assert json_loads(json_bytes(columns)) == json_loads(json_bytes(hist))
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
@@ -1039,3 +1090,111 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_async_state_changes_since_shares_window(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the recorded state changes of an entity are shared and followed."""
+    start = dt_util.utcnow()
+    for value in ("1", "2", "3"):
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set("sensor.test", value)
+    await async_wait_recording_done(hass)
+    recorded = history.state_changes_during_period(hass, start, None, "sensor.test")[
+        "sensor.test"
+    ]
+    middle = recorded[1].last_changed + timedelta(seconds=5)
+
+    real_state_changes_during_period = history.state_changes_during_period
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        side_effect=real_state_changes_during_period,
+    ) as state_changes_mock:
+        first, second = await asyncio.gather(
+            history.async_state_changes_since(hass, "sensor.test", start),
+            history.async_state_changes_since(
+                hass, "Sensor.Test", middle, include_start_time_state=False
+            ),
+        )
+        assert [state.state for state in first] == ["1", "2", "3"]
+        assert [state.state for state in second] == ["3"]
+
+        with_start_state = await history.async_state_changes_since(
+            hass, "sensor.test", middle
+        )
+        assert [state.state for state in with_start_state] == ["2", "3"]
+        assert with_start_state[0].last_changed == middle
+
+        # State changes are followed without querying the database
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set("sensor.test", "4")
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set("sensor.test", "4", {"attr": "value"})
+        await hass.async_block_till_done()
+        states = await history.async_state_changes_since(
+            hass, "sensor.test", middle, include_start_time_state=False
+        )
+        assert [state.state for state in states] == ["3", "4"]
+        assert state_changes_mock.call_count == 1
+
+        # An earlier start time needs a new query
+        await history.async_state_changes_since(
+            hass, "sensor.test", start - timedelta(hours=1)
+        )
+        assert state_changes_mock.call_count == 2
+
+        # The window is dropped once nobody read it for a while
+        freezer.tick(timedelta(seconds=WINDOW_LINGER + 1))
+        async_fire_time_changed(hass)
+        await history.async_state_changes_since(hass, "sensor.test", middle)
+        assert state_changes_mock.call_count == 3
+
+
+async def test_async_state_changes_since_without_attributes_and_end(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test reading state changes without attributes up to an end time."""
+    start = dt_util.utcnow()
+    for value in ("1", "2", "3"):
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set("sensor.test", value, {"attr": value})
+    await async_wait_recording_done(hass)
+    recorded = history.state_changes_during_period(hass, start, None, "sensor.test")[
+        "sensor.test"
+    ]
+    end = recorded[2].last_changed
+
+    real_state_changes_during_period = history.state_changes_during_period
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        side_effect=real_state_changes_during_period,
+    ) as state_changes_mock:
+        states = await history.async_state_changes_since(
+            hass, "sensor.test", start, end_time=end, no_attributes=True
+        )
+        # The end is excluded, the same as state_changes_during_period
+        assert [state.state for state in states] == ["1", "2"]
+        assert all(not state.attributes for state in states)
+        assert state_changes_mock.call_args.kwargs["no_attributes"] is True
+
+        # Followed state changes are kept without attributes as well
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set("sensor.test", "4", {"attr": "4"})
+        await hass.async_block_till_done()
+        states = await history.async_state_changes_since(
+            hass, "sensor.test", end, include_start_time_state=False, no_attributes=True
+        )
+        assert [state.state for state in states] == ["4"]
+        assert not states[0].attributes
+        assert state_changes_mock.call_count == 1
+
+        # Readers that need the attributes have their own window, which
+        # readers without attributes share once it covers their start
+        states = await history.async_state_changes_since(hass, "sensor.test", start)
+        assert [state.attributes["attr"] for state in states] == ["1", "2", "3", "4"]
+        assert state_changes_mock.call_count == 2
+        await history.async_state_changes_since(
+            hass, "sensor.test", end, no_attributes=True
+        )
+        assert state_changes_mock.call_count == 2
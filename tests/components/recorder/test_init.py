@@ -21,6 +21,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_WRITE,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -136,6 +137,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        bulk_write=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -1447,6 +1449,9 @@ async def test_compile_missing_statistics(
         await hass.async_stop()
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BULK_WRITE: False}, {CONF_BULK_WRITE: True}]
+)
 async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving sets old state."""
     hass.states.async_set("test.one", "s1", {})
@@ -1475,6 +1480,53 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_WRITE: True}])
+async def test_saving_state_bulk_write(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving states with bulk writes links old states and attributes."""
+    instance = recorder.get_instance(hass)
+    assert instance._bulk_write_states is True
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.one", "s2", {"attr": 1})
+    hass.states.async_set("test.two", "s3", {"attr": 2})
+    hass.states.async_set("test.one", "s4", {"attr": 3})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {"attr": 3})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s3"].state_id
+
+        assert json_loads(states_by_state["s2"].shared_attrs) == {"attr": 1}
+        assert json_loads(states_by_state["s3"].shared_attrs) == {"attr": 2}
+        assert json_loads(states_by_state["s5"].shared_attrs) == {"attr": 3}
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
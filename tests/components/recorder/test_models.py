@@ -14,12 +14,14 @@ from homeassistant.components.recorder.db_schema import (
     States,
 )
 from homeassistant.components.recorder.models import (
+    CompressedStateColumns,
     LazyState,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
@@ -420,3 +422,33 @@ async def test_lazy_state_handles_different_last_reported(
     assert lstate.last_changed_timestamp == row.last_changed_ts
     assert lstate.last_updated_timestamp == row.last_updated_ts
     assert lstate.last_reported_timestamp == row.last_reported_ts
+
+
+async def test_compressed_state_columns_downsample() -> None:
+    """Test compressed state columns downsample to max_points."""
+    columns = CompressedStateColumns()
+    first_row = PropertyMock(attributes='{"unit":"W"}', last_changed_ts=0.5)
+    columns.append_row(first_row, {}, None, "5", 1.0, False)
+    for ts, value in enumerate([1, 9, 4, 3, 7, 2, 8, 6, 0, 5, 4, "unknown", 3], 2):
+        columns.append(str(value), float(ts))
+
+    assert columns.downsample(14) is columns
+    downsampled = columns.downsample(4)
+    assert [state["s"] for state in downsampled] == [
+        "5",
+        "1",
+        "9",
+        "8",
+        "0",
+        "unknown",
+        "3",
+    ]
+    assert downsampled[0] == {"s": "5", "a": {"unit": "W"}, "lu": 1.0, "lc": 0.5}
+    assert downsampled[-1] == {"s": "3", "lu": 14.0}
+    assert json_loads(json_bytes(downsampled)) == list(downsampled)
+
+    # All states at the same time are in one bucket
+    columns = CompressedStateColumns()
+    for value in range(10):
+        columns.append(str(value), 1.0)
+    assert [state["s"] for state in columns.downsample(2)] == ["0", "1", "8", "9"]
@@ -49,6 +49,8 @@ from homeassistant.components.sensor.recorder import (
     MEAN_TYPE_CHANGED_ISSUE,
     STATE_CLASS_REMOVED_ISSUE,
     UNITS_CHANGED_ISSUE,
+    _time_weighted_arithmetic_mean,
+    _time_weighted_arithmetic_mean_min_max,
 )
 from homeassistant.const import ATTR_FRIENDLY_NAME, DEGREE, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
@@ -328,6 +330,74 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize("numpy_available", [True, False])
+async def test_compile_hourly_statistics_numpy_fallback(
+    hass: HomeAssistant, numpy_available: bool
+) -> None:
+    """Test compiling statistics gives the same result with and without numpy."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+        await async_record_states(
+            hass, freezer, zero, "sensor.test2", attributes, seq=[5, 15, 25]
+        )
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.NUMPY_AVAILABLE", numpy_available
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert {
+        statistic_id: (rows[0]["mean"], rows[0]["min"], rows[0]["max"])
+        for statistic_id, rows in stats.items()
+    } == {
+        "sensor.test1": (pytest.approx(13.050847), -10, 30),
+        "sensor.test2": (pytest.approx(14.830508), 5, 25),
+    }
+
+
+def test_time_weighted_arithmetic_mean_min_max() -> None:
+    """Test the vectorized statistics match the statistics of each sensor."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    end = start + timedelta(minutes=5)
+    fstates_list = [
+        # State from before the period
+        [(1.5, State("sensor.a", "1.5", last_updated=start - timedelta(hours=1)))],
+        [
+            (-3.0, State("sensor.b", "-3", last_updated=start - timedelta(seconds=1))),
+            (7.0, State("sensor.b", "7", last_updated=start + timedelta(seconds=30))),
+            (
+                2.25,
+                State("sensor.b", "2.25", last_updated=start + timedelta(minutes=4)),
+            ),
+        ],
+        # No state at the start of the period
+        [
+            (10.0, State("sensor.c", "10", last_updated=start + timedelta(minutes=1))),
+            (0.5, State("sensor.c", "0.5", last_updated=start + timedelta(minutes=2))),
+        ],
+    ]
+
+    means, mins, maxs = _time_weighted_arithmetic_mean_min_max(fstates_list, start, end)
+
+    assert means == [
+        pytest.approx(_time_weighted_arithmetic_mean(fstates, start, end))
+        for fstates in fstates_list
+    ]
+    assert mins == [min(fstate for fstate, _ in fstates) for fstates in fstates_list]
+    assert maxs == [max(fstate for fstate, _ in fstates) for fstates in fstates_list]
+
+
 async def test_compile_hourly_statistics_angle(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -0,0 +1,51 @@
+"""Test the incremental aggregators of the statistics sensor."""
+
+from __future__ import annotations
+
+from collections import deque
+import random
+
+import pytest
+
+from homeassistant.components.statistics.sensor import (
+    STATS_NUMERIC_INCREMENTAL,
+    STATS_NUMERIC_SUPPORT,
+)
+
+
+@pytest.mark.parametrize("characteristic", sorted(STATS_NUMERIC_INCREMENTAL))
+@pytest.mark.parametrize("percentile", [1, 50, 99])
+def test_aggregators_match_characteristic_functions(
+    characteristic: str, percentile: int
+) -> None:
+    """Test the aggregators match the functions over the whole buffer."""
+    rng = random.Random(characteristic)
+    aggregator = STATS_NUMERIC_INCREMENTAL[characteristic]()
+    stat_fn = STATS_NUMERIC_SUPPORT[characteristic]
+    states: deque[bool | float] = deque()
+    ages: deque[float] = deque()
+
+    assert aggregator.result(ages, percentile) is None
+
+    for idx in range(500):
+        # Grow and shrink the buffer, with duplicate values
+        if states and (len(states) > 40 or rng.random() < 0.3):
+            aggregator.remove(states.popleft())
+            ages.popleft()
+        else:
+            value = float(rng.randint(-20, 20)) / rng.choice((1, 4))
+            aggregator.add(value)
+            states.append(value)
+            ages.append(float(idx))
+
+        expected = stat_fn(states, ages, percentile)
+        result = aggregator.result(ages, percentile)
+        if isinstance(expected, float):
+            assert result == pytest.approx(expected, abs=1e-9)
+        else:
+            assert result == expected
+
+    while states:
+        aggregator.remove(states.popleft())
+        ages.popleft()
+    assert aggregator.result(ages, percentile) is None
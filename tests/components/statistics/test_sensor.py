@@ -1771,9 +1771,10 @@ async def test_update_before_load(recorder_mock: Recorder, hass: HomeAssistant)
                     ]
                 },
             )
-            # adding this value is going to be ignored, since loading from the database hasn't finished yet
+            # this value is not added to the queue directly, since loading from the database hasn't finished yet
             # if this value would be added before loading from the database is done
             # it would mess up the order of the internal queue which is supposed to be sorted by time
+            # the shared history window keeps it and returns it after the recorded values instead
             await state_changes_during_period_called_evt.wait()
             hass.states.async_set(
                 "sensor.test_monitored",
@@ -1783,9 +1784,10 @@ async def test_update_before_load(recorder_mock: Recorder, hass: HomeAssistant)
             state_changes_during_period_stall_evt.set()
             await hass.async_block_till_done()
 
-    # we will end up with a buffer of [1 .. 9] (10 wasn't added)
-    # so the computed average_step is 1+2+3+4+5+6+7+8/8 = 4.5
-    assert float(hass.states.get("sensor.test").state) == pytest.approx(4.5)
+    # we will end up with a buffer of [1 .. 10] (10 was added 1s after 9)
+    # average_step weights each value by the time until the next value, so 10
+    # has no weight yet and the computed average_step is (1+2+...+9)/9 = 5.0
+    assert float(hass.states.get("sensor.test").state) == pytest.approx(5.0)
 
 
 @pytest.mark.parametrize("force_update", [True, False])
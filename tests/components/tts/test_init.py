@@ -22,7 +22,11 @@ from homeassistant.components.media_player import (
     MediaType,
 )
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import ATTR_ENTITY_ID, STATE_UNKNOWN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
@@ -2037,6 +2041,86 @@ async def test_tts_cache() -> None:
         assert await consume_pre_data_loaded_task == b"012"
 
 
+async def test_tiered_cache(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_ws_client: WebSocketGenerator,
+    hass_storage: dict[str, Any],
+    mock_tts_cache_dir: Path,
+    mock_tts_entity: MockTTSEntity,
+) -> None:
+    """Test results are served from the file cache and evicted when it is full."""
+    door_file = mock_tts_cache_dir / (
+        "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    )
+    await hass.async_add_executor_job(door_file.write_bytes, MOCK_DATA)
+    hass_storage[tts.FILE_CACHE_INDEX_STORAGE_KEY] = {
+        "version": tts.FILE_CACHE_INDEX_STORAGE_VERSION,
+        "key": tts.FILE_CACHE_INDEX_STORAGE_KEY,
+        "data": {"files": {door_file.name: [len(MOCK_DATA), 0]}},
+    }
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.file_cache_size == len(MOCK_DATA)
+
+    # Served from the file cache without loading it into memory
+    stream = tts.async_create_stream(hass, mock_tts_entity.entity_id)
+    stream.async_set_message("There is someone at the door.")
+    client = await hass_client()
+    req = await client.get(stream.url)
+    assert req.status == HTTPStatus.OK
+    assert req.content_type == "audio/mpeg"
+    assert await req.read() == MOCK_DATA
+    assert sum(cache.size for cache in manager.mem_cache.values()) == 0
+
+    # Loaded into memory when streamed
+    result_data = b"".join([chunk async for chunk in stream.async_stream_result()])
+    assert result_data == MOCK_DATA
+    assert sum(cache.size for cache in manager.mem_cache.values()) == len(MOCK_DATA)
+
+    with (
+        patch.object(tts, "FILE_CACHE_MAX_SIZE", len(MOCK_DATA)),
+        patch.object(tts, "MEMORY_CACHE_MAX_SIZE", len(MOCK_DATA)),
+    ):
+        stream = tts.async_create_stream(hass, mock_tts_entity.entity_id)
+        stream.async_set_message("Hello world")
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # The least recently used result was evicted from both tiers
+    assert not door_file.exists()
+    assert len(manager.file_cache) == 1
+    assert list(manager.mem_cache.values())[0].file_path == str(
+        mock_tts_cache_dir / next(iter(manager.file_cache.values()))
+    )
+    req = await client.get(stream.url)
+    assert await req.read() == MOCK_DATA
+
+    ws_client = await hass_ws_client()
+    await ws_client.send_json_auto_id({"type": "tts/cache/info"})
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] | {"memory_max_size": 0, "file_max_size": 0} == {
+        "memory_entries": 1,
+        "memory_size": len(MOCK_DATA),
+        "memory_max_size": 0,
+        "file_entries": 1,
+        "file_size": len(MOCK_DATA),
+        "file_max_size": 0,
+        "memory_hits": 0,
+        "file_hits": 1,
+        "misses": 1,
+        "memory_evictions": 1,
+        "file_evictions": 1,
+    }
+
+    # The index is stored
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert list(hass_storage[tts.FILE_CACHE_INDEX_STORAGE_KEY]["data"]["files"]) == [
+        *manager.file_cache.values()
+    ]
+
+
 async def test_async_internal_get_tts_audio_called(
     hass: HomeAssistant,
     mock_tts_entity: MockTTSEntity,
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import io
 import logging
 from typing import Any
@@ -22,6 +23,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.commands import (
+    ALL_COMPRESSED_STATES_JSON_CACHE,
     ALL_CONDITION_DESCRIPTIONS_JSON_CACHE,
     ALL_SERVICE_DESCRIPTIONS_JSON_CACHE,
     ALL_TRIGGER_DESCRIPTIONS_JSON_CACHE,
@@ -36,6 +38,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import Integration, async_get_integration
 from homeassistant.setup import async_set_domains_to_be_loaded, async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 from homeassistant.util.yaml.loader import JSON_TYPE, parse_yaml
 
@@ -45,6 +48,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_integration,
     mock_platform,
@@ -1264,6 +1268,88 @@ async def test_subscribe_entities_with_unserializable_state(
     }
 
 
+async def test_subscribe_entities_conflate(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities only sends the latest change once per window."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+    hass.states.async_set("light.hall", "on")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "conflate": 1}
+    )
+    msg = await websocket_client.receive_json()
+    subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hall"}
+
+    hass.states.async_set("light.kitchen", "on", {"color": "red"})
+    hass.states.async_set("light.kitchen", "off", {"color": "blue"})
+    hass.states.async_set("light.kitchen", "on", {"color": "green"})
+    # Added and removed in the same window
+    hass.states.async_set("light.garage", "on")
+    hass.states.async_remove("light.garage")
+    hass.states.async_remove("light.hall")
+    hass.states.async_set("light.porch", "off")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+        "r": ["light.hall"],
+        "a": {"light.porch": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+    }
+
+    hass.states.async_set("light.kitchen", "off", {"color": "green"})
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
+async def test_subscribe_entities_shares_initial_states(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribers share the initial states until a state changes."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"] == {
+        "light.kitchen": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "off"}
+    }
+    version, payload = hass.data[ALL_COMPRESSED_STATES_JSON_CACHE]
+    assert version == hass.states.version
+
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen"}
+    assert hass.data[ALL_COMPRESSED_STATES_JSON_CACHE][1] is payload
+
+    hass.states.async_set("light.hall", "on")
+    # The changes are sent to the existing subscribers
+    await websocket_client.receive_json()
+    await websocket_client.receive_json()
+
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hall"}
+    assert hass.data[ALL_COMPRESSED_STATES_JSON_CACHE][0] > version
+
+
 async def test_subscribe_unsubscribe_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
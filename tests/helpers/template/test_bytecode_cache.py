@@ -0,0 +1,140 @@
+"""Test the template bytecode cache."""
+
+from __future__ import annotations
+
+import marshal
+from pathlib import Path
+from unittest.mock import patch
+
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+import pytest
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import template
+from homeassistant.helpers.template import bytecode_cache as bytecode_cache_module
+from homeassistant.helpers.template.bytecode_cache import (
+    CACHE_VERSION,
+    STORAGE_KEY,
+    TemplateBytecodeCache,
+    get_bytecode_cache,
+)
+
+
+@pytest.fixture
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Use a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+async def test_compile_uses_bytecode_cache(hass: HomeAssistant) -> None:
+    """Test templates are only compiled once for the same source."""
+    bytecode_cache = get_bytecode_cache(hass)
+    source = "{{ 1 + 1 }}"
+
+    assert template.Template(source, hass).async_render() == 2
+    key = TemplateBytecodeCache.key(source, False)
+    assert bytecode_cache.get(key) is not None
+    assert bytecode_cache.get(TemplateBytecodeCache.key(source, True)) is None
+
+    # The weak template cache is empty in a new environment
+    env = template.TemplateEnvironment(hass)
+    with patch.object(
+        ImmutableSandboxedEnvironment, "compile", side_effect=AssertionError
+    ):
+        code = env.compile(source)
+    assert code.co_filename == "<template>"
+
+
+async def test_save_and_load(hass: HomeAssistant, config_dir: Path) -> None:
+    """Test the cache is saved after start and loaded on the next start."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load(hass)
+    env = template.TemplateEnvironment(hass)
+    env.template_bytecode_cache = bytecode_cache
+    env.compile("{{ 'first' }}")
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    path = config_dir / ".storage" / STORAGE_KEY
+    assert path.exists()
+
+    next_cache = TemplateBytecodeCache(hass)
+    await next_cache.async_load(hass)
+    first_key = TemplateBytecodeCache.key("{{ 'first' }}", False)
+    assert next_cache.get(first_key) is not None
+
+    # Unused code is dropped on shutdown
+    next_env = template.TemplateEnvironment(hass)
+    next_env.template_bytecode_cache = next_cache
+    next_env.compile("{{ 'second' }}")
+    next_cache._used.pop(first_key)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    data = marshal.loads(path.read_bytes())
+    assert data["version"] == CACHE_VERSION
+    assert list(data["entries"]) == [TemplateBytecodeCache.key("{{ 'second' }}", False)]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"not marshal",
+        marshal.dumps({"version": "old", "entries": {"key": b""}}),
+        marshal.dumps({"version": CACHE_VERSION, "entries": ["key"]}),
+        marshal.dumps(["key"]),
+    ],
+)
+async def test_load_invalid_cache(
+    hass: HomeAssistant, config_dir: Path, data: bytes
+) -> None:
+    """Test an invalid or outdated cache is ignored."""
+    (config_dir / ".storage").mkdir()
+    (config_dir / ".storage" / STORAGE_KEY).write_bytes(data)
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load(hass)
+    assert bytecode_cache.get("key") is None
+
+
+async def test_invalid_code_is_ignored(hass: HomeAssistant, config_dir: Path) -> None:
+    """Test entries that are not code are ignored."""
+    (config_dir / ".storage").mkdir()
+    (config_dir / ".storage" / STORAGE_KEY).write_bytes(
+        marshal.dumps(
+            {
+                "version": CACHE_VERSION,
+                "entries": {"not_code": marshal.dumps("text"), "broken": b"\x00"},
+            }
+        )
+    )
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load(hass)
+    assert bytecode_cache.get("not_code") is None
+    assert bytecode_cache.get("broken") is None
+
+
+async def test_least_recently_used_code_is_dropped(
+    hass: HomeAssistant, config_dir: Path
+) -> None:
+    """Test the cache keeps at most MAX_ENTRIES entries."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load(hass)
+    code = compile("1", "<template>", "eval")
+    with patch.object(bytecode_cache_module, "MAX_ENTRIES", 2):
+        bytecode_cache.set("first", code)
+        bytecode_cache.set("second", code)
+        assert bytecode_cache.get("first") is not None
+        bytecode_cache.set("third", code)
+        assert bytecode_cache.get("second") is None
+        assert bytecode_cache.get("first") is not None
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    data = marshal.loads((config_dir / ".storage" / STORAGE_KEY).read_bytes())
+    assert list(data["entries"]) == ["third", "first"]
@@ -194,3 +194,30 @@ def test_render_info_context_var(hass: HomeAssistant) -> None:
     # Reset for other tests
     render_info_cv.set(None)
     assert render_info_cv.get() is None
+
+
+@pytest.mark.parametrize(
+    ("template_str", "entities_state_only"),
+    [
+        ("{{ states('sensor.a') }}", {"sensor.a"}),
+        ("{{ is_state('sensor.a', 'on') }}", {"sensor.a"}),
+        ("{{ states.sensor.a.state }}", {"sensor.a"}),
+        ("{{ states.sensor.a['state'] }}", {"sensor.a"}),
+        ("{{ state_attr('sensor.a', 'unit') }}", set()),
+        ("{{ states.sensor.a.last_changed }}", set()),
+        ("{{ states('sensor.a', with_unit=True) }}", set()),
+        ("{{ states('sensor.a') }}{{ states.sensor.a.attributes }}", set()),
+        ("{{ states('sensor.a') }}{{ state_attr('sensor.b', 'unit') }}", {"sensor.a"}),
+    ],
+)
+def test_render_info_entities_state_only(
+    hass: HomeAssistant, template_str: str, entities_state_only: set[str]
+) -> None:
+    """Test RenderInfo collects the entities of which only the state was read."""
+    hass.states.async_set("sensor.a", "1", {"unit": "W"})
+    hass.states.async_set("sensor.b", "2", {"unit": "W"})
+    info = template.Template(template_str, hass).async_render_to_info()
+
+    assert info.entities_state_only == entities_state_only
+    assert info.entities_state_only <= info.entities
+    assert "sensor.a" in info.entities
@@ -1757,6 +1757,58 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_state_only(hass: HomeAssistant) -> None:
+    """Test templates that only read the state skip attribute changes."""
+    runs = []
+    hass.states.async_set("sensor.power", "off", {"friendly_name": "Power"})
+    hass.states.async_set("sensor.energy", "1", {"unit_of_measurement": "kWh"})
+    template_state = Template("{{ states('sensor.power') }}", hass)
+    template_attribute = Template(
+        "{{ state_attr('sensor.energy', 'unit_of_measurement') }}", hass
+    )
+
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(update.result for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_state, None), TrackTemplate(template_attribute, None)],
+        specific_run_callback,
+    )
+    await hass.async_block_till_done()
+    assert info.render_count == 0
+    assert info.skipped_render_count == 0
+
+    # Only the attributes changed, the state template is skipped
+    hass.states.async_set("sensor.power", "off", {"friendly_name": "Pump"})
+    await hass.async_block_till_done()
+    assert runs == []
+    assert info.render_count == 0
+    assert info.skipped_render_count == 2
+
+    hass.states.async_set("sensor.power", "on", {"friendly_name": "Pump"})
+    await hass.async_block_till_done()
+    assert runs == ["on"]
+    assert info.render_count == 1
+    assert info.skipped_render_count == 3
+
+    # The attribute template re-renders when only the attributes change
+    hass.states.async_set("sensor.energy", "1", {"unit_of_measurement": "MWh"})
+    await hass.async_block_till_done()
+    assert runs == ["on", "MWh"]
+    assert info.render_count == 2
+    assert info.skipped_render_count == 4
+
+    # Removing the entity always re-renders
+    hass.states.async_remove("sensor.power")
+    await hass.async_block_till_done()
+    assert runs == ["on", "MWh", "unknown"]
+    assert info.render_count == 3
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
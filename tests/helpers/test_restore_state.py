@@ -15,6 +15,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STORAGE_JOURNAL_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -375,6 +376,67 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the changed states are dumped to the journal."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for entity_id in ("input_boolean.b1", "input_boolean.b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert [
+        item["state"]["entity_id"] for item in hass_storage[STORAGE_KEY]["data"]
+    ] == ["input_boolean.b1", "input_boolean.b2"]
+    assert hass_storage[STORAGE_JOURNAL_KEY]["data"]["states"] == []
+
+    hass.states.async_set("input_boolean.b1", "off")
+    with patch.object(data.store, "async_save") as mock_write_data:
+        await data.async_dump_changed_states(compact=False)
+        await data.async_dump_changed_states(compact=False)
+
+    # The full dump is not written
+    assert not mock_write_data.called
+    journal = json_round_trip(hass_storage[STORAGE_JOURNAL_KEY]["data"])
+    assert [item["state"]["state"] for item in journal["states"]] == ["off"]
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "on",
+        "on",
+    ]
+
+    # The journal is applied on top of the full dump
+    await data.async_load()
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+    assert data.last_states["input_boolean.b2"].last_seen == dt_util.parse_datetime(
+        journal["dumped"]
+    )
+
+    # Compacted once the journal holds half of the states
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_changed_states()
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "off",
+        "off",
+    ]
+    assert hass_storage[STORAGE_JOURNAL_KEY]["data"]["states"] == []
+
+    # A journal older than the full dump is ignored
+    hass_storage[STORAGE_JOURNAL_KEY]["data"] = journal | {
+        "states": [
+            journal["states"][0]
+            | {"state": {**journal["states"][0]["state"], "state": "stale"}}
+        ]
+    }
+    await data.async_load()
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
@@ -18,6 +18,7 @@ from homeassistant.const import (
     BASE_PLATFORMS,
     CONF_DEBUG,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
@@ -221,6 +222,26 @@ async def test_setting_up_config(hass: HomeAssistant) -> None:
     assert "group" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_startup_timings_are_stored(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the import and setup times are stored after startup."""
+    await bootstrap._async_set_up_integrations(
+        hass, {"group hello": {}, "homeassistant": {}}
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    data = hass_storage[bootstrap.STARTUP_TIMINGS_STORAGE_KEY]["data"]
+    assert data["version"] == __version__
+    assert set(data["integrations"]["group"]) == {"import", "setup"}
+    totals = [
+        timings["import"] + timings["setup"]
+        for timings in data["integrations"].values()
+    ]
+    assert totals == sorted(totals, reverse=True)
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_all_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when all present."""
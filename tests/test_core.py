@@ -1181,6 +1181,101 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_entities_listener(hass: HomeAssistant) -> None:
+    """Test listeners for entity_ids and domains are dispatched by key."""
+    entity_calls = []
+    domain_calls = []
+    both_calls = []
+    filtered_calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    def _listener(calls):
+        """Return a callback listener so events are received in order."""
+        return ha.callback(lambda event: calls.append(event))
+
+    unsubs = [
+        hass.bus.async_listen_entities(
+            "test", _listener(entity_calls), entity_ids=["light.kitchen", "switch.fan"]
+        ),
+        hass.bus.async_listen_entities(
+            "test", _listener(domain_calls), domains=["light"]
+        ),
+        hass.bus.async_listen_entities(
+            "test",
+            _listener(both_calls),
+            entity_ids=["light.kitchen"],
+            domains=["light"],
+        ),
+        hass.bus.async_listen_entities(
+            "test",
+            _listener(filtered_calls),
+            entity_ids=["light.kitchen"],
+            event_filter=mock_filter,
+        ),
+    ]
+    assert hass.bus.async_listeners()["test"] == old_count + 4
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": "switch.fan"})
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == [
+        "light.kitchen",
+        "light.kitchen",
+        "switch.fan",
+    ]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "light.kitchen",
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    assert [event.data["entity_id"] for event in both_calls] == [
+        "light.kitchen",
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    assert [event.data for event in filtered_calls] == [{"entity_id": "light.kitchen"}]
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 3
+
+    # Should do nothing now
+    unsubs[0]()
+
+
+async def test_eventbus_entities_listener_requires_keys(hass: HomeAssistant) -> None:
+    """Test listening for entities requires an event type, entity_ids or domains."""
+    with pytest.raises(HomeAssistantError, match="require entity_ids or domains"):
+        hass.bus.async_listen_entities("test", lambda event: None)
+    with pytest.raises(HomeAssistantError, match="require an event type"):
+        hass.bus.async_listen_entities(
+            MATCH_ALL, lambda event: None, entity_ids=["light.kitchen"]
+        )
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_entities(
+            "test",
+            lambda event: None,
+            entity_ids=["light.kitchen"],
+            event_filter=lambda event_data: True,
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1533,6 +1628,70 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test snapshots are shared until the states change."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+
+    snapshot = hass.states.async_snapshot()
+    assert hass.states.async_snapshot() is snapshot
+    assert await hass.async_add_executor_job(hass.states.snapshot) is snapshot
+    assert dict(snapshot) == {
+        "light.bowl": hass.states.get("light.bowl"),
+        "switch.ac": hass.states.get("switch.ac"),
+    }
+    assert snapshot.domain_states("light") == (hass.states.get("light.bowl"),)
+    assert snapshot.domain_states("sensor") == ()
+
+    # Reporting the same state does not change the snapshot
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.async_snapshot() is snapshot
+
+    hass.states.async_set("light.bowl", "off")
+    assert hass.states.version > snapshot.version
+    new_snapshot = await hass.async_add_executor_job(hass.states.snapshot)
+    assert new_snapshot is not snapshot
+    assert new_snapshot.version == hass.states.version
+    assert new_snapshot.version > snapshot.version
+    assert new_snapshot["light.bowl"].state == "off"
+    # The old snapshot is not changed
+    assert snapshot["light.bowl"].state == "on"
+
+    assert hass.states.async_remove("switch.ac")
+    removed_snapshot = hass.states.async_snapshot()
+    assert removed_snapshot.version > new_snapshot.version
+    assert "switch.ac" not in removed_snapshot
+    assert "switch.ac" in new_snapshot
+
+
+async def test_statemachine_snapshot_copy_on_write(hass: HomeAssistant) -> None:
+    """Test changes do not leak into snapshots sharing the same buckets."""
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.test_{idx}", "0")
+
+    snapshot = hass.states.async_snapshot()
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.test_{idx}", "1")
+    hass.states.async_set("sensor.new", "1")
+    hass.states.async_remove("sensor.test_0")
+
+    assert len(snapshot) == 1000
+    assert len(list(snapshot)) == 1000
+    assert "sensor.new" not in snapshot
+    assert {state.state for state in snapshot.values()} == {"0"}
+    assert len(snapshot.domain_states("sensor")) == 1000
+
+    new_snapshot = hass.states.async_snapshot()
+    assert len(new_snapshot) == 1000
+    assert "sensor.test_0" not in new_snapshot
+    assert {state.state for state in new_snapshot.values()} == {"1"}
+
+    # Entities keep the order in which they were added
+    assert list(new_snapshot)[:2] == ["sensor.test_1", "sensor.test_2"]
+    assert list(new_snapshot)[-1] == "sensor.new"
+    assert list(new_snapshot) == hass.states.async_entity_ids()
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -2023,3 +2023,93 @@ async def test_async_get_integrations_multiple_non_existent(
     ):
         integrations = await loader.async_get_integrations(hass, ["does_not_exist"])
     assert integrations["does_not_exist"] is integration
+
+
+async def test_async_prefetch_components(hass: HomeAssistant) -> None:
+    """Verify components are imported in parallel by dependency level."""
+    base = _get_test_integration(hass, "prefetch_base", False, import_executor=True)
+    other = _get_test_integration(hass, "prefetch_other", False, import_executor=True)
+    child = _get_test_integration(hass, "prefetch_child", False, import_executor=True)
+    in_loop = _get_test_integration(hass, "prefetch_loop", False)
+    base._all_dependencies = set()
+    other._all_dependencies = set()
+    child._all_dependencies = {"prefetch_base"}
+    in_loop._all_dependencies = set()
+    imports: list[tuple[str, str]] = []
+    modules = {
+        itg.pkg_path: MagicMock(__file__="__init__.py")
+        for itg in (base, other, child, in_loop)
+    }
+    both_started = threading.Barrier(2, timeout=5)
+
+    def import_module(name: str) -> Any:
+        imports.append((name, threading.current_thread().name))
+        if name in (base.pkg_path, other.pkg_path):
+            # The integrations without dependencies are imported at the same time
+            both_started.wait()
+        if name in modules:
+            return modules[name]
+        raise ImportError
+
+    with patch("homeassistant.loader.importlib.import_module", import_module):
+        await loader.async_prefetch_components(hass, [child, in_loop, other, base])
+
+    imported = [name for name, _ in imports if name in modules]
+    assert sorted(imported[:2]) == sorted([base.pkg_path, other.pkg_path])
+    assert imported[2:] == [child.pkg_path]
+    assert all(
+        thread.startswith("ImportPrefetch")
+        for name, thread in imports
+        if name in modules
+    )
+    # The prefetch threads are gone once the components are imported
+    assert not any(
+        thread.name.startswith("ImportPrefetch") for thread in threading.enumerate()
+    )
+    assert await child.async_get_component() is modules[child.pkg_path]
+    assert set(loader.async_get_import_timings(hass)) == {
+        "prefetch_base",
+        "prefetch_other",
+        "prefetch_child",
+    }
+
+
+async def test_async_prefetch_component_failure_is_retried(
+    hass: HomeAssistant,
+) -> None:
+    """Verify a failed prefetch does not fail the import during setup."""
+    integration = _get_test_integration(
+        hass, "prefetch_fails", False, import_executor=True
+    )
+    integration._all_dependencies = set()
+    module = MagicMock(__file__="__init__.py")
+    imports: list[str] = []
+    prefetch_started = threading.Event()
+    finish_prefetch = threading.Event()
+
+    def import_module(name: str) -> Any:
+        if name != integration.pkg_path:
+            raise ImportError
+        imports.append(threading.current_thread().name)
+        if len(imports) == 1:
+            prefetch_started.set()
+            finish_prefetch.wait(5)
+            # Same as importlib's _DeadlockError
+            raise RuntimeError("deadlock detected")
+        return module
+
+    with patch("homeassistant.loader.importlib.import_module", import_module):
+        prefetch = hass.async_create_task(
+            loader.async_prefetch_components(hass, [integration])
+        )
+        await hass.async_add_executor_job(prefetch_started.wait, 5)
+        get_component = hass.async_create_task(integration.async_get_component())
+        await asyncio.sleep(0)
+        assert not get_component.done()
+        finish_prefetch.set()
+        await prefetch
+        assert await get_component is module
+
+    assert len(imports) == 2
+    assert imports[0].startswith("ImportPrefetch")
+    assert imports[1].startswith("ImportExecutor")